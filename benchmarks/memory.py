@@ -0,0 +1,90 @@
+"""Memory usage of the parsed header and block objects
+
+Run with ``python -m benchmarks.memory``. The first block and the header of
+``tests/test_files/aes_staib.vms`` are copied many times with
+:func:`dataclasses.replace`. Every copy gets its own records and lists, but
+shares strings and numbers, as blocks inheriting parameters from the first
+block do. So the traced memory per copy is the overhead of the objects
+themselves. The y-values are left out, they are stored in one buffer per
+corresponding variable and counted by :mod:`benchmarks.run`.
+
+Recorded on CPython 3.11 with 10,000 copies, for the block with one
+corresponding variable and four additional numerical parameters:
+
+==========  ===========================  ================================
+Object      Plain dataclasses and lists  Slotted dataclasses, IncludeMask
+==========  ===========================  ================================
+Block       2402 B                       1057 B (-56%)
+Header      712 B                        328 B (-54%)
+==========  ===========================  ================================
+"""
+
+import argparse
+import sys
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from vamas import Vamas
+from vamas.vamas_block import VamasBlock
+from vamas.vamas_header import VamasHeader
+
+TESTFILE = (
+    Path(__file__).parent.parent / "tests" / "test_files" / "aes_staib.vms"
+)
+
+
+def copy_block(block: VamasBlock) -> VamasBlock:
+    return replace(
+        block,
+        corresponding_variables=[
+            replace(c, y_values=c.y_values[:0])
+            for c in block.corresponding_variables
+        ],
+        additional_numerical_params=[
+            replace(p) for p in block.additional_numerical_params
+        ],
+    )
+
+
+def copy_header(header: VamasHeader) -> VamasHeader:
+    includes = header.block_params_includes
+    return replace(
+        header,
+        experiment_variables=[
+            replace(e) for e in header.experiment_variables or ()
+        ],
+        block_params_includes=type(includes)(includes),
+    )
+
+
+def size_per_copy(copy: Callable[[Any], Any], obj: Any, copies: int) -> float:
+    """Traced memory in bytes allocated per copy of `obj`"""
+    tracemalloc.start()
+    try:
+        kept = [copy(obj) for _ in range(copies)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return size / copies
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--copies", type=int, default=10_000)
+    parser.add_argument("--file", type=Path, default=TESTFILE)
+    args = parser.parse_args(argv)
+
+    vms = Vamas(args.file)
+    block = copy_block(vms.blocks[0])
+    print(f"Block  {size_per_copy(copy_block, block, args.copies):8.0f} B")
+    print(
+        f"Header {size_per_copy(copy_header, vms.header, args.copies):8.0f} B"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
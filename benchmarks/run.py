@@ -0,0 +1,206 @@
+"""Parser benchmarks on synthetic vamas files
+
+Run with ``python -m benchmarks.run``. Every scenario generates a file with
+:mod:`benchmarks.synthetic` and measures, for every loader, the best parse
+time out of several repetitions as throughput in MB/s and blocks/s, and the
+peak memory allocated while parsing, traced by :mod:`tracemalloc`.
+
+Results can be saved with ``--save results.json`` and compared against a
+previous run with ``--compare results.json``, which exits with status 1 if
+any throughput dropped or peak memory grew by more than ``--threshold``.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from vamas import Vamas, iter_blocks, scan_metadata
+
+from .synthetic import write_synthetic
+
+SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "norm": dict(experiment_mode="NORM", num_blocks=100, num_values=2000),
+    "norm-large-blocks": dict(
+        experiment_mode="NORM", num_blocks=10, num_values=100_000
+    ),
+    "norm-many-blocks": dict(
+        experiment_mode="NORM", num_blocks=5000, num_values=50
+    ),
+    "norm-corresponding-variables": dict(
+        experiment_mode="NORM",
+        num_blocks=100,
+        num_values=1000,
+        num_corresponding_variables=4,
+    ),
+    "norm-excluded": dict(
+        experiment_mode="NORM",
+        num_blocks=5000,
+        num_values=50,
+        excluded=range(0, 40, 2),
+    ),
+    "map": dict(experiment_mode="MAP", num_blocks=1024, num_values=200),
+    "mapdp": dict(experiment_mode="MAPDP", num_blocks=200, num_values=1000),
+    "sdp": dict(experiment_mode="SDP", num_blocks=200, num_values=1000),
+    "sem": dict(experiment_mode="SEM", num_blocks=4, num_values=256 * 256),
+}
+
+LOADERS: Dict[str, Callable[[Path], Any]] = {
+    "Vamas": lambda path: Vamas(path),
+    "Vamas(use_mmap)": lambda path: Vamas(path, use_mmap=True),
+    "Vamas(lazy)": lambda path: Vamas(path, lazy=True),
+    "iter_blocks": lambda path: sum(1 for _ in iter_blocks(path)),
+    "scan_metadata": lambda path: scan_metadata(path),
+}
+
+
+def measure(
+    load: Callable[[Path], Any], path: Path, repeat: int
+) -> Dict[str, float]:
+    """Best parse time and peak traced memory of `load` on `path`"""
+    load(path)  # warm up the page cache
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(path)
+        best = min(best, time.perf_counter() - start)
+
+    # Traced separately, tracemalloc slows down allocations considerably
+    tracemalloc.start()
+    try:
+        load(path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": best, "peak_memory": float(peak)}
+
+
+def run(
+    scenarios: List[str], loaders: List[str], repeat: int, scale: float
+) -> List[Dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for scenario in scenarios:
+            params = dict(SCENARIOS[scenario])
+            params["num_blocks"] = max(1, int(params["num_blocks"] * scale))
+            path = write_synthetic(
+                Path(directory) / f"{scenario}.vms", **params
+            )
+            size = path.stat().st_size
+
+            for loader in loaders:
+                m = measure(LOADERS[loader], path, repeat)
+                results.append(
+                    {
+                        "scenario": scenario,
+                        "loader": loader,
+                        "size": size,
+                        "blocks": params["num_blocks"],
+                        "mb_per_s": size / m["seconds"] / 1e6,
+                        "blocks_per_s": params["num_blocks"] / m["seconds"],
+                        "peak_memory": m["peak_memory"],
+                    }
+                )
+                print_result(results[-1])
+    return results
+
+
+def print_result(r: Dict[str, Any]) -> None:
+    print(
+        f"{r['scenario']:<30} {r['loader']:<16} "
+        f"{r['size'] / 1e6:8.2f} MB {r['mb_per_s']:8.2f} MB/s "
+        f"{r['blocks_per_s']:10.0f} blocks/s "
+        f"{r['peak_memory'] / 1e6:8.2f} MB peak"
+    )
+
+
+def compare(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Descriptions of all regressions against `baseline`"""
+    previous = {(r["scenario"], r["loader"]): r for r in baseline}
+    regressions = []
+    for r in results:
+        old = previous.get((r["scenario"], r["loader"]))
+        if old is None:
+            continue
+        name = f"{r['scenario']} / {r['loader']}"
+        if r["mb_per_s"] < old["mb_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {old['mb_per_s']:.2f} -> "
+                f"{r['mb_per_s']:.2f} MB/s"
+            )
+        if r["peak_memory"] > old["peak_memory"] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak memory {old['peak_memory'] / 1e6:.2f} -> "
+                f"{r['peak_memory'] / 1e6:.2f} MB"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="scenario to run, may be repeated (default: all)",
+    )
+    parser.add_argument(
+        "-l",
+        "--loader",
+        action="append",
+        choices=list(LOADERS),
+        help="loader to measure, may be repeated (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="factor for the number of blocks of every scenario",
+    )
+    parser.add_argument("--save", type=Path, help="write results as JSON")
+    parser.add_argument(
+        "--compare", type=Path, help="JSON results of a previous run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative change counted as regression (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.scenario or list(SCENARIOS),
+        args.loader or list(LOADERS),
+        args.repeat,
+        args.scale,
+    )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""Generator for synthetic vamas files of arbitrary size
+
+The files are built as :class:`~vamas.Vamas` objects and serialized with
+:mod:`vamas.writer`, so they are valid by construction for every supported
+experiment mode and include mask.
+"""
+
+import math
+import random
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Union
+
+from vamas import Vamas
+from vamas.vamas_block import (
+    AdditionalNumericalParam,
+    CorrespondingVariable,
+    LinescanCoordinates,
+    SputteringSource,
+    VamasBlock,
+    YValues,
+)
+from vamas.vamas_header import (
+    NUM_BLOCK_PARAMS,
+    ExperimentVariable,
+    IncludeMask,
+    VamasHeader,
+)
+from vamas.writer import FORMAT_IDENTIFIER
+
+EXPERIMENT_MODES = ["NORM", "MAP", "MAPDP", "SDP", "SEM"]
+
+# Techniques which make the parser read the optional parameters of a mode
+_TECHNIQUES = {
+    "NORM": "XPS",
+    "MAP": "XPS",
+    "MAPDP": "AES diff",
+    "SDP": "AES dir",
+    "SEM": "AES dir",
+}
+
+
+def synthetic_vamas(
+    experiment_mode: str = "NORM",
+    num_blocks: int = 100,
+    num_values: int = 1000,
+    num_corresponding_variables: int = 1,
+    excluded: Iterable[int] = (),
+    seed: int = 0,
+) -> Vamas:
+    """Creates a synthetic vamas experiment
+
+    All block parameters are the same for every block, apart from the block
+    identifier, the map coordinates and the y-values, so any block parameter
+    can be excluded.
+
+    Args:
+        experiment_mode (str): One of :data:`EXPERIMENT_MODES`.
+        num_blocks (int): Number of blocks.
+        num_values (int): Number of y-values per corresponding variable.
+        num_corresponding_variables (int): Number of corresponding variables
+            per block.
+        excluded (Iterable[int]): Indices of the block parameters excluded by
+            the header, see :class:`~vamas.vamas_header.IncludeMask`.
+        seed (int): Seed for the random y-values.
+
+    Returns:
+        The experiment, which can be written with :meth:`Vamas.write`
+    """
+    if experiment_mode not in EXPERIMENT_MODES:
+        raise ValueError(f"Unsupported experiment mode {experiment_mode!r}")
+
+    excluded = sorted(set(excluded))
+    includes = [i not in excluded for i in range(NUM_BLOCK_PARAMS)]
+    num_x = math.ceil(math.sqrt(num_blocks))
+    num_y = max(math.ceil(num_blocks / num_x), 1)
+
+    header = VamasHeader(
+        format_identifier=FORMAT_IDENTIFIER,
+        institution_identifier="Synthetic",
+        instrument_model_identifier="Generator",
+        operator_identifier="benchmarks",
+        experiment_identifier=f"{experiment_mode} experiment",
+        num_lines_comment=1,
+        comment="Generated by benchmarks.synthetic",
+        experiment_mode=experiment_mode,
+        scan_mode="REGULAR",
+        num_experiment_variables=1,
+        num_entries_inclusion_exclusion=-len(excluded),
+        block_params_includes=IncludeMask.from_bools(includes),
+        num_manually_entered_items_in_block=0,
+        num_future_upgrade_experiment_entries=0,
+        num_future_upgrade_block_entries=0,
+        num_blocks=num_blocks,
+        experiment_variables=[ExperimentVariable("Etch time", "s")],
+        future_upgrade_experiment_entries=[],
+    )
+    if experiment_mode in ["MAP", "NORM", "SDP"]:
+        header.num_spectral_regions = 1
+    if experiment_mode == "MAP":
+        header.num_analysis_positions = num_blocks
+        header.num_discrete_x_coords_in_full_map = num_x
+        header.num_discrete_y_coords_in_full_map = num_y
+
+    rng = random.Random(seed)
+    blocks = []
+    for i in range(num_blocks):
+        corres_vars = [
+            CorrespondingVariable(
+                label=f"Intensity {j}",
+                unit="d",
+                y_values=_random_values(rng, num_values, integral=j == 0),
+            )
+            for j in range(num_corresponding_variables)
+        ]
+        for corres_var in corres_vars:
+            corres_var.y_min = min(corres_var.y_values, default=0.0)
+            corres_var.y_max = max(corres_var.y_values, default=0.0)
+
+        # Coordinates can only vary if they are included
+        position = i if includes[9] else 0
+        blocks.append(
+            _block(
+                experiment_mode,
+                f"Block {i}",
+                corres_vars,
+                num_values,
+                x_coord=position % num_x + 1,
+                y_coord=position // num_x + 1,
+            )
+        )
+
+    return Vamas._from_parts(header, blocks)
+
+
+def write_synthetic(path: Union[str, Path], **kwargs: Any) -> Path:
+    """Writes a synthetic vamas file, see :func:`synthetic_vamas`
+
+    Args:
+        path (Union[str, Path]): file to be written
+        **kwargs: arguments of :func:`synthetic_vamas`
+
+    Returns:
+        The path of the written file
+    """
+    synthetic_vamas(**kwargs).write(path)
+    return Path(path)
+
+
+def _random_values(
+    rng: random.Random, num_values: int, integral: bool
+) -> YValues:
+    if integral:
+        # Counts, written without a decimal point like most instruments do
+        return YValues(
+            float(rng.randrange(1000, 100000)) for _ in range(num_values)
+        )
+    return YValues(round(rng.uniform(-1.0, 1.0), 6) for _ in range(num_values))
+
+
+def _block(
+    experiment_mode: str,
+    block_identifier: str,
+    corres_vars: List[CorrespondingVariable],
+    num_values: int,
+    x_coord: int,
+    y_coord: int,
+) -> VamasBlock:
+    technique = _TECHNIQUES[experiment_mode]
+    depth_profile = experiment_mode in ["MAPDP", "SDP"]
+    sputtering_source: Optional[SputteringSource] = None
+    if depth_profile:
+        sputtering_source = SputteringSource(
+            energy=3000.0,
+            beam_current=1.5,
+            width_x=1000.0,
+            width_y=1000.0,
+            polar_incidence_angle=45.0,
+            azimuth=90.0,
+            mode="continuous",
+        )
+
+    block = VamasBlock(
+        block_identifier=block_identifier,
+        sample_identifier="Sample",
+        year=2024,
+        month=6,
+        day=1,
+        hour=12,
+        minute=30,
+        second=0,
+        num_hours_advance_gmt=0.0,
+        num_lines_block_comment=1,
+        block_comment="synthetic block",
+        technique=technique,
+        # Kept as raw line by the parser
+        values_exp_var=["0\n"],
+        analysis_source_label="Al",
+        analysis_source_characteristic_energy=1486.6,
+        analysis_source_strength=300.0,
+        analysis_source_beam_width_x=1e37,
+        analysis_source_beam_width_y=1e37,
+        analysis_source_polar_incidence_angle=54.7,
+        analysis_source_azimuth=0.0,
+        analyzer_mode="FAT",
+        analyzer_pass_energy_or_retard_ratio_or_mass_res=20.0,
+        magnification_analyzer_transfer_lens=1e37,
+        analyzer_work_function_or_acceptance_energy=4.5,
+        target_bias=0.0,
+        analysis_width_x=0.0,
+        analysis_width_y=0.0,
+        analyzer_axis_take_off_polar_angle=0.0,
+        analyzer_axis_take_off_azimuth=0.0,
+        species_label="C",
+        transition_or_charge_state_label="1s",
+        charge_detected_particle=-1,
+        x_label="kinetic energy",
+        x_units="eV",
+        x_start=1200.0,
+        x_step=0.1,
+        num_corresponding_variables=len(corres_vars),
+        corresponding_variables=corres_vars,
+        signal_mode="pulse counting",
+        signal_collection_time=0.1,
+        num_scans_to_compile_block=1,
+        signal_time_correction=0.0,
+        sample_normal_polar_angle_tilt=0.0,
+        sample_normal_tilt_azimuth=0.0,
+        sample_rotation_angle=0.0,
+        num_additional_numerical_params=1,
+        additional_numerical_params=[
+            AdditionalNumericalParam("Pass energy", "eV", 20.0)
+        ],
+        num_y_values=num_values * len(corres_vars),
+        sputtering_source=sputtering_source,
+    )
+
+    if experiment_mode == "MAP":
+        block.x_coord = x_coord
+        block.y_coord = y_coord
+    if depth_profile:
+        block.sputtering_z = 18
+        block.sputtering_num_particles = 1.0
+        block.sputtering_charge = 1.0
+    if experiment_mode in ["MAP", "MAPDP", "SEM"]:
+        block.field_view_x = 100.0
+        block.field_view_y = 100.0
+    if experiment_mode == "SEM":
+        block.linescan_coordinates = LinescanCoordinates(
+            1, 1, num_values, 1, num_values, 1
+        )
+    if technique == "AES diff":
+        block.differential_width = 5.0
+    return block
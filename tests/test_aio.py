@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from vamas import AsyncLoader, Vamas, aiter_blocks, aload
+from vamas.vamas_header import VamasHeader
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+def test_aload():
+    vms = asyncio.run(aload(TESTFILE_XPS_EIS))
+    expected = Vamas(TESTFILE_XPS_EIS)
+    assert vms.header == expected.header
+    assert vms.blocks == expected.blocks
+
+
+def test_aload_process_pool():
+    async def load():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await aload(TESTFILE_AES_STAIB, executor)
+
+    assert asyncio.run(load()).blocks == Vamas(TESTFILE_AES_STAIB).blocks
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_aiter_blocks(use_mmap):
+    async def collect():
+        return [
+            b async for b in aiter_blocks(TESTFILE_XPS_EIS, use_mmap=use_mmap)
+        ]
+
+    header, *blocks = asyncio.run(collect())
+    expected = Vamas(TESTFILE_XPS_EIS)
+    assert header == expected.header
+    assert blocks == expected.blocks
+
+
+def test_aiter_blocks_break():
+    async def first_block():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            blocks = aiter_blocks(TESTFILE_XPS_EIS, executor)
+            async for item in blocks:
+                if not isinstance(item, VamasHeader):
+                    await blocks.aclose()
+                    return item
+
+    assert asyncio.run(first_block()) == Vamas(TESTFILE_XPS_EIS).blocks[0]
+
+
+def test_aiter_blocks_error():
+    async def collect():
+        return [b async for b in aiter_blocks(b"not a vamas file\n")]
+
+    with pytest.raises(Exception):
+        asyncio.run(collect())
+
+
+def test_async_loader_limits_concurrency(monkeypatch):
+    active = 0
+    max_active = 0
+
+    def load(path, use_mmap):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            return Vamas(path)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr("vamas.aio._load", load)
+
+    async def load_all():
+        loader = AsyncLoader(max_concurrent=2)
+        return await asyncio.gather(
+            *(loader.load(TESTFILE_AES_STAIB) for _ in range(8))
+        )
+
+    assert len(asyncio.run(load_all())) == 8
+    assert max_active <= 2
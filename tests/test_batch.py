@@ -0,0 +1,73 @@
+import os
+
+from vamas import Vamas, load_many
+from vamas.errors import FileExtensionError, VmsIdentifierError
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+def test_load_many(tmp_path):
+    wrong_identifier = tmp_path / "wrong_identifier.vms"
+    wrong_identifier.write_text("Not a vamas file\n")
+    truncated = tmp_path / "truncated.vms"
+    truncated.write_bytes(TESTFILE_AES_STAIB.read_bytes()[:-100])
+    paths = [
+        TESTFILE_XPS_EIS,
+        tmp_path / "wrong_extension.txt",
+        wrong_identifier,
+        truncated,
+        TESTFILE_AES_STAIB,
+    ]
+
+    results = list(load_many(paths, workers=2))
+
+    assert [r.path for r in results] == paths
+    assert [r.ok for r in results] == [True, False, False, False, True]
+    assert isinstance(results[1].error, FileExtensionError)
+    assert isinstance(results[2].error, VmsIdentifierError)
+    assert isinstance(results[3].error, ValueError)
+    assert results[0].vamas is not None
+    assert results[0].vamas.blocks == Vamas(TESTFILE_XPS_EIS).blocks
+
+
+def test_load_many_unordered():
+    paths = [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS] * 3
+    results = list(load_many(paths, workers=2, ordered=False))
+    assert sorted(str(r.path) for r in results) == sorted(map(str, paths))
+    assert all(r.ok for r in results)
+
+
+def test_load_many_bounded_submissions():
+    consumed = []
+
+    def paths():
+        for path in [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS] * 50:
+            consumed.append(path)
+            yield path
+
+    for ordered in (True, False):
+        consumed.clear()
+        results = load_many(paths(), workers=2, ordered=ordered)
+        assert next(results).ok
+        # Only a few files per worker are submitted ahead of the results
+        assert len(consumed) <= 5
+        results.close()
+        assert len(consumed) <= 5
+
+
+class _CrashingPath(str):
+    """Path which terminates the worker process parsing it"""
+
+    def __str__(self):
+        os._exit(1)
+
+
+def test_load_many_worker_crash():
+    crash = _CrashingPath("crash.vms")
+    paths = [TESTFILE_XPS_EIS, crash] + [TESTFILE_AES_STAIB] * 6
+
+    for ordered in (True, False):
+        # The batch is not aborted, every path gets a result
+        results = list(load_many(paths, workers=2, ordered=ordered))
+        assert len(results) == len(paths)
+        (crashed,) = [r for r in results if r.path is crash]
+        assert not crashed.ok
@@ -0,0 +1,117 @@
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from vamas import Vamas, open_cached
+from vamas.cache import DiskCache, MemoryCache, memory_cache
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+def test_disk_cache_hit(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "cache")
+    expected = Vamas(TESTFILE_XPS_EIS)
+
+    first = cache.load(TESTFILE_XPS_EIS)
+    assert len(list((tmp_path / "cache").glob("*.vmscache"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("file was parsed again")
+
+    monkeypatch.setattr("vamas.cache.Vamas.__init__", fail)
+    second = cache.load(TESTFILE_XPS_EIS)
+    assert first.header == second.header == expected.header
+    assert first.blocks == second.blocks == expected.blocks
+
+
+def test_disk_cache_invalidated_on_change(tmp_path):
+    path = tmp_path / "file.vms"
+    shutil.copy(TESTFILE_AES_STAIB, path)
+    cache = DiskCache(tmp_path / "cache", verify_hash=True)
+    assert cache.load(path).header.num_blocks == 1
+
+    shutil.copy(TESTFILE_XPS_EIS, path)
+    os.utime(path, ns=(0, 0))
+    assert cache.load(path).header.num_blocks == 4
+
+
+def test_disk_cache_corrupted_sidecar(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.load(TESTFILE_AES_STAIB)
+    (sidecar,) = tmp_path.glob("*.vmscache")
+    sidecar.write_bytes(b"garbage")
+    assert (
+        cache.load(TESTFILE_AES_STAIB).blocks
+        == Vamas(TESTFILE_AES_STAIB).blocks
+    )
+
+
+def test_disk_cache_write_failure(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path)
+    expected = Vamas(TESTFILE_AES_STAIB).blocks
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    def disk_full(*args, **kwargs):
+        raise OSError(28, "No space left on device")
+
+    # The file is parsed and returned, but not cached
+    monkeypatch.setattr("vamas.cache.tempfile.mkstemp", read_only)
+    assert cache.load(TESTFILE_AES_STAIB).blocks == expected
+    monkeypatch.undo()
+    monkeypatch.setattr("vamas.cache.os.replace", disk_full)
+    assert cache.load(TESTFILE_AES_STAIB).blocks == expected
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disk_cache_eviction(tmp_path):
+    cache = DiskCache(tmp_path, max_size=1)
+    cache.load(TESTFILE_AES_STAIB)
+    cache.load(TESTFILE_XPS_EIS)
+    assert list(tmp_path.glob("*.vmscache")) == []
+
+    cache.max_size = 1 << 30
+    cache.load(TESTFILE_AES_STAIB)
+    cache.load(TESTFILE_XPS_EIS)
+    assert len(list(tmp_path.glob("*.vmscache"))) == 2
+    cache.clear()
+    assert list(tmp_path.glob("*.vmscache")) == []
+
+
+def test_memory_cache_hits_and_invalidation(tmp_path):
+    path = tmp_path / "file.vms"
+    shutil.copy(TESTFILE_AES_STAIB, path)
+    cache = MemoryCache()
+
+    first = cache.load(path)
+    assert cache.load(path) is first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    shutil.copy(TESTFILE_XPS_EIS, path)
+    os.utime(path, ns=(0, 0))
+    assert cache.load(path).header.num_blocks == 4
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert cache.stats.entries == 1
+
+
+def test_memory_cache_limits():
+    cache = MemoryCache(max_entries=1)
+    cache.load(TESTFILE_AES_STAIB)
+    cache.load(TESTFILE_XPS_EIS)
+    assert cache.stats.entries == 1
+    assert cache.stats.evictions == 1
+
+    cache = MemoryCache(max_size=0)
+    cache.load(TESTFILE_AES_STAIB)
+    assert cache.stats.entries == 0
+    assert cache.stats.size == 0
+
+
+def test_open_cached_threads():
+    memory_cache.clear()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(open_cached, [TESTFILE_XPS_EIS, TESTFILE_XPS_EIS] * 8)
+        )
+    assert all(r.blocks == results[0].blocks for r in results)
+    assert memory_cache.stats.entries == 1
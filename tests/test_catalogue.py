@@ -0,0 +1,122 @@
+import gzip
+import os
+import shutil
+from datetime import datetime
+
+import pytest
+
+from benchmarks.synthetic import synthetic_vamas
+from vamas import Catalogue, Vamas, load_blocks
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.fixture
+def archive(tmp_path):
+    root = tmp_path / "archive"
+    (root / "2021" / "nested").mkdir(parents=True)
+    (root / "2022").mkdir()
+    shutil.copy(TESTFILE_XPS_EIS, root / "2021" / "xps.vms")
+    shutil.copy(TESTFILE_AES_STAIB, root / "2021" / "nested" / "aes.vms")
+    with open(TESTFILE_XPS_EIS, "rb") as src:
+        with gzip.open(root / "2022" / "xps.vms.gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+    (root / "2022" / "notes.txt").write_text("not a vamas file")
+    (root / "2022" / "broken.vms").write_text("garbage\n")
+    return root
+
+
+def test_catalogue_select_and_load(archive, tmp_path):
+    xps = Vamas(TESTFILE_XPS_EIS)
+    block = xps.blocks[1]
+
+    with Catalogue(tmp_path / "catalogue.sqlite") as catalogue:
+        result = catalogue.update(archive)
+        assert (result.added, result.failed) == (4, 1)
+        assert len(catalogue) == 4
+        assert list(catalogue.errors()) == [archive / "2022" / "broken.vms"]
+
+        refs = catalogue.select(
+            species=block.species_label,
+            transition=block.transition_or_charge_state_label,
+            technique=block.technique,
+        )
+        expected = [
+            b
+            for b in xps.blocks
+            if (b.species_label, b.transition_or_charge_state_label)
+            == (block.species_label, block.transition_or_charge_state_label)
+        ]
+        assert [ref.path for ref in refs] == [
+            archive / "2021" / "xps.vms"
+        ] * len(expected) + [archive / "2022" / "xps.vms.gz"] * len(expected)
+        assert load_blocks(refs) == expected * 2
+        assert refs[0].load() == expected[0]
+
+        assert len(catalogue.select()) == 2 * len(xps.blocks) + len(
+            Vamas(TESTFILE_AES_STAIB).blocks
+        )
+        assert catalogue.select(species="Unobtainium") == []
+
+
+def test_catalogue_select_time_range(tmp_path):
+    vms = synthetic_vamas(num_blocks=4, num_values=2)
+    for year, b in zip([2020, 2021, 2021, 2022], vms.blocks):
+        b.year = year
+    vms.blocks[2].species_label = "Au"
+    vms.write(tmp_path / "years.vms")
+
+    with Catalogue() as catalogue:
+        catalogue.update(tmp_path)
+        refs = catalogue.select(
+            start=datetime(2021, 1, 1), end=datetime(2022, 1, 1)
+        )
+        assert [ref.summary.index for ref in refs] == [1, 2]
+        refs = catalogue.select(
+            species="Au", analysis_source="Al", start=datetime(2021, 1, 1)
+        )
+        assert [ref.summary.block_identifier for ref in refs] == ["Block 2"]
+
+
+def test_catalogue_incremental_update(archive, tmp_path):
+    db = tmp_path / "catalogue.sqlite"
+    with Catalogue(db) as catalogue:
+        catalogue.update(archive)
+
+    xps = archive / "2021" / "xps.vms"
+    shutil.copy(TESTFILE_AES_STAIB, xps)
+    (archive / "2021" / "nested" / "aes.vms").unlink()
+    shutil.copy(TESTFILE_XPS_EIS, archive / "2022" / "new.vms")
+
+    # The database is reopened, so the state is persistent
+    with Catalogue(db) as catalogue:
+        result = catalogue.update(archive)
+        assert (result.added, result.updated, result.removed) == (1, 1, 1)
+        assert (result.unchanged, result.failed) == (2, 0)
+
+        refs = catalogue.select()
+        paths = {ref.path for ref in refs}
+        assert paths == {
+            xps,
+            archive / "2022" / "new.vms",
+            archive / "2022" / "xps.vms.gz",
+        }
+        aes_blocks = [ref for ref in refs if ref.path == xps]
+        assert load_blocks(aes_blocks) == Vamas(TESTFILE_AES_STAIB).blocks
+
+        result = catalogue.update(archive / "2022")
+        assert (result.added, result.updated, result.removed) == (0, 0, 0)
+
+        # References to a changed file are rejected instead of misread
+        stat = xps.stat()
+        os.utime(xps, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with pytest.raises(ValueError, match="changed"):
+            load_blocks(aes_blocks)
+
+
+def test_catalogue_parallel_update(archive):
+    with Catalogue() as serial, Catalogue() as parallel:
+        serial.update(archive)
+        result = parallel.update(archive, workers=2)
+        assert (result.added, result.failed) == (4, 1)
+        assert parallel.select() == serial.select()
+        assert parallel.errors() == serial.errors()
@@ -0,0 +1,35 @@
+from array import array
+
+import pytest
+
+from vamas import Vamas
+from vamas.columnar import export_columnar, load_columnar
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+@pytest.mark.parametrize("copy", [False, True])
+def test_columnar_round_trip(tmp_path, path, copy):
+    expected = Vamas(path)
+    export_columnar(expected, tmp_path / "data.vmsc")
+    vms = load_columnar(tmp_path / "data.vmsc", copy=copy)
+    assert vms.header == expected.header
+    assert vms.blocks == expected.blocks
+
+    y_values = vms.blocks[0].corresponding_variables[0].y_values
+    assert isinstance(y_values, array if copy else memoryview)
+
+
+def test_columnar_zero_copy_numpy(tmp_path):
+    np = pytest.importorskip("numpy")
+    export_columnar(Vamas(TESTFILE_XPS_EIS), tmp_path / "data.vmsc")
+    block = load_columnar(tmp_path / "data.vmsc").blocks[3]
+    y = block.corresponding_variables[0].to_numpy()
+    assert not y.flags.owndata
+    assert y.dtype == np.float64
+    assert y.max() == 12216
+
+
+def test_columnar_wrong_file():
+    with pytest.raises(ValueError):
+        load_columnar(TESTFILE_AES_STAIB)
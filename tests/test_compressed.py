@@ -0,0 +1,52 @@
+import bz2
+import gzip
+import lzma
+
+import pytest
+
+from vamas import Vamas, scan_metadata
+from vamas.errors import FileExtensionError
+from .test_vamas import TESTFILE_XPS_EIS
+
+COMPRESSORS = {
+    ".gz": gzip.compress,
+    ".bz2": bz2.compress,
+    ".xz": lzma.compress,
+}
+
+
+@pytest.fixture(params=list(COMPRESSORS))
+def compressed_file(request, tmp_path):
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        data = f.read()
+    path = tmp_path / f"xps_eis.vms{request.param}"
+    path.write_bytes(COMPRESSORS[request.param](data))
+    return path
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compressed(compressed_file, lazy):
+    expected = Vamas(TESTFILE_XPS_EIS)
+    vms = Vamas(compressed_file, lazy=lazy)
+    assert vms.header == expected.header
+    assert list(vms.blocks) == expected.blocks
+
+
+def test_compressed_scan_metadata(compressed_file):
+    header, summaries = scan_metadata(compressed_file)
+    assert header == Vamas(TESTFILE_XPS_EIS).header
+    assert len(summaries) == header.num_blocks
+
+
+def test_zstd(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        data = f.read()
+    path = tmp_path / "xps_eis.vms.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(data))
+    assert Vamas(path).blocks == Vamas(TESTFILE_XPS_EIS).blocks
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(FileExtensionError):
+        Vamas(tmp_path / "xps_eis.vms.zip")
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+
+from vamas import Vamas, iter_blocks, scan_metadata
+from vamas.vamas_block import VamasBlock
+from vamas.vamas_header import VamasHeader
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+def test_iter_blocks_path(path):
+    expected = Vamas(path)
+    header, *blocks = iter_blocks(path)
+    assert isinstance(header, VamasHeader)
+    assert header == expected.header
+    assert all(isinstance(b, VamasBlock) for b in blocks)
+    assert blocks == expected.blocks
+
+
+def test_iter_blocks_stream():
+    expected = Vamas(TESTFILE_XPS_EIS)
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        it = iter_blocks(f)
+        assert next(it) == expected.header
+        assert next(it) == expected.blocks[0]
+        assert list(it) == expected.blocks[1:]
+        assert not f.closed
+
+
+def test_iter_blocks_text_stream():
+    with pytest.raises(TypeError):
+        next(iter_blocks(io.StringIO("")))
+
+
+def test_truncated_file():
+    data = TESTFILE_XPS_EIS.read_bytes()
+    _, summaries = scan_metadata(data)
+    # Cut before the last line of the header
+    header_end = data.rindex(b"\n", 0, summaries[0].offset - 1) + 1
+    truncated = {
+        "the header": [b"", data[:header_end]],
+        "the parameters of block 2": [data[: summaries[1].offset + 100]],
+    }
+    parsers = [
+        Vamas,
+        lambda data: Vamas(data, lazy=True),
+        scan_metadata,
+        lambda data: list(iter_blocks(data)),
+    ]
+    for section, files in truncated.items():
+        for file in files:
+            for parse in parsers:
+                with pytest.raises(
+                    ValueError, match=f"end of file in {section}"
+                ):
+                    parse(file)
@@ -0,0 +1,88 @@
+import io
+
+from benchmarks.synthetic import synthetic_vamas, write_synthetic
+from vamas import TailReader, Vamas, iter_blocks
+from vamas._layout import BLOCK_LAYOUT
+from vamas.vamas import _suffix_plan
+from vamas.vamas_header import NUM_BLOCK_PARAMS
+from vamas.writer import dump
+
+
+def test_layout_covers_all_block_params():
+    positions = [p.position for p in BLOCK_LAYOUT if p.position is not None]
+    assert positions == list(range(NUM_BLOCK_PARAMS))
+
+
+def test_plan_compiled_once_per_file():
+    vms = synthetic_vamas(
+        "MAP", num_blocks=50, num_values=3, excluded=range(0, 40, 3)
+    )
+    fp = io.StringIO(newline="")
+    dump(vms, fp)
+
+    _suffix_plan.cache_clear()
+    blocks = list(iter_blocks(fp.getvalue().encode()))[1:]
+    assert len(blocks) == 50
+    # The first block is parsed with all parameters included
+    assert _suffix_plan.cache_info().misses == 2
+
+
+def test_excluded_params_shared_with_first_block(tmp_path):
+    path = write_synthetic(
+        tmp_path / "excluded.vms",
+        num_blocks=2000,
+        num_values=5,
+        num_corresponding_variables=2,
+        excluded=range(40),
+    )
+    expected = synthetic_vamas(
+        num_blocks=2000, num_values=5, num_corresponding_variables=2
+    )
+
+    for vms in (Vamas(path), Vamas(path, lazy=True)):
+        blocks = vms.blocks
+        first = blocks[0]
+        assert len(blocks) == 2000
+        for i in (1, 999, 1999):
+            b = blocks[i]
+            assert b.block_identifier == f"Block {i}"
+            # Immutable values are shared, lists are owned by every block
+            assert b.block_comment is first.block_comment
+            params = b.additional_numerical_params
+            assert params == first.additional_numerical_params
+            assert params[0] is first.additional_numerical_params[0]
+            assert b.values_exp_var == first.values_exp_var
+            # Ordinates are owned by every block
+            assert (
+                b.corresponding_variables is not first.corresponding_variables
+            )
+            for c, e in zip(
+                b.corresponding_variables,
+                expected.blocks[i].corresponding_variables,
+            ):
+                assert (c.label, c.unit) == (e.label, e.unit)
+                assert list(c.y_values) == list(e.y_values)
+
+        y_values = list(blocks[2].corresponding_variables[0].y_values)
+        params = list(first.additional_numerical_params)
+        blocks[1].corresponding_variables[0].y_values[0] = -1.0
+        blocks[1].additional_numerical_params.append(params[0])
+        blocks[1].values_exp_var.clear()
+        for b in (first, blocks[2], blocks[1999]):
+            assert b.additional_numerical_params == params
+            assert b.values_exp_var == ["0\n"]
+        assert list(blocks[2].corresponding_variables[0].y_values) == y_values
+
+
+def test_inclusion_list_numbered_from_one(tmp_path):
+    path = write_synthetic(
+        tmp_path / "excluded.vms", num_blocks=3, num_values=2, excluded=[39]
+    )
+    lines = path.read_text().splitlines()
+    assert lines[lines.index("-1") + 1] == "40"
+
+    vms = Vamas(path)
+    assert list(vms.header.block_params_includes) == [True] * 39 + [False]
+
+    reader = TailReader(path)
+    assert reader.refresh() == vms.blocks
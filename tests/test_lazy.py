@@ -0,0 +1,40 @@
+import pytest
+
+from vamas import Vamas
+from vamas.vamas import LazyBlocks
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+def test_lazy_blocks_equal_eager(path):
+    eager = Vamas(path)
+    lazy = Vamas(path, lazy=True)
+    assert isinstance(lazy.blocks, LazyBlocks)
+    assert lazy.header == eager.header
+    assert len(lazy.blocks) == len(eager.blocks)
+    assert list(lazy.blocks) == eager.blocks
+
+
+def test_lazy_entries_without_y_values():
+    vms = Vamas(TESTFILE_XPS_EIS, lazy=True)
+    assert isinstance(vms.blocks, LazyBlocks)
+    entry = vms.blocks.entries[3]
+    assert entry.params["num_y_values"] == 541
+    assert len(entry.params["corresponding_variables"][0].y_values) == 0
+    assert vms.blocks._blocks == [None] * 4
+
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        f.seek(entry.offset)
+        assert f.readline().strip() == entry.params["block_identifier"].encode()
+
+
+def test_lazy_caches_blocks():
+    vms = Vamas(TESTFILE_XPS_EIS, lazy=True)
+    assert vms.blocks[-1] is vms.blocks[3]
+    assert vms.blocks[1:3] == [vms.blocks[1], vms.blocks[2]]
+
+
+def test_lazy_bytes():
+    with open(TESTFILE_AES_STAIB, "rb") as f:
+        vms = Vamas(f.read(), lazy=True)
+    assert vms.blocks[0] == Vamas(TESTFILE_AES_STAIB).blocks[0]
@@ -0,0 +1,112 @@
+from array import array
+from dataclasses import replace
+
+import pytest
+
+from vamas import Vamas, read_map, reshape_linescan
+from vamas.vamas_block import LinescanCoordinates
+from .test_vamas import TESTFILE_AES_STAIB
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def map_file(tmp_path):
+    vms = Vamas(TESTFILE_AES_STAIB)
+    block = vms.blocks[0]
+    vms.header = replace(
+        vms.header,
+        experiment_mode="MAP",
+        num_spectral_regions=2,
+        num_analysis_positions=5,
+        num_discrete_x_coords_in_full_map=3,
+        num_discrete_y_coords_in_full_map=2,
+    )
+
+    blocks = []
+    for x, y in [(1, 1), (2, 1), (3, 1), (1, 2), (3, 2)]:
+        for region, species in enumerate(["Cu", "Ag"]):
+            corres_var = replace(
+                block.corresponding_variables[0],
+                y_values=array("d", [100 * x + 10 * y + region] * (region + 4)),
+            )
+            blocks.append(
+                replace(
+                    block,
+                    species_label=species,
+                    x_coord=x,
+                    y_coord=y,
+                    field_view_x=10.0,
+                    field_view_y=10.0,
+                    corresponding_variables=[corres_var],
+                    num_y_values=region + 4,
+                )
+            )
+    vms.blocks = blocks
+
+    path = tmp_path / "map.vms"
+    vms.write(path)
+    return path
+
+
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_read_map(map_file, use_mmap):
+    header, regions = read_map(map_file, use_mmap=use_mmap)
+    assert header.experiment_mode == "MAP"
+    assert [r.species_label for r in regions] == ["Cu", "Ag"]
+
+    cu, ag = regions
+    assert cu.data.shape == (2, 3, 4)
+    assert ag.data.shape == (2, 3, 5)
+    assert (cu.data[0, 2] == 310).all()
+    assert (ag.data[1, 0] == 121).all()
+    assert np.isnan(cu.data[1, 1]).all()
+
+
+def test_read_map_wrong_mode():
+    with pytest.raises(ValueError):
+        read_map(TESTFILE_AES_STAIB)
+
+
+def _linescan_block(coordinates, num_values):
+    block = Vamas(TESTFILE_AES_STAIB).blocks[0]
+    corres_var = replace(
+        block.corresponding_variables[0],
+        y_values=array("d", range(num_values)),
+    )
+    return replace(
+        block,
+        linescan_coordinates=LinescanCoordinates(*coordinates),
+        corresponding_variables=[corres_var],
+        num_y_values=num_values,
+    )
+
+
+@pytest.mark.parametrize(
+    "coordinates, expected",
+    [
+        # Horizontal lines from the top left corner
+        ((1, 1, 3, 1, 3, 2), [[0, 1, 2], [3, 4, 5]]),
+        # Horizontal lines from right to left, advancing upwards
+        ((3, 2, 1, 2, 1, 1), [[5, 4, 3], [2, 1, 0]]),
+        # Vertical lines from the top left corner
+        ((1, 1, 1, 2, 3, 2), [[0, 2, 4], [1, 3, 5]]),
+        # Vertical lines from bottom to top, advancing to the left
+        ((3, 2, 3, 1, 1, 1), [[5, 3, 1], [4, 2, 0]]),
+    ],
+)
+def test_reshape_linescan(coordinates, expected):
+    image = reshape_linescan(_linescan_block(coordinates, 6))
+    assert image.tolist() == expected
+    assert image.flags["C_CONTIGUOUS"]
+    assert image.flags["OWNDATA"]
+
+
+def test_reshape_linescan_wrong_size():
+    with pytest.raises(ValueError):
+        reshape_linescan(_linescan_block((1, 1, 3, 1, 3, 2), 5))
+
+
+def test_reshape_linescan_no_coordinates():
+    with pytest.raises(ValueError):
+        reshape_linescan(Vamas(TESTFILE_AES_STAIB).blocks[0])
@@ -0,0 +1,32 @@
+import io
+import mmap
+
+import pytest
+
+from vamas import Vamas
+from vamas.vamas import _LineReader, _MmapLineReader
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_mmap_equals_buffered(path, lazy):
+    expected = Vamas(path)
+    vms = Vamas(path, lazy=lazy, use_mmap=True)
+    assert vms.header == expected.header
+    assert list(vms.blocks) == expected.blocks
+
+
+@pytest.mark.parametrize("content", [b"1\n2\n3\n", b"1\r\n2\r\n3"])
+@pytest.mark.parametrize("n", [0, 1, 3, 5])
+def test_mmap_skip_equals_readline_skip(tmp_path, content, n):
+    path = tmp_path / "lines.txt"
+    path.write_bytes(content)
+    expected = _LineReader(io.BytesIO(content))
+
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with _MmapLineReader(mm) as reader:
+        reader._CHUNK_SIZE = 2
+        assert reader.skip(n) == expected.skip(n)
+        assert reader.tell() == expected.tell()
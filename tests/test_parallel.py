@@ -0,0 +1,20 @@
+import pytest
+
+from vamas import Vamas
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_parallel_equals_serial(path, use_mmap):
+    expected = Vamas(path)
+    vms = Vamas(path, use_mmap=use_mmap, workers=2)
+    assert isinstance(vms.blocks, list)
+    assert vms.header == expected.header
+    assert vms.blocks == expected.blocks
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_invalid_number_of_workers(workers):
+    with pytest.raises(ValueError, match="at least 1"):
+        Vamas(TESTFILE_XPS_EIS, workers=workers)
@@ -0,0 +1,46 @@
+import pytest
+
+from vamas import ParseStats, Vamas, iter_blocks
+from vamas.profiling import PHASES
+from .test_vamas import TESTFILE_XPS_EIS
+
+
+def test_parse_stats():
+    stats = ParseStats()
+    vms = Vamas(TESTFILE_XPS_EIS, stats=stats)
+    assert vms.blocks == Vamas(TESTFILE_XPS_EIS).blocks
+
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        lines = f.readlines()
+    # Everything except the closing 'end of experiment' line
+    assert stats.lines == len(lines) - 1
+    assert stats.bytes_read == sum(map(len, lines[:-1]))
+    assert stats.blocks_parsed == len(vms.blocks)
+
+    assert set(stats.phases) == set(PHASES)
+    assert stats.phases["ordinates"].wall_time > 0
+    assert stats.wall_time == pytest.approx(
+        sum(p.wall_time for p in stats.phases.values())
+    )
+
+    assert [b.index for b in stats.blocks] == list(range(len(vms.blocks)))
+    assert [b.num_y_values for b in stats.blocks] == [
+        b.num_y_values for b in vms.blocks
+    ]
+    assert sum(b.lines for b in stats.blocks) < stats.lines
+    assert stats.as_dict()["blocks_parsed"] == len(vms.blocks)
+
+
+def test_parse_stats_callback():
+    seen = []
+    stats = ParseStats(on_block=seen.append, keep_blocks=False)
+    blocks = list(iter_blocks(TESTFILE_XPS_EIS, stats=stats))[1:]
+    assert [b.index for b in seen] == list(range(len(blocks)))
+    assert stats.blocks == []
+    assert stats.blocks_parsed == len(blocks)
+
+
+@pytest.mark.parametrize("kwargs", [{"lazy": True}, {"workers": 2}])
+def test_parse_stats_unsupported(kwargs):
+    with pytest.raises(ValueError):
+        Vamas(TESTFILE_XPS_EIS, stats=ParseStats(), **kwargs)
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.synthetic import synthetic_vamas, write_synthetic
+from vamas import BlockQuery, Vamas, acquisition_time
+
+
+def _labelled(vms):
+    for i, b in enumerate(vms.blocks):
+        b.species_label = ["C", "O", "N"][i % 3]
+        b.transition_or_charge_state_label = "1s" if i % 2 else "2p"
+        b.sample_identifier = f"Sample {i // 10}"
+        b.minute = i % 60
+        b.hour = i // 60
+    return vms
+
+
+def test_select():
+    vms = _labelled(synthetic_vamas(num_blocks=100, num_values=2))
+    blocks = vms.blocks
+
+    expected = [
+        b
+        for b in blocks
+        if b.species_label == "C" and b.transition_or_charge_state_label == "1s"
+    ]
+    assert vms.select(species="C", transition="1s") == expected
+    assert vms.select(sample="Sample 3", technique="XPS") == blocks[30:40]
+    assert vms.select(species="Ar") == []
+    assert vms.select() == blocks
+
+    start = datetime(2024, 6, 1, 0, 10, tzinfo=timezone.utc)
+    end = start + timedelta(minutes=5)
+    assert vms.select(start=start, end=end) == blocks[10:15]
+    # Naive datetimes are UTC, the end is exclusive
+    assert vms.select(start=datetime(2024, 6, 1, 1, 30)) == blocks[90:]
+    assert vms.select(species="O", end=datetime(2024, 6, 1, 0, 6)) == [
+        blocks[1],
+        blocks[4],
+    ]
+
+
+def test_select_rebuilds_index():
+    vms = _labelled(synthetic_vamas(num_blocks=10, num_values=2))
+    assert len(vms.select(species="N")) == 3
+
+    vms.blocks.append(vms.blocks[2])
+    assert len(vms.select(species="N")) == 4
+    vms.blocks = vms.blocks[:3]
+    assert vms.select(species="N") == [vms.blocks[2]]
+
+
+def test_select_lazy_reads_only_matching_blocks(tmp_path):
+    path = write_synthetic(tmp_path / "lazy.vms", num_blocks=20, num_values=2)
+    vms = Vamas(path, lazy=True)
+
+    assert vms.select(species="Ar") == []
+    assert vms.blocks._blocks == [None] * 20
+    assert len(vms.select(species="C", sample="Sample")) == 20
+
+
+def test_timestamp_index():
+    vms = synthetic_vamas(num_blocks=4, num_values=2)
+    b0, b1, b2, b3 = vms.blocks
+    # 12:30 at GMT+2 is before 12:00 UTC
+    b0.num_hours_advance_gmt = 2.0
+    b2.month = 13
+    b3.num_hours_advance_gmt = 1e37
+
+    assert acquisition_time(b0) == datetime(
+        2024, 6, 1, 10, 30, tzinfo=timezone.utc
+    )
+    assert acquisition_time(b2) is None
+    assert acquisition_time(b3) is None
+
+    query = BlockQuery(vms.blocks)
+    noon = datetime(2024, 6, 1, 12, tzinfo=timezone.utc)
+    assert query.select(end=noon) == [0]
+    assert query.select(start=noon) == [1]
@@ -0,0 +1,30 @@
+import pytest
+
+from vamas import Vamas, scan_metadata
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_scan_metadata(path, use_mmap):
+    expected = Vamas(path)
+    header, summaries = scan_metadata(path, use_mmap=use_mmap)
+    assert header == expected.header
+    assert len(summaries) == len(expected.blocks)
+    for i, (summary, block) in enumerate(zip(summaries, expected.blocks)):
+        assert summary.index == i
+        assert summary.block_identifier == block.block_identifier
+        assert summary.sample_identifier == block.sample_identifier
+        assert summary.technique == block.technique
+        assert (summary.year, summary.month, summary.day) == (
+            block.year,
+            block.month,
+            block.day,
+        )
+        assert (summary.hour, summary.minute, summary.second) == (
+            block.hour,
+            block.minute,
+            block.second,
+        )
+        assert summary.species_label == block.species_label
+        assert summary.num_y_values == block.num_y_values
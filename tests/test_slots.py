@@ -0,0 +1,53 @@
+import copy
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from vamas import Vamas
+from vamas.vamas_header import IncludeMask
+from .test_vamas import TESTFILE_AES_STAIB
+
+
+@pytest.fixture
+def aes_staib():
+    return Vamas(TESTFILE_AES_STAIB)
+
+
+def test_no_instance_dict(aes_staib: Vamas):
+    block = aes_staib.blocks[0]
+    objects = [
+        aes_staib.header,
+        block,
+        block.corresponding_variables[0],
+        block.additional_numerical_params[0],
+    ]
+    for obj in objects:
+        assert not hasattr(obj, "__dict__")
+
+
+def test_frozen_records(aes_staib: Vamas):
+    param = aes_staib.blocks[0].additional_numerical_params[0]
+    with pytest.raises(FrozenInstanceError):
+        param.value = 1.0  # type: ignore[misc]
+
+
+def test_pickle_and_copy(aes_staib: Vamas):
+    restored = pickle.loads(pickle.dumps(aes_staib))
+    assert restored.header == aes_staib.header
+    assert restored.blocks == aes_staib.blocks
+    assert copy.deepcopy(aes_staib.blocks) == aes_staib.blocks
+
+
+def test_include_mask():
+    includes = [i % 3 == 0 for i in range(40)]
+    mask = IncludeMask.from_bools(includes)
+    assert list(mask) == includes
+    assert len(mask) == 40
+    assert mask[3] and not mask[4]
+    assert mask[-1] == includes[-1]
+    assert mask[:5] == includes[:5]
+    assert all(IncludeMask.all())
+    with pytest.raises(IndexError):
+        mask[40]
+    assert pickle.loads(pickle.dumps(mask)) == mask
@@ -0,0 +1,148 @@
+import io
+import zipfile
+
+import pytest
+
+from vamas import Vamas, iter_blocks, scan_metadata
+from vamas.vamas import _CarriageReturnReader
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.fixture
+def data():
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def expected():
+    return Vamas(TESTFILE_XPS_EIS)
+
+
+class ReadOnly:
+    """File-like object providing nothing but read"""
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def read(self, n=-1):
+        return self._stream.read(n)
+
+
+class RawBytes(io.RawIOBase):
+    """Unbuffered stream over bytes, to be wrapped in a BufferedReader"""
+
+    def __init__(self, data):
+        self._stream = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._stream.readinto(b)
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_buffer(data, expected, wrap, lazy):
+    vms = Vamas(wrap(data), lazy=lazy)
+    assert vms.header == expected.header
+    assert list(vms.blocks) == expected.blocks
+
+
+def test_buffer_not_copied(data, expected):
+    buffer = bytearray(data)
+    vms = Vamas(buffer)
+    # The export of the buffer is released after parsing
+    buffer.extend(b"\n")
+    assert vms.blocks == expected.blocks
+
+
+@pytest.mark.parametrize(
+    "make_stream",
+    [
+        io.BytesIO,
+        ReadOnly,
+        lambda data: io.BufferedReader(RawBytes(data), 16),
+    ],
+)
+def test_stream(data, expected, make_stream):
+    stream = make_stream(data)
+    vms = Vamas(stream)
+    assert vms.header == expected.header
+    assert vms.blocks == expected.blocks
+
+
+def test_unbuffered_file(expected):
+    with open(TESTFILE_XPS_EIS, "rb", buffering=0) as f:
+        vms = Vamas(f)
+        assert not f.closed
+    assert vms.blocks == expected.blocks
+
+
+def test_zip_member(tmp_path, expected):
+    archive = tmp_path / "archive.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as z:
+        z.write(TESTFILE_XPS_EIS, "xps_eis.vms")
+
+    with zipfile.ZipFile(archive) as z, z.open("xps_eis.vms") as member:
+        vms = Vamas(member)
+    assert vms.blocks == expected.blocks
+
+
+def test_scan_metadata_stream(data, expected):
+    header, summaries = scan_metadata(ReadOnly(data))
+    assert header == expected.header
+    assert [s.num_y_values for s in summaries] == [
+        b.num_y_values for b in expected.blocks
+    ]
+
+
+def test_iter_blocks_read_only_stream(data, expected):
+    header, *blocks = iter_blocks(ReadOnly(data))
+    assert blocks == expected.blocks
+
+
+def test_lazy_stream(data):
+    with pytest.raises(ValueError):
+        Vamas(io.BytesIO(data), lazy=True)
+
+
+def test_text_stream():
+    with open(TESTFILE_AES_STAIB) as f:
+        with pytest.raises(TypeError):
+            Vamas(f)
+
+
+def test_invalid_type():
+    with pytest.raises(TypeError):
+        Vamas(42)
+
+
+def load_read_only(path):
+    return Vamas(ReadOnly(path.read_bytes()))
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r"])
+@pytest.mark.parametrize(
+    "load",
+    [
+        lambda path: Vamas(path),
+        lambda path: Vamas(path, use_mmap=True),
+        lambda path: Vamas(path, lazy=True),
+        lambda path: Vamas(path.read_bytes()),
+        load_read_only,
+    ],
+)
+def test_line_endings(tmp_path, data, expected, newline, load):
+    path = tmp_path / "newline.vms"
+    path.write_bytes(data.replace(b"\r\n", newline))
+    vms = load(path)
+    assert vms.header == expected.header
+    assert list(vms.blocks) == expected.blocks
+
+
+def test_lone_carriage_returns_across_chunks():
+    raw = _CarriageReturnReader(io.BytesIO(b"a\r\nbc\r\rd\r\r\ne\r"))
+    lines = io.BufferedReader(raw, 2).readlines()
+    assert lines == [b"a\r\n", b"bc\n", b"\n", b"d\n", b"\r\n", b"e\n"]
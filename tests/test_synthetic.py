@@ -0,0 +1,58 @@
+import pytest
+
+from benchmarks import run
+from benchmarks.synthetic import (
+    EXPERIMENT_MODES,
+    synthetic_vamas,
+    write_synthetic,
+)
+from vamas import Vamas
+
+
+@pytest.mark.parametrize("experiment_mode", EXPERIMENT_MODES)
+@pytest.mark.parametrize("num_corresponding_variables", [1, 3])
+@pytest.mark.parametrize("excluded", [(), range(0, 40, 3), range(40)])
+def test_synthetic_round_trip(
+    tmp_path, experiment_mode, num_corresponding_variables, excluded
+):
+    expected = synthetic_vamas(
+        experiment_mode,
+        num_blocks=5,
+        num_values=7,
+        num_corresponding_variables=num_corresponding_variables,
+        excluded=excluded,
+    )
+    expected.write(tmp_path / "synthetic.vms")
+
+    vms = Vamas(tmp_path / "synthetic.vms")
+    assert vms.header == expected.header
+    assert vms.blocks == expected.blocks
+
+
+def test_benchmark_run(tmp_path, capsys):
+    results = tmp_path / "results.json"
+    args = ["-s", "norm", "-l", "Vamas", "--repeat", "1", "--scale", "0.05"]
+    assert run.main(args + ["--save", str(results)]) == 0
+    assert "MB/s" in capsys.readouterr().out
+    assert (
+        run.main(args + ["--compare", str(results), "--threshold", "10"]) == 0
+    )
+
+
+def test_benchmark_compare():
+    baseline = [
+        {
+            "scenario": "norm",
+            "loader": "Vamas",
+            "mb_per_s": 10.0,
+            "peak_memory": 100.0,
+        }
+    ]
+    results = [dict(baseline[0], mb_per_s=5.0, peak_memory=200.0)]
+    assert len(run.compare(results, baseline, 0.2)) == 2
+    assert run.compare(baseline, baseline, 0.2) == []
+
+
+def test_write_synthetic(tmp_path):
+    path = write_synthetic(tmp_path / "map.vms", experiment_mode="MAP")
+    assert Vamas(path).header.num_discrete_x_coords_in_full_map == 10
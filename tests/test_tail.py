@@ -0,0 +1,68 @@
+import pytest
+
+from vamas import TailReader, Vamas, scan_metadata
+from vamas.errors import FileExtensionError
+from .test_vamas import TESTFILE_XPS_EIS
+
+
+@pytest.fixture
+def data():
+    with open(TESTFILE_XPS_EIS, "rb") as f:
+        return f.read()
+
+
+def test_tail_reader_growing_file(tmp_path, data):
+    expected = Vamas(TESTFILE_XPS_EIS)
+    path = tmp_path / "growing.vms"
+    path.write_bytes(b"")
+
+    reader = TailReader(path)
+    blocks = []
+    for end in range(0, len(data) + 1, 997):
+        path.write_bytes(data[:end])
+        blocks.extend(reader.refresh())
+        assert reader.blocks == blocks
+        assert reader.blocks == expected.blocks[: len(blocks)]
+    path.write_bytes(data)
+    blocks.extend(reader.refresh())
+
+    assert reader.complete
+    assert reader.header == expected.header
+    assert blocks == expected.blocks
+    assert reader.to_vamas().blocks == expected.blocks
+
+
+def test_tail_reader_partial_line(tmp_path, data):
+    expected = Vamas(TESTFILE_XPS_EIS)
+    _, summaries = scan_metadata(TESTFILE_XPS_EIS)
+    second_block = summaries[1].offset
+    path = tmp_path / "growing.vms"
+    reader = TailReader(path)
+
+    # The last y-value of the first block is only partially written
+    path.write_bytes(data[: second_block - 3])
+    assert reader.refresh() == []
+    assert reader.header == expected.header
+
+    path.write_bytes(data[:second_block])
+    assert reader.refresh() == expected.blocks[:1]
+
+    path.write_bytes(data)
+    assert reader.refresh() == expected.blocks[1:]
+
+
+def test_tail_reader_restarted_file(tmp_path, data):
+    path = tmp_path / "growing.vms"
+    path.write_bytes(data)
+    reader = TailReader(path)
+    reader.refresh()
+
+    path.write_bytes(data[: len(data) // 2])
+    new_blocks = reader.refresh()
+    assert reader.blocks == new_blocks
+    assert not reader.complete
+
+
+def test_tail_reader_extension():
+    with pytest.raises(FileExtensionError):
+        TailReader("file.txt")
@@ -0,0 +1,64 @@
+import io
+from array import array
+from dataclasses import replace
+
+import pytest
+
+from vamas import Vamas, dump
+from vamas.vamas_block import CorrespondingVariable
+from vamas.vamas_header import IncludeMask
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.mark.parametrize("path", [TESTFILE_AES_STAIB, TESTFILE_XPS_EIS])
+def test_write_round_trip(tmp_path, path):
+    expected = Vamas(path)
+    expected.write(tmp_path / "out.vms")
+    vms = Vamas(tmp_path / "out.vms")
+    assert vms.header == expected.header
+    assert vms.blocks == expected.blocks
+
+
+def test_dump_line_endings():
+    stream = io.StringIO(newline="")
+    dump(Vamas(TESTFILE_AES_STAIB), stream, newline="\n")
+    text = stream.getvalue()
+    assert "\r" not in text
+    assert Vamas(text.encode()).blocks == Vamas(TESTFILE_AES_STAIB).blocks
+
+
+def test_write_multiple_corresponding_variables(tmp_path):
+    vms = Vamas(TESTFILE_AES_STAIB)
+    block = vms.blocks[0]
+    first = block.corresponding_variables[0]
+    second = CorrespondingVariable(
+        label="Background",
+        unit="d",
+        y_values=array("d", (2 * y for y in first.y_values)),
+        y_min=2 * first.y_max,
+        y_max=2 * first.y_max,
+    )
+    vms.blocks[0] = replace(
+        block,
+        num_corresponding_variables=2,
+        corresponding_variables=[first, second],
+        num_y_values=2 * block.num_y_values,
+    )
+
+    vms.write(tmp_path / "out.vms")
+    assert Vamas(tmp_path / "out.vms").blocks == vms.blocks
+
+
+def test_write_excluded_params(tmp_path):
+    vms = Vamas(TESTFILE_XPS_EIS)
+    includes = [True] * 40
+    includes[13] = False
+    vms.header.num_entries_inclusion_exclusion = -1
+    vms.header.block_params_includes = IncludeMask.from_bools(includes)
+
+    vms.write(tmp_path / "out.vms")
+    assert Vamas(tmp_path / "out.vms").blocks == vms.blocks
+
+    vms.blocks[2].analysis_source_characteristic_energy = 1253.6
+    with pytest.raises(ValueError):
+        vms.write(tmp_path / "out.vms")
@@ -0,0 +1,77 @@
+import pickle
+from dataclasses import replace
+
+import pytest
+
+from vamas import Vamas
+from .test_vamas import TESTFILE_AES_STAIB, TESTFILE_XPS_EIS
+
+
+@pytest.fixture
+def xps_eis():
+    return Vamas(TESTFILE_XPS_EIS)
+
+
+def test_x_values(xps_eis: Vamas):
+    block = xps_eis.blocks[0]
+    x_values = block.x_values
+    assert len(x_values) == block.num_y_values
+    assert x_values[0] == block.x_start
+    assert x_values[10] == pytest.approx(block.x_start + 10 * block.x_step)
+    assert block.x_values is x_values
+
+
+def test_x_values_cache_invalidated(xps_eis: Vamas):
+    block = xps_eis.blocks[0]
+    x_values = block.x_values
+    block.x_start += 1
+    assert block.x_values is not x_values
+    assert block.x_values[0] == x_values[0] + 1
+
+
+def test_x_values_not_pickled(xps_eis: Vamas):
+    block = xps_eis.blocks[0]
+    block.x_values
+    copied = pickle.loads(pickle.dumps(block))
+    assert copied == block
+    assert list(copied.x_values) == list(block.x_values)
+
+
+def test_binding_energies(xps_eis: Vamas):
+    block = xps_eis.blocks[1]
+    energies = block.binding_energies
+    assert energies[5] == pytest.approx(
+        block.analysis_source_characteristic_energy
+        - block.x_values[5]
+        - block.analyzer_work_function_or_acceptance_energy
+    )
+    assert block.binding_energies is energies
+
+    block = replace(block, x_label="binding energy")
+    assert block.binding_energies is block.x_values
+
+
+def test_x_to_numpy(xps_eis: Vamas):
+    np = pytest.importorskip("numpy")
+    block = xps_eis.blocks[0]
+    x = block.x_to_numpy(binding_energy=True)
+    assert x.dtype == np.float64
+    assert x.tolist() == list(block.binding_energies)
+
+
+def test_stack_xy():
+    np = pytest.importorskip("numpy")
+    vms = Vamas(TESTFILE_AES_STAIB)
+    vms.blocks = [vms.blocks[0], vms.blocks[0]]
+    stacked = vms.stack_xy()
+    assert stacked.shape == (2, 2, vms.blocks[0].num_y_values)
+    assert np.array_equal(stacked[1, 0], vms.blocks[0].x_to_numpy())
+    assert np.array_equal(
+        stacked[1, 1], vms.blocks[0].corresponding_variables[0].to_numpy()
+    )
+
+
+def test_stack_xy_different_grids(xps_eis: Vamas):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        xps_eis.stack_xy()
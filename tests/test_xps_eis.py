@@ -1,3 +1,7 @@
+import copy
+import pickle
+from array import array
+
 import pytest
 
 from vamas import Vamas
@@ -80,3 +84,42 @@ def test_xps_eis_last_block_corresponding_variables(xps_eis: Vamas):
         assert corr_vars[0].y_min == 7813
         assert corr_vars[0].y_max == 12216
         assert len(corr_vars[0].y_values) == xps_eis.blocks[3].num_y_values
+
+
+def test_xps_eis_y_values_array(xps_eis: Vamas):
+    y_values = xps_eis.blocks[0].corresponding_variables[0].y_values
+    assert isinstance(y_values, array)
+    assert y_values.typecode == "d"
+    assert min(y_values) == 2141
+    assert max(y_values) == 84683
+    assert y_values.tolist()[:2] == list(y_values[:2])
+
+
+def test_xps_eis_y_values_list_api(xps_eis: Vamas):
+    y_values = xps_eis.blocks[0].corresponding_variables[0].y_values
+    as_list = y_values.tolist()
+    assert y_values == as_list
+    assert as_list == y_values
+    assert y_values != as_list[1:]
+    assert y_values[:2] == as_list[:2]
+    assert y_values + [1.0] == as_list + [1.0]
+    assert [1.0] + y_values == [1.0] + as_list
+    assert pickle.loads(pickle.dumps(y_values, protocol=2)) == y_values
+
+    copied = copy.copy(y_values)
+    copied.sort(reverse=True)
+    assert copied == sorted(as_list, reverse=True)
+    copied += [0.0]
+    assert copied[-1] == 0.0
+    copied.clear()
+    assert copied == []
+    assert y_values == as_list
+
+
+def test_xps_eis_y_values_numpy(xps_eis: Vamas):
+    np = pytest.importorskip("numpy")
+    corr_var = xps_eis.blocks[0].corresponding_variables[0]
+    y = corr_var.to_numpy()
+    assert y.dtype == np.float64
+    assert y.shape == (xps_eis.blocks[0].num_y_values,)
+    assert y.max() == corr_var.y_max
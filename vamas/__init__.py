@@ -1,3 +1,34 @@
-from .vamas import Vamas
+from .vamas import Vamas, iter_blocks
+from .batch import LoadResult, load_many
+from .cache import open_cached
+from .scan import BlockSummary, scan_metadata
+from .writer import dump
+from .aio import AsyncLoader, aiter_blocks, aload
+from .maps import MapRegion, read_map, reshape_linescan
+from .tail import TailReader
+from .profiling import ParseStats
+from .query import BlockQuery, acquisition_time
+from .catalogue import Catalogue, load_blocks
 
-__all__ = ["Vamas"]
+__all__ = [
+    "Vamas",
+    "iter_blocks",
+    "LoadResult",
+    "load_many",
+    "open_cached",
+    "BlockSummary",
+    "scan_metadata",
+    "dump",
+    "MapRegion",
+    "read_map",
+    "reshape_linescan",
+    "aload",
+    "aiter_blocks",
+    "AsyncLoader",
+    "TailReader",
+    "ParseStats",
+    "BlockQuery",
+    "acquisition_time",
+    "Catalogue",
+    "load_blocks",
+]
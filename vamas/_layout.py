@@ -0,0 +1,196 @@
+"""Layout of the block parameters in a vamas file
+
+The block parameters are described once as a table, which is compiled into
+parsing plans by :mod:`vamas.vamas` and drives :mod:`vamas.writer`. A new
+variant of the format is supported by adding or changing entries here.
+"""
+
+from typing import Callable, NamedTuple, Optional, Tuple
+
+
+def int_float(line: str) -> int:
+    """Integer which may be written with a decimal point"""
+    return int(float(line))
+
+
+# Converters of simple fields, `str` stands for a stripped line
+Field = Tuple[str, Callable]
+
+
+class Param(NamedTuple):
+    """Entry of the block layout
+
+    Attributes:
+        position: Position of the parameter in the inclusion list of the header,
+            None if the parameter is always included.
+        fields: Names and converters of the fields, which take one line each.
+        special: Name of a parameter with a variable number of lines or
+            a nested record, instead of `fields`, see :data:`SPECIAL_NAMES`.
+        condition: Whether the parameter is present for an experiment mode
+            and technique. None if it is always present.
+    """
+
+    position: Optional[int]
+    fields: Tuple[Field, ...] = ()
+    special: Optional[str] = None
+    condition: Optional[Callable[[str, str], bool]] = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Names of the :class:`~vamas.vamas_block.VamasBlock` attributes"""
+        if self.special is not None:
+            return SPECIAL_NAMES[self.special]
+        return tuple(name for name, _ in self.fields)
+
+
+SPECIAL_NAMES = {
+    "block_comment": ("num_lines_block_comment", "block_comment"),
+    "values_exp_var": ("values_exp_var",),
+    "linescan_coordinates": ("linescan_coordinates",),
+    "corresponding_variables": (
+        "num_corresponding_variables",
+        "corresponding_variables",
+    ),
+    "sputtering_source": ("sputtering_source",),
+    "additional_numerical_params": (
+        "num_additional_numerical_params",
+        "additional_numerical_params",
+    ),
+}
+
+
+def _map_coordinates(experiment_mode: str, technique: str) -> bool:
+    return experiment_mode in ("MAP", "MAPD")
+
+
+def _sputtering_params(experiment_mode: str, technique: str) -> bool:
+    return experiment_mode in ("MAPDP", "MAPSVDP", "SDP", "SDPSV") or (
+        technique
+        in (
+            "SNMS energy spec",
+            "FABMS",
+            "FABMS energy spec",
+            "ISS",
+            "SIMS",
+            "SIMS energy spec",
+            "SNMS",
+        )
+    )
+
+
+def _field_of_view(experiment_mode: str, technique: str) -> bool:
+    return experiment_mode in ("MAP", "MAPDP", "MAPSV", "MAPSVDP", "SEM")
+
+
+def _linescan(experiment_mode: str, technique: str) -> bool:
+    return experiment_mode in ("MAPSV", "MAPSVDP", "SEM")
+
+
+def _differential(experiment_mode: str, technique: str) -> bool:
+    return technique == "AES diff"
+
+
+def _sputtering_source(experiment_mode: str, technique: str) -> bool:
+    return experiment_mode in ("MAPDP", "MAPSVDP", "SDP", "SDPSV") and (
+        technique in ("AES diff", "AES dir", "EDX", "ELS", "UPS", "XRF")
+    )
+
+
+# Parameters up to the technique, which the conditions of the rest depend on
+BLOCK_PREFIX = (
+    Param(None, (("block_identifier", str), ("sample_identifier", str))),
+    Param(0, (("year", int),)),
+    Param(1, (("month", int),)),
+    Param(2, (("day", int),)),
+    Param(3, (("hour", int),)),
+    Param(4, (("minute", int),)),
+    Param(5, (("second", int),)),
+    Param(6, (("num_hours_advance_gmt", float),)),
+    Param(7, special="block_comment"),
+    Param(8, (("technique", str),)),
+)
+
+BLOCK_SUFFIX = (
+    Param(
+        9,
+        (("x_coord", int_float), ("y_coord", int_float)),
+        condition=_map_coordinates,
+    ),
+    Param(10, special="values_exp_var"),
+    Param(11, (("analysis_source_label", str),)),
+    Param(
+        12,
+        (
+            ("sputtering_z", int),
+            ("sputtering_num_particles", float),
+            ("sputtering_charge", float),
+        ),
+        condition=_sputtering_params,
+    ),
+    Param(13, (("analysis_source_characteristic_energy", float),)),
+    Param(14, (("analysis_source_strength", float),)),
+    Param(
+        15,
+        (
+            ("analysis_source_beam_width_x", float),
+            ("analysis_source_beam_width_y", float),
+        ),
+    ),
+    Param(
+        16,
+        (("field_view_x", float), ("field_view_y", float)),
+        condition=_field_of_view,
+    ),
+    Param(17, special="linescan_coordinates", condition=_linescan),
+    Param(18, (("analysis_source_polar_incidence_angle", float),)),
+    Param(19, (("analysis_source_azimuth", float),)),
+    Param(20, (("analyzer_mode", str),)),
+    Param(21, (("analyzer_pass_energy_or_retard_ratio_or_mass_res", float),)),
+    Param(22, (("differential_width", float),), condition=_differential),
+    Param(23, (("magnification_analyzer_transfer_lens", float),)),
+    Param(24, (("analyzer_work_function_or_acceptance_energy", float),)),
+    Param(25, (("target_bias", float),)),
+    Param(26, (("analysis_width_x", float), ("analysis_width_y", float))),
+    Param(
+        27,
+        (
+            ("analyzer_axis_take_off_polar_angle", float),
+            ("analyzer_axis_take_off_azimuth", float),
+        ),
+    ),
+    Param(28, (("species_label", str),)),
+    Param(
+        29,
+        (
+            ("transition_or_charge_state_label", str),
+            ("charge_detected_particle", int),
+        ),
+    ),
+    Param(
+        30,
+        (
+            ("x_label", str),
+            ("x_units", str),
+            ("x_start", float),
+            ("x_step", float),
+        ),
+    ),
+    Param(31, special="corresponding_variables"),
+    Param(32, (("signal_mode", str),)),
+    Param(33, (("signal_collection_time", float),)),
+    Param(34, (("num_scans_to_compile_block", int),)),
+    Param(35, (("signal_time_correction", float),)),
+    Param(36, special="sputtering_source", condition=_sputtering_source),
+    Param(
+        37,
+        (
+            ("sample_normal_polar_angle_tilt", float),
+            ("sample_normal_tilt_azimuth", float),
+        ),
+    ),
+    Param(38, (("sample_rotation_angle", float),)),
+    Param(39, special="additional_numerical_params"),
+)
+"""Parameters after the technique, up to the number of y-values"""
+
+BLOCK_LAYOUT = BLOCK_PREFIX + BLOCK_SUFFIX
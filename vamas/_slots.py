@@ -0,0 +1,49 @@
+from dataclasses import fields
+from typing import Any, Dict, Type, TypeVar, cast
+
+T = TypeVar("T")
+
+
+def add_slots(cls: Type[T]) -> Type[T]:
+    """Recreates a dataclass with ``__slots__`` for its fields
+
+    Equivalent to ``@dataclass(slots=True)``, which is only available from
+    Python 3.10 on. Instances have no per-instance ``__dict__``. Must be
+    applied on top of the :func:`~dataclasses.dataclass` decorator.
+
+    Additional slots, e.g. for cached values, can be declared by a tuple of
+    names in ``_extra_slots`` in the class body. A ``__slots__`` declaration
+    would hide the fields from type checkers. The additional slots are not
+    part of the pickled state.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in fields(cls))
+    extra_slots = tuple(cls_dict.pop("_extra_slots", ()))
+    cls_dict["__slots__"] = field_names + extra_slots
+    for name in field_names + extra_slots:
+        # Remove the class attributes holding the default values, they would
+        # conflict with the slot descriptors
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    slotted_cls = cast(Type[T], type(cls.__name__, cls.__bases__, cls_dict))
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    if getattr(cls, "__dataclass_params__").frozen or extra_slots:
+        # The default pickle state of slotted objects is restored via
+        # setattr, which frozen dataclasses forbid, and would include the
+        # additional slots
+        setattr(slotted_cls, "__getstate__", _getstate)
+        setattr(slotted_cls, "__setstate__", _setstate)
+
+    return slotted_cls
+
+
+def _getstate(self: Any) -> Dict[str, Any]:
+    return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+def _setstate(self: Any, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
@@ -0,0 +1,125 @@
+import asyncio
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import AsyncIterator, Generator, Optional, Union, cast
+
+from .vamas import Vamas, VamasSource, iter_blocks
+from .vamas_block import VamasBlock
+from .vamas_header import VamasHeader
+
+_Item = Union[VamasHeader, VamasBlock]
+
+
+async def aload(
+    path: Union[str, Path],
+    executor: Optional[Executor] = None,
+    use_mmap: bool = False,
+) -> Vamas:
+    """Loads a vamas file without blocking the event loop
+
+    Reading and parsing run in `executor`, by default the event loop's
+    default thread pool. Since parsing is CPU-bound, a
+    :class:`~concurrent.futures.ProcessPoolExecutor` lets several files be
+    parsed in parallel. Use :class:`AsyncLoader` to limit the number of
+    concurrent loads.
+
+    Args:
+        path (Union[str, Path]): vamas file to be parsed
+        executor (Optional[Executor]): Executor running the parser.
+        use_mmap (bool): Memory-map the file, see :class:`~vamas.Vamas`.
+
+    Returns:
+        The parsed vamas file
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _load, path, use_mmap)
+
+
+async def aiter_blocks(
+    file: VamasSource,
+    executor: Optional[Executor] = None,
+    use_mmap: bool = False,
+) -> AsyncIterator[_Item]:
+    """Iterates over a vamas file block by block without blocking the loop
+
+    The asynchronous counterpart of :func:`~vamas.iter_blocks`. Each block is
+    parsed in `executor`, which must be a thread pool, while the caller
+    processes the previous one. At most one block is parsed ahead, so a slow
+    consumer holds back the parser instead of buffering the whole file.
+
+    Args:
+        file (Union[str, Path, bytes, BinaryIO]): vamas file to be parsed,
+            see :class:`~vamas.Vamas`
+        executor (Optional[Executor]): Thread pool running the parser,
+            defaults to the event loop's default executor.
+        use_mmap (bool): Memory-map the file, see :class:`~vamas.Vamas`.
+
+    Yields:
+        The header followed by the blocks of the vamas file
+    """
+    loop = asyncio.get_running_loop()
+    blocks = cast(Generator[_Item, None, None], iter_blocks(file, use_mmap))
+    pending = loop.run_in_executor(executor, _next_item, blocks)
+    try:
+        while True:
+            item = await pending
+            if item is None:
+                return
+            pending = loop.run_in_executor(executor, _next_item, blocks)
+            yield item
+    finally:
+        # Let the block being parsed ahead finish before closing the file
+        await asyncio.wait([pending])
+        await loop.run_in_executor(executor, blocks.close)
+
+
+class AsyncLoader:
+    """Loads vamas files asynchronously with a limit on concurrent loads
+
+    Meant for services which receive many files at once: at most
+    `max_concurrent` files are read and parsed at the same time, further
+    calls of :meth:`load` wait until one of them is finished. This bounds the
+    memory held by files in flight and keeps the executor queue short.
+
+    Args:
+        max_concurrent (int): Maximum number of files loaded at the same
+            time.
+        executor (Optional[Executor]): Executor running the parser, see
+            :func:`aload`.
+        use_mmap (bool): Memory-map the files, see :class:`~vamas.Vamas`.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        executor: Optional[Executor] = None,
+        use_mmap: bool = False,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.executor = executor
+        self.use_mmap = use_mmap
+        # Created on first use, so it belongs to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def load(self, path: Union[str, Path]) -> Vamas:
+        """Loads a vamas file, waiting while too many loads are in progress
+
+        Args:
+            path (Union[str, Path]): vamas file to be parsed
+
+        Returns:
+            The parsed vamas file
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        async with self._semaphore:
+            return await aload(path, self.executor, self.use_mmap)
+
+
+def _next_item(blocks: Generator[_Item, None, None]) -> Optional[_Item]:
+    # StopIteration cannot be raised through a future
+    return next(blocks, None)
+
+
+def _load(path: Union[str, Path], use_mmap: bool) -> Vamas:
+    return Vamas(path, use_mmap=use_mmap)
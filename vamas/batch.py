@@ -0,0 +1,127 @@
+import os
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, Optional, Tuple, Union
+
+from .vamas import Vamas
+
+# Files submitted to the pool per worker process ahead of the results
+_PENDING_PER_WORKER = 2
+
+
+@dataclass
+class LoadResult:
+    """Outcome of loading a single file with :func:`load_many`
+
+    Attributes:
+        path (Union[str, Path]): Path of the vamas file as passed to
+            :func:`load_many`.
+        vamas (Optional[Vamas]): Parsed vamas file, None if loading failed.
+        error (Optional[Exception]): Exception raised while loading the file,
+            e.g. :class:`~vamas.errors.FileExtensionError`,
+            :class:`~vamas.errors.VmsIdentifierError` or a `ValueError` for
+            malformed data. None if loading succeeded.
+    """
+
+    path: Union[str, Path]
+    vamas: Optional[Vamas] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was loaded without error"""
+        return self.error is None
+
+
+def load_many(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    use_mmap: bool = False,
+) -> Iterator[LoadResult]:
+    """Loads many vamas files in parallel worker processes
+
+    Parsing is CPU-bound, so the files are distributed over a process pool.
+    The y-values are sent back to the calling process as the raw bytes of
+    their ``array('d')`` buffers rather than as lists of Python floats.
+    A file that fails to load does not abort the batch, the exception is
+    reported in :attr:`LoadResult.error` instead.
+
+    Only a few files per worker are submitted ahead of the yielded results,
+    so memory usage does not grow with the number of paths. When the caller
+    stops iterating, the files which have not been started are cancelled.
+
+    Args:
+        paths (Iterable[Union[str, Path]]): vamas files to be parsed
+        workers (Optional[int]): Number of worker processes. Defaults to the
+            number of processors.
+        ordered (bool): If True, results are yielded in the order of `paths`,
+            otherwise as soon as each file is parsed.
+        use_mmap (bool): Memory-map the files, see :class:`~vamas.Vamas`.
+
+    Yields:
+        A :class:`LoadResult` for every path
+    """
+    paths = iter(paths)
+    max_pending = _PENDING_PER_WORKER * (workers or os.cpu_count() or 1)
+    pending: Deque[Tuple["Future[LoadResult]", Union[str, Path]]] = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                for path in islice(paths, max_pending - len(pending)):
+                    pending.append((_submit(executor, path, use_mmap), path))
+                if not pending:
+                    break
+
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait(
+                        [future for future, _ in pending],
+                        return_when=FIRST_COMPLETED,
+                    )
+                    done = [p for p in pending if p[0] in finished]
+                    pending = deque(p for p in pending if p[0] not in finished)
+
+                for future, path in done:
+                    yield _result(future, path)
+        finally:
+            for future, _ in pending:
+                future.cancel()
+
+
+def _submit(
+    executor: ProcessPoolExecutor, path: Union[str, Path], use_mmap: bool
+) -> "Future[LoadResult]":
+    try:
+        return executor.submit(_load, path, use_mmap)
+    except RuntimeError as e:
+        # A worker process died before, the pool accepts no more files, e.g.
+        # BrokenProcessPool. The error is reported for every remaining path.
+        future: "Future[LoadResult]" = Future()
+        future.set_exception(e)
+        return future
+
+
+def _result(future: "Future[LoadResult]", path: Union[str, Path]) -> LoadResult:
+    try:
+        return future.result()
+    except Exception as e:
+        # The worker process died, e.g. BrokenProcessPool
+        return LoadResult(path, error=e)
+
+
+def _load(path: Union[str, Path], use_mmap: bool) -> LoadResult:
+    try:
+        return LoadResult(path, vamas=Vamas(path, use_mmap=use_mmap))
+    except Exception as e:
+        return LoadResult(path, error=e)
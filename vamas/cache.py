@@ -0,0 +1,308 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from .vamas import Vamas
+
+# Increase whenever the pickled layout of VamasHeader or VamasBlock changes
+_CACHE_VERSION = 4
+
+# Rough memory usage of a block apart from its y-values
+_BLOCK_OVERHEAD = 2048
+
+
+class DiskCache:
+    """Cache of parsed vamas files in a directory of binary sidecar files
+
+    Every parsed file is stored as one sidecar file in `directory`, which
+    holds a key describing the source file followed by the pickled
+    :class:`~vamas.vamas_header.VamasHeader` and
+    :class:`~vamas.vamas_block.VamasBlock` objects. The y-values are pickled
+    as raw ``array('d')`` buffers, so loading a sidecar is much faster than
+    parsing the text file.
+
+    On :meth:`load` the key is compared against the source file's resolved
+    path, size and modification time and, if `verify_hash` is True, the
+    SHA-256 hash of its content. The file is parsed again whenever the key
+    does not match or the sidecar cannot be read. A sidecar which cannot be
+    written, e.g. in a read-only directory, is skipped. When the total size
+    of the sidecars exceeds `max_size`, the least recently used ones are
+    deleted.
+
+    Sidecars are read with :mod:`pickle`, so the cache directory must not be
+    writable by untrusted users.
+
+    Args:
+        directory (Union[str, Path]): Directory for the sidecar files, created
+            if it does not exist.
+        max_size (int): Maximum total size of the sidecar files in bytes.
+        verify_hash (bool): Also compare the content hash of the source file.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size: int = 1 << 30,
+        verify_hash: bool = False,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.verify_hash = verify_hash
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def load(self, path: Union[str, Path]) -> Vamas:
+        """Loads a vamas file from the cache, parsing it on a cache miss
+
+        Args:
+            path (Union[str, Path]): vamas file to be loaded
+
+        Returns:
+            The parsed vamas file
+        """
+        key = self._key(path)
+        sidecar = self._sidecar_path(key)
+
+        cached = self._read_sidecar(sidecar, key)
+        if cached is not None:
+            return cached
+
+        vamas = Vamas(path)
+        try:
+            self._write_sidecar(sidecar, key, vamas)
+            self._evict()
+        except OSError:
+            # E.g. a read-only cache directory or a full disk, the parsed
+            # file is returned without caching it
+            pass
+        return vamas
+
+    def clear(self) -> None:
+        """Deletes all sidecar files"""
+        for sidecar in self.directory.glob("*.vmscache"):
+            sidecar.unlink()
+
+    def _key(self, path: Union[str, Path]) -> Tuple[Any, ...]:
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        content_hash = None
+        if self.verify_hash:
+            with open(resolved, "rb") as f:
+                content_hash = _file_digest(f)
+        return (
+            _CACHE_VERSION,
+            str(resolved),
+            stat.st_size,
+            stat.st_mtime_ns,
+            content_hash,
+        )
+
+    def _sidecar_path(self, key: Tuple[Any, ...]) -> Path:
+        name = hashlib.sha256(key[1].encode()).hexdigest()
+        return self.directory / f"{name}.vmscache"
+
+    def _read_sidecar(
+        self, sidecar: Path, key: Tuple[Any, ...]
+    ) -> Optional[Vamas]:
+        try:
+            with open(sidecar, "rb") as f:
+                if pickle.load(f) != key:
+                    return None
+                header, blocks = pickle.load(f)
+        except Exception:
+            # Missing, corrupted or outdated sidecar, the file is parsed again
+            return None
+
+        # Mark as recently used for the eviction
+        try:
+            os.utime(sidecar)
+        except OSError:
+            pass
+        return Vamas._from_parts(header, blocks)
+
+    def _write_sidecar(
+        self, sidecar: Path, key: Tuple[Any, ...], vamas: Vamas
+    ) -> None:
+        # Write to a temporary file first, so concurrent readers never see a
+        # partially written sidecar
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(
+                    (vamas.header, list(vamas.blocks)),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, sidecar)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def _evict(self) -> None:
+        sidecars = []
+        total_size = 0
+        for sidecar in self.directory.glob("*.vmscache"):
+            try:
+                stat = sidecar.stat()
+            except FileNotFoundError:
+                continue
+            sidecars.append((stat.st_mtime_ns, stat.st_size, sidecar))
+            total_size += stat.st_size
+
+        sidecars.sort()
+        for _, size, sidecar in sidecars:
+            if total_size <= self.max_size:
+                break
+            try:
+                sidecar.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+def _file_digest(f: Any) -> str:
+    """SHA-256 hex digest of a binary file object, read in chunks"""
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: f.read(1 << 20), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters of a :class:`MemoryCache`
+
+    Attributes:
+        hits (int): Number of loads answered from the cache.
+        misses (int): Number of loads which parsed the file.
+        evictions (int): Number of entries removed to respect the limits.
+        entries (int): Number of currently cached files.
+        size (int): Approximate memory usage of the cached files in bytes.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size: int = 0
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache of parsed vamas files
+
+    A cached file is returned as long as its size and modification time are
+    unchanged, otherwise it is parsed again. The same :class:`~vamas.Vamas`
+    object is handed to every caller, so it must be treated as read-only.
+
+    Args:
+        max_entries (int): Maximum number of cached files.
+        max_size (int): Maximum approximate memory usage of the cached files
+            in bytes, estimated from the size of their y-values plus a fixed
+            amount per block.
+    """
+
+    def __init__(self, max_entries: int = 128, max_size: int = 1 << 30) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Vamas, int]]"
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def load(self, path: Union[str, Path]) -> Vamas:
+        """Loads a vamas file from the cache, parsing it on a cache miss
+
+        Args:
+            path (Union[str, Path]): vamas file to be loaded
+
+        Returns:
+            The parsed vamas file
+        """
+        resolved = str(Path(path).resolve())
+        stat = os.stat(resolved)
+        version = (stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            entry = self._entries.get(resolved)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(resolved)
+                self._stats.hits += 1
+                return entry[1]
+            self._stats.misses += 1
+
+        # Parse without holding the lock, so other files can be served
+        vamas = Vamas(path)
+        size = _estimate_size(vamas)
+
+        with self._lock:
+            old = self._entries.pop(resolved, None)
+            if old is not None:
+                self._stats.size -= old[2]
+            self._entries[resolved] = (version, vamas, size)
+            self._stats.size += size
+            self._evict()
+        return vamas
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+                size=self._stats.size,
+            )
+
+    def clear(self) -> None:
+        """Removes all cached files, the counters are kept"""
+        with self._lock:
+            self._entries.clear()
+            self._stats.size = 0
+
+    def _evict(self) -> None:
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or self._stats.size > self.max_size
+        ):
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._stats.size -= size
+            self._stats.evictions += 1
+
+
+memory_cache = MemoryCache()
+"""Default :class:`MemoryCache` used by :func:`open_cached`"""
+
+
+def open_cached(path: Union[str, Path]) -> Vamas:
+    """Loads a vamas file through the process-wide :data:`memory_cache`
+
+    Hot files are parsed only once per process. Limits can be adjusted via
+    ``memory_cache.max_entries`` and ``memory_cache.max_size``.
+
+    Args:
+        path (Union[str, Path]): vamas file to be loaded
+
+    Returns:
+        The parsed vamas file, shared with other callers
+    """
+    return memory_cache.load(path)
+
+
+def _estimate_size(vamas: Vamas) -> int:
+    size = 0
+    for block in vamas.blocks:
+        size += _BLOCK_OVERHEAD
+        for corres_var in block.corresponding_variables:
+            size += len(corres_var.y_values) * 8
+    return size
@@ -0,0 +1,419 @@
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .query import FIELDS, _acquisition_time, _posix
+from .scan import BlockSummary, scan_metadata
+from .vamas import _DECOMPRESSORS, Vamas
+from .vamas_block import VamasBlock
+
+# Increase whenever the tables change, the catalogue is then rebuilt
+_SCHEMA_VERSION = 1
+
+# Number of changed files scanned and stored per transaction
+_BATCH_SIZE = 256
+
+_EXTENSIONS = (".vms",) + tuple(".vms" + suffix for suffix in _DECOMPRESSORS)
+
+_HEADER_COLUMNS = [
+    "institution_identifier",
+    "instrument_model_identifier",
+    "operator_identifier",
+    "experiment_identifier",
+    "comment",
+    "experiment_mode",
+    "scan_mode",
+    "num_blocks",
+]
+
+_BLOCK_COLUMNS = [f.name for f in fields(BlockSummary)]
+
+_SELECT_COLUMNS = dict(FIELDS, analysis_source="analysis_source_label")
+
+# Column names are quoted, since "index" and "offset" are SQL keywords
+_BLOCK_COLUMN_LIST = ", ".join(f'"{name}"' for name in _BLOCK_COLUMNS)
+
+_SCHEMA = f"""
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    error TEXT,
+    {", ".join(_HEADER_COLUMNS)}
+);
+CREATE TABLE blocks (
+    file_id INTEGER NOT NULL REFERENCES files ON DELETE CASCADE,
+    {_BLOCK_COLUMN_LIST},
+    timestamp REAL,
+    PRIMARY KEY (file_id, "index")
+);
+CREATE INDEX blocks_timestamp ON blocks (timestamp);
+""" + "".join(
+    f"CREATE INDEX blocks_{name} ON blocks ({name});\n"
+    for name in _SELECT_COLUMNS.values()
+)
+
+# Changed files scanned into an error message or the rows of the file
+_ScanResult = Tuple[
+    Optional[str], Optional[Tuple[Any, ...]], List[Tuple[Any, ...]]
+]
+
+
+@dataclass
+class CatalogueUpdate:
+    """Outcome of :meth:`Catalogue.update`
+
+    Attributes:
+        added (int): Number of files which were not catalogued before.
+        updated (int): Number of files whose size or modification time
+            changed and which were scanned again.
+        unchanged (int): Number of files which were skipped.
+        removed (int): Number of catalogued files which no longer exist.
+        failed (int): Number of added or updated files which could not be
+            scanned, see :meth:`Catalogue.errors`.
+    """
+
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: int = 0
+
+
+@dataclass(frozen=True)
+class BlockRef:
+    """Reference to a block of a catalogued vamas file
+
+    Attributes:
+        path (Path): Path of the vamas file.
+        size (int): Size of the file in bytes when it was catalogued.
+        mtime_ns (int): Modification time of the file in nanoseconds when it
+            was catalogued.
+        summary (BlockSummary): Identifying parameters of the block.
+    """
+
+    path: Path
+    size: int
+    mtime_ns: int
+    summary: BlockSummary
+
+    def load(self) -> VamasBlock:
+        """Parses the referenced block, see :func:`load_blocks`"""
+        return load_blocks([self])[0]
+
+
+class Catalogue:
+    """Index of the vamas files in directory trees in an SQLite database
+
+    :meth:`update` crawls directories for vamas files, including compressed
+    ones, and stores their header and a :class:`~vamas.scan.BlockSummary`
+    of every block. Files are only scanned again if their size or
+    modification time changed. :meth:`select` then finds blocks across all
+    files without opening them, and the y-values of the results are read on
+    demand by :func:`load_blocks`.
+
+    The database holds only data derived from the files. It is rebuilt when
+    it was created by an incompatible version of this package.
+
+    Args:
+        path (Union[str, Path]): SQLite database file, created if it does
+            not exist. ':memory:' keeps the catalogue in memory.
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:") -> None:
+        self.path = path
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA foreign_keys = ON")
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+        if version != _SCHEMA_VERSION:
+            with self._db:
+                self._db.execute("DROP TABLE IF EXISTS blocks")
+                self._db.execute("DROP TABLE IF EXISTS files")
+                self._db.executescript(_SCHEMA)
+                self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def __enter__(self) -> "Catalogue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the database"""
+        self._db.close()
+
+    def update(
+        self,
+        *directories: Union[str, Path],
+        workers: Optional[int] = None,
+        use_mmap: bool = False,
+    ) -> CatalogueUpdate:
+        """Brings the catalogue up to date with the files in `directories`
+
+        The directories are crawled recursively, without following symbolic
+        links to directories. Catalogued files below the directories which
+        no longer exist are removed. Files which cannot be scanned are
+        recorded with their error and retried once they change.
+
+        Args:
+            *directories (Union[str, Path]): directories to be crawled
+            workers (Optional[int]): If given, the changed files are scanned
+                by this many worker processes.
+            use_mmap (bool): Memory-map the files while scanning, see
+                :func:`~vamas.scan.scan_metadata`.
+
+        Returns:
+            The number of added, updated, unchanged, removed and failed files
+        """
+        result = CatalogueUpdate()
+        executor = None if workers is None else ProcessPoolExecutor(workers)
+        try:
+            for directory in directories:
+                self._update_directory(
+                    Path(directory).resolve(), result, executor, use_mmap
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        return result
+
+    def select(
+        self,
+        species: Optional[str] = None,
+        transition: Optional[str] = None,
+        technique: Optional[str] = None,
+        sample: Optional[str] = None,
+        analysis_source: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[BlockRef]:
+        """Returns references to the blocks matching all given criteria
+
+        For example ``select(species="Au", transition="4f",
+        analysis_source="Al", start=datetime(2021, 1, 1),
+        end=datetime(2022, 1, 1))``.
+
+        Args:
+            species (Optional[str]): Species label.
+            transition (Optional[str]): Transition or charge state label.
+            technique (Optional[str]): Measurement technique.
+            sample (Optional[str]): Sample identifier.
+            analysis_source (Optional[str]): Label of the analysis source.
+            start (Optional[datetime]): Earliest acquisition time, inclusive,
+                see :meth:`BlockQuery.select <vamas.query.BlockQuery.select>`.
+            end (Optional[datetime]): Latest acquisition time, exclusive.
+
+        Returns:
+            The matching blocks ordered by path and position in the file
+        """
+        criteria = {
+            "species": species,
+            "transition": transition,
+            "technique": technique,
+            "sample": sample,
+            "analysis_source": analysis_source,
+        }
+        conditions = []
+        args: List[Any] = []
+        for key, value in criteria.items():
+            if value is not None:
+                conditions.append(f"blocks.{_SELECT_COLUMNS[key]} = ?")
+                args.append(value)
+        if start is not None:
+            conditions.append("blocks.timestamp >= ?")
+            args.append(_posix(start))
+        if end is not None:
+            conditions.append("blocks.timestamp < ?")
+            args.append(_posix(end))
+
+        columns = ", ".join(f'blocks."{name}"' for name in _BLOCK_COLUMNS)
+        where = " AND ".join(conditions) or "1"
+        rows = self._db.execute(
+            f"SELECT files.path, files.size, files.mtime_ns, {columns} "
+            "FROM blocks JOIN files ON blocks.file_id = files.id "
+            f'WHERE {where} ORDER BY files.path, blocks."index"',
+            args,
+        )
+        return [
+            BlockRef(Path(path), size, mtime_ns, BlockSummary(*summary))
+            for path, size, mtime_ns, *summary in rows
+        ]
+
+    def errors(self) -> Dict[Path, str]:
+        """Returns the files which could not be scanned and their errors"""
+        rows = self._db.execute(
+            "SELECT path, error FROM files WHERE error IS NOT NULL"
+        )
+        return {Path(path): error for path, error in rows}
+
+    def __len__(self) -> int:
+        """Number of catalogued files"""
+        (count,) = self._db.execute("SELECT count(*) FROM files").fetchone()
+        return count
+
+    def _update_directory(
+        self,
+        directory: Path,
+        result: CatalogueUpdate,
+        executor: Optional[ProcessPoolExecutor],
+        use_mmap: bool,
+    ) -> None:
+        db = self._db
+        db.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS seen (path TEXT PRIMARY KEY)"
+        )
+        db.execute("DELETE FROM seen")
+
+        files = _crawl(directory)
+        while True:
+            batch = list(islice(files, _BATCH_SIZE))
+            if not batch:
+                break
+            db.executemany(
+                "INSERT OR IGNORE INTO seen VALUES (?)",
+                [(path,) for path, _, _ in batch],
+            )
+
+            changed = []
+            for path, size, mtime_ns in batch:
+                row = db.execute(
+                    "SELECT size, mtime_ns FROM files WHERE path = ?", (path,)
+                ).fetchone()
+                if row is None:
+                    result.added += 1
+                elif row != (size, mtime_ns):
+                    result.updated += 1
+                else:
+                    result.unchanged += 1
+                    continue
+                changed.append((path, size, mtime_ns))
+
+            paths = [path for path, _, _ in changed]
+            if executor is None:
+                scanned: Iterable[_ScanResult] = (
+                    _scan(p, use_mmap) for p in paths
+                )
+            else:
+                scanned = executor.map(_scan, paths, [use_mmap] * len(paths))
+            with db:
+                for (path, size, mtime_ns), (error, header, blocks) in zip(
+                    changed, scanned
+                ):
+                    result.failed += error is not None
+                    self._store(path, size, mtime_ns, error, header, blocks)
+
+        # All paths below the directory sort between these bounds
+        prefix = os.path.join(directory, "")
+        bound = prefix[:-1] + chr(ord(os.sep) + 1)
+        with db:
+            cursor = db.execute(
+                "DELETE FROM files WHERE path >= ? AND path < ? "
+                "AND path NOT IN (SELECT path FROM seen)",
+                (prefix, bound),
+            )
+        result.removed += cursor.rowcount
+
+    def _store(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        error: Optional[str],
+        header: Optional[Tuple[Any, ...]],
+        blocks: List[Tuple[Any, ...]],
+    ) -> None:
+        db = self._db
+        db.execute("DELETE FROM files WHERE path = ?", (path,))
+        file_id = db.execute(
+            f"INSERT INTO files (path, size, mtime_ns, error, "
+            f"{', '.join(_HEADER_COLUMNS)}) "
+            f"VALUES (?, ?, ?, ?, {', '.join('?' * len(_HEADER_COLUMNS))})",
+            (path, size, mtime_ns, error)
+            + (header or (None,) * len(_HEADER_COLUMNS)),
+        ).lastrowid
+        placeholders = ", ".join("?" * (len(_BLOCK_COLUMNS) + 2))
+        db.executemany(
+            f"INSERT INTO blocks (file_id, {_BLOCK_COLUMN_LIST}, timestamp) "
+            f"VALUES ({placeholders})",
+            [(file_id,) + block for block in blocks],
+        )
+
+
+def load_blocks(refs: Sequence[BlockRef]) -> List[VamasBlock]:
+    """Parses the referenced blocks
+
+    Every file is opened once for all of its referenced blocks, and only the
+    y-values of these blocks are read, see :class:`~vamas.vamas.LazyBlocks`.
+
+    Args:
+        refs (Sequence[BlockRef]): blocks returned by :meth:`Catalogue.select`
+
+    Returns:
+        The blocks in the order of `refs`
+
+    Raises:
+        ValueError: if a file changed since it was catalogued, so the
+            references may no longer be valid
+    """
+    files: Dict[Path, Vamas] = {}
+    blocks = []
+    for ref in refs:
+        vamas = files.get(ref.path)
+        if vamas is None:
+            stat = ref.path.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (ref.size, ref.mtime_ns):
+                raise ValueError(f"{ref.path} changed since it was catalogued")
+            vamas = files[ref.path] = Vamas(ref.path, lazy=True)
+        blocks.append(vamas.blocks[ref.summary.index])
+    return blocks
+
+
+def _crawl(directory: Path) -> Iterator[Tuple[str, int, int]]:
+    """Yields path, size and modification time of the vamas files"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _crawl(Path(entry.path))
+            elif entry.name.endswith(_EXTENSIONS) and entry.is_file():
+                stat = entry.stat()
+                yield entry.path, stat.st_size, stat.st_mtime_ns
+
+
+def _scan(path: str, use_mmap: bool) -> _ScanResult:
+    """Scans a file into rows of the catalogue"""
+    try:
+        header, summaries = scan_metadata(path, use_mmap=use_mmap)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", None, []
+
+    header_row = tuple(getattr(header, name) for name in _HEADER_COLUMNS)
+    block_rows = []
+    for summary in summaries:
+        row = tuple(getattr(summary, name) for name in _BLOCK_COLUMNS)
+        time = _acquisition_time(
+            summary.year,
+            summary.month,
+            summary.day,
+            summary.hour,
+            summary.minute,
+            summary.second,
+            summary.num_hours_advance_gmt,
+        )
+        block_rows.append(row + (None if time is None else time.timestamp(),))
+    return None, header_row, block_rows
@@ -0,0 +1,200 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+from .vamas import Vamas
+from .vamas_block import (
+    AdditionalNumericalParam,
+    CorrespondingVariable,
+    LinescanCoordinates,
+    SputteringSource,
+    VamasBlock,
+    YValues,
+)
+from .vamas_header import (
+    ExperimentVariable,
+    FutureUpgradeExperimentEntry,
+    IncludeMask,
+    VamasHeader,
+)
+
+MAGIC = b"VAMASCOL"
+VERSION = 1
+
+# magic, version, offset of the data section, length of the metadata
+_PREAMBLE = struct.Struct("<8sIQQ")
+_ALIGNMENT = 8
+
+
+def export_columnar(vamas: Vamas, path: Union[str, Path]) -> None:
+    """Writes a parsed vamas file into a binary columnar container
+
+    The container starts with a fixed-size preamble followed by a JSON
+    document with the header and a table of the block parameters, one column
+    per parameter. After that, the y-values of every corresponding variable
+    are stored as contiguous little-endian float64 columns, aligned to
+    8 bytes, so they can be memory-mapped by :func:`load_columnar`.
+
+    Args:
+        vamas (Vamas): parsed vamas file
+        path (Union[str, Path]): file to write the container to
+    """
+    blocks = list(vamas.blocks)
+
+    columns: List[Any] = []
+    data_size = 0
+    table: Dict[str, List[Any]] = {f.name: [] for f in fields(VamasBlock)}
+    for block in blocks:
+        for field in fields(block):
+            value = getattr(block, field.name)
+            if field.name == "corresponding_variables":
+                value = []
+                for corres_var in block.corresponding_variables:
+                    y_values = corres_var.y_values
+                    value.append(
+                        {
+                            "label": corres_var.label,
+                            "unit": corres_var.unit,
+                            "y_min": corres_var.y_min,
+                            "y_max": corres_var.y_max,
+                            "offset": data_size,
+                            "length": len(y_values),
+                        }
+                    )
+                    columns.append(y_values)
+                    data_size += len(y_values) * 8
+            table[field.name].append(_to_json(value))
+
+    metadata = json.dumps(
+        {"header": _to_json(vamas.header), "blocks": table},
+        separators=(",", ":"),
+    ).encode()
+    data_offset = _align(_PREAMBLE.size + len(metadata))
+
+    with open(path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, data_offset, len(metadata)))
+        f.write(metadata)
+        f.write(b"\0" * (data_offset - _PREAMBLE.size - len(metadata)))
+        for column in columns:
+            if sys.byteorder != "little" or not isinstance(column, array):
+                column = array("d", column)
+                if sys.byteorder != "little":
+                    column.byteswap()
+            f.write(column)
+
+
+def load_columnar(path: Union[str, Path], copy: bool = False) -> Vamas:
+    """Loads a container written by :func:`export_columnar`
+
+    The file is memory-mapped and, unless `copy` is True, the y-values are
+    returned as float64 :class:`memoryview` objects pointing directly into
+    the mapped file. They support indexing, slicing, iteration and
+    ``tolist()`` like ``array('d')``, and
+    :meth:`~vamas.vamas_block.CorrespondingVariable.to_numpy` wraps them
+    without copying. The mapping stays open as long as any of them is alive.
+
+    Args:
+        path (Union[str, Path]): container written by :func:`export_columnar`
+        copy (bool): If True, the y-values are copied into ``array('d')``
+            objects and the file is closed right away.
+
+    Returns:
+        The vamas file with the same header and blocks as the exported one
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, data_offset, metadata_length = _PREAMBLE.unpack_from(mm)
+    if magic != MAGIC:
+        mm.close()
+        raise ValueError("The file is not a columnar vamas container")
+    if version != VERSION:
+        mm.close()
+        raise ValueError(f"Unsupported container version {version}")
+
+    metadata = json.loads(
+        mm[_PREAMBLE.size : _PREAMBLE.size + metadata_length].decode()
+    )
+    data = memoryview(mm)[data_offset:]
+    # A plain cast needs native byte order, otherwise the values are copied
+    copy = copy or sys.byteorder != "little"
+
+    def column(offset: int, length: int) -> Any:
+        values = data[offset : offset + length * 8]
+        if not copy:
+            return values.cast("d")
+        copied = YValues(values.tobytes())
+        if sys.byteorder != "little":
+            copied.byteswap()
+        return copied
+
+    header = _header_from_json(metadata["header"])
+    table = metadata["blocks"]
+    names = list(table)
+    blocks = []
+    for row in zip(*(table[name] for name in names)):
+        params = dict(zip(names, row))
+        params["corresponding_variables"] = [
+            CorrespondingVariable(
+                label=c["label"],
+                unit=c["unit"],
+                y_values=column(c["offset"], c["length"]),
+                y_min=c["y_min"],
+                y_max=c["y_max"],
+            )
+            for c in params["corresponding_variables"]
+        ]
+        params["additional_numerical_params"] = [
+            AdditionalNumericalParam(**p)
+            for p in params["additional_numerical_params"]
+        ]
+        if params["linescan_coordinates"] is not None:
+            params["linescan_coordinates"] = LinescanCoordinates(
+                **params["linescan_coordinates"]
+            )
+        if params["sputtering_source"] is not None:
+            params["sputtering_source"] = SputteringSource(
+                **params["sputtering_source"]
+            )
+        blocks.append(VamasBlock(**params))
+
+    if copy:
+        data.release()
+        mm.close()
+
+    return Vamas._from_parts(header, blocks)
+
+
+def _to_json(value: Any) -> Any:
+    """Converts dataclasses into JSON compatible dictionaries"""
+    if hasattr(value, "__dataclass_fields__"):
+        return {f.name: _to_json(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, list):
+        return [_to_json(v) for v in value]
+    if isinstance(value, IncludeMask):
+        return int(value)
+    return value
+
+
+def _header_from_json(h: Dict[str, Any]) -> VamasHeader:
+    h = dict(h)
+    h["block_params_includes"] = IncludeMask(h["block_params_includes"])
+    if h["experiment_variables"] is not None:
+        h["experiment_variables"] = [
+            ExperimentVariable(**v) for v in h["experiment_variables"]
+        ]
+    if h["future_upgrade_experiment_entries"] is not None:
+        h["future_upgrade_experiment_entries"] = [
+            FutureUpgradeExperimentEntry(**e)
+            for e in h["future_upgrade_experiment_entries"]
+        ]
+    return VamasHeader(**h)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
@@ -1,12 +1,32 @@
+from typing import Tuple, Type
+
+
 class FileExtensionError(Exception):
     def __init__(self) -> None:
         message = (
-            "The file is not a vamas file, file extension needs to be '.vms'"
+            "The file is not a vamas file, file extension needs to be '.vms', "
+            "optionally followed by '.gz', '.bz2', '.xz' or '.zst'"
         )
         super().__init__(message)
 
+    def __reduce__(self) -> Tuple[Type[Exception], Tuple[()]]:
+        return (type(self), ())
+
 
 class VmsIdentifierError(Exception):
     def __init__(self) -> None:
         message = "The file does not contain the correct vamas identifier"
         super().__init__(message)
+
+    def __reduce__(self) -> Tuple[Type[Exception], Tuple[()]]:
+        return (type(self), ())
+
+
+class UnexpectedEndOfFileError(ValueError):
+    def __init__(self, section: str) -> None:
+        message = f"Unexpected end of file in {section}"
+        super().__init__(message)
+        self.section = section
+
+    def __reduce__(self) -> Tuple[Type[Exception], Tuple[str]]:
+        return (type(self), (self.section,))
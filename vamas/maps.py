@@ -0,0 +1,220 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from ._slots import add_slots
+from .vamas import (
+    VamasSource,
+    _BlockReader,
+    _make_opener,
+    _read_header,
+)
+from .vamas_block import VamasBlock
+from .vamas_header import VamasHeader
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@add_slots
+@dataclass
+class MapRegion:
+    """Data cube of one spectral region of a map
+
+    The blocks of a map are assigned to a region by their
+    :attr:`~vamas.vamas_block.VamasBlock.species_label`,
+    :attr:`~vamas.vamas_block.VamasBlock.transition_or_charge_state_label`
+    and abscissa, i.e. blocks measured at different analysis positions with
+    the same settings form one region.
+
+    Attributes:
+        species_label (str): Label of the species.
+        transition_or_charge_state_label (str): Label of the transition or
+            charge state.
+        x_label (str): Label of the abscissa.
+        x_units (str): Units of the abscissa.
+        x_start (float): Abscissa start.
+        x_step (float): Abscissa increment.
+        data (np.ndarray): float64 array of shape ``(num_y_coords,
+            num_x_coords, num_values)`` indexed by the map coordinates minus
+            one. Positions without a block are NaN.
+    """
+
+    species_label: str
+    transition_or_charge_state_label: str
+    x_label: str
+    x_units: str
+    x_start: float
+    x_step: float
+    data: "np.ndarray"
+
+
+def read_map(
+    file: VamasSource,
+    corresponding_variable: int = 0,
+    use_mmap: bool = False,
+) -> Tuple[VamasHeader, List[MapRegion]]:
+    """Reads a **MAP** or **MAPD** experiment into data cubes
+
+    The y-values of every block are written directly into a preallocated
+    (y, x, energy) array at the block's
+    :attr:`~vamas.vamas_block.VamasBlock.x_coord` and
+    :attr:`~vamas.vamas_block.VamasBlock.y_coord`, so no
+    :class:`~vamas.vamas_block.VamasBlock` objects are created.
+    Requires the optional dependency NumPy.
+
+    Args:
+        file (Union[str, Path, bytes, BinaryIO]): vamas file to be read,
+            see :class:`~vamas.Vamas`
+        corresponding_variable (int): Index of the corresponding variable
+            providing the y-values.
+        use_mmap (bool): Memory-map the file, see :class:`~vamas.Vamas`.
+
+    Returns:
+        The :class:`~vamas.vamas_header.VamasHeader` and a
+        :class:`MapRegion` for every spectral region, in order of appearance
+
+    Raises:
+        ValueError: if the file is not a map or a block lies outside of the
+            map
+    """
+    import numpy as np
+
+    with _make_opener(file, use_mmap)() as f:
+        header = _read_header(f)
+        if header.experiment_mode not in ["MAP", "MAPD"]:
+            raise ValueError(
+                f"Experiment mode {header.experiment_mode!r} is not a map"
+            )
+        num_x = header.num_discrete_x_coords_in_full_map
+        num_y = header.num_discrete_y_coords_in_full_map
+        assert num_x is not None and num_y is not None
+
+        regions: Dict[Tuple[Any, ...], MapRegion] = {}
+        reader = _BlockReader(header, f._encoding)
+        for _ in range(header.num_blocks):
+            b = reader.read(f)
+
+            num_y_values = b["num_y_values"]
+            num_corres_vars = b["num_corresponding_variables"]
+            num_values = num_y_values // num_corres_vars
+            key = (
+                b["species_label"],
+                b["transition_or_charge_state_label"],
+                b["x_start"],
+                b["x_step"],
+                num_values,
+            )
+            region = regions.get(key)
+            if region is None:
+                region = regions[key] = MapRegion(
+                    species_label=b["species_label"],
+                    transition_or_charge_state_label=b[
+                        "transition_or_charge_state_label"
+                    ],
+                    x_label=b["x_label"],
+                    x_units=b["x_units"],
+                    x_start=b["x_start"],
+                    x_step=b["x_step"],
+                    data=np.full((num_y, num_x, num_values), np.nan),
+                )
+
+            x, y = b["x_coord"] - 1, b["y_coord"] - 1
+            if not (0 <= x < num_x and 0 <= y < num_y):
+                raise ValueError(
+                    f"Block {b['block_identifier']!r} at ({x + 1}, {y + 1}) "
+                    f"lies outside of the {num_x}x{num_y} map"
+                )
+
+            ordinates = f.read_floats(num_y_values)
+            if len(ordinates) != num_y_values:
+                raise ValueError(
+                    f"Expected {num_y_values} y-values, found {len(ordinates)}"
+                )
+            # De-interleave the selected corresponding variable in place
+            stop = num_values * num_corres_vars
+            region.data[y, x] = np.frombuffer(ordinates)[
+                corresponding_variable:stop:num_corres_vars
+            ]
+
+    return header, list(regions.values())
+
+
+def reshape_linescan(
+    block: VamasBlock, corresponding_variable: int = 0
+) -> "np.ndarray":
+    """Arranges the y-values of a linescan block as image
+
+    For the experiment modes **MAPSV**, **MAPSVDP** and **SEM**, the
+    y-values of a block are recorded line by line as described by its
+    :attr:`~vamas.vamas_block.VamasBlock.linescan_coordinates`. The first
+    linescan determines the length and direction of the lines, the finish of
+    the last linescan the number of lines and the direction in which they
+    advance. Lines may be horizontal or vertical and run in either
+    direction.
+
+    The y-values are viewed in scan order, flipped and transposed as needed
+    and copied once into a C-contiguous array. Requires the optional
+    dependency NumPy.
+
+    Args:
+        block (VamasBlock): block with linescan coordinates
+        corresponding_variable (int): Index of the corresponding variable
+            providing the y-values.
+
+    Returns:
+        A float64 array of shape ``(num_y_coords, num_x_coords)``, where
+        ``[0, 0]`` is the scanned position with the smallest x and y
+        coordinates, i.e. the top left corner of the scanned area
+
+    Raises:
+        ValueError: if the block has no linescan coordinates, the lines are
+            neither horizontal nor vertical or the number of y-values does not
+            match the coordinates
+    """
+    import numpy as np
+
+    c = block.linescan_coordinates
+    if c is None:
+        raise ValueError(
+            f"Block {block.block_identifier!r} has no linescan coordinates"
+        )
+
+    start_x, start_y = c.first_linescan_start_x, c.first_linescan_start_y
+    finish_x, finish_y = c.first_linescan_finish_x, c.first_linescan_finish_y
+    last_x, last_y = c.last_linescan_finish_x, c.last_linescan_finish_y
+
+    if start_y == finish_y:
+        # Horizontal lines advancing along y
+        line_step, line_length = finish_x - start_x, abs(finish_x - start_x) + 1
+        advance, num_lines = last_y - start_y, abs(last_y - start_y) + 1
+        vertical = False
+    elif start_x == finish_x:
+        # Vertical lines advancing along x
+        line_step, line_length = finish_y - start_y, abs(finish_y - start_y) + 1
+        advance, num_lines = last_x - start_x, abs(last_x - start_x) + 1
+        vertical = True
+    else:
+        raise ValueError(
+            f"Block {block.block_identifier!r}: the linescans are neither "
+            "horizontal nor vertical"
+        )
+
+    y_values = block.corresponding_variables[corresponding_variable].y_values
+    if len(y_values) != line_length * num_lines:
+        raise ValueError(
+            f"Block {block.block_identifier!r}: expected "
+            f"{line_length * num_lines} y-values for {num_lines} linescans of "
+            f"{line_length} points, found {len(y_values)}"
+        )
+
+    # Only views up to here, the single copy is made at the end
+    scan = np.frombuffer(y_values, dtype=np.float64).reshape(
+        num_lines, line_length
+    )
+    if line_step < 0:
+        scan = scan[:, ::-1]
+    if advance < 0:
+        scan = scan[::-1, :]
+    if vertical:
+        scan = scan.T
+    return np.array(scan, order="C")
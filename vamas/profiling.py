@@ -0,0 +1,127 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+PHASES = ["header", "block_params", "ordinates", "construction"]
+"""Phases of the parser, in the order they occur
+
+- ``header``: parsing the file header
+- ``block_params``: parsing the parameters of a block
+- ``ordinates``: converting the y-values of a block to floats and assigning
+  them to its corresponding variables
+- ``construction``: creating the :class:`~vamas.vamas_block.VamasBlock`
+"""
+
+
+@dataclass
+class PhaseStats:
+    """Time spent in a phase of the parser
+
+    Attributes:
+        wall_time (float): Elapsed wall-clock time in seconds.
+        cpu_time (float): CPU time of the process in seconds.
+    """
+
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+
+    def add(self, wall_time: float, cpu_time: float) -> None:
+        self.wall_time += wall_time
+        self.cpu_time += cpu_time
+
+
+@dataclass
+class BlockStats:
+    """Statistics of a single parsed block
+
+    Attributes:
+        index (int): Position of the block in the file, starting at zero.
+        bytes_read (int): Number of bytes of the block.
+        lines (int): Number of lines of the block.
+        num_y_values (int): Number of y-values of the block.
+        phases (Dict[str, PhaseStats]): Time per phase, for the phases
+            ``block_params``, ``ordinates`` and ``construction``.
+    """
+
+    index: int
+    bytes_read: int
+    lines: int
+    num_y_values: int
+    phases: Dict[str, PhaseStats]
+
+    @property
+    def wall_time(self) -> float:
+        """Total wall-clock time spent on the block in seconds"""
+        return sum(p.wall_time for p in self.phases.values())
+
+
+@dataclass
+class ParseStats:
+    """Opt-in statistics of the parser
+
+    Passed as `stats` to :class:`~vamas.Vamas` or :func:`~vamas.iter_blocks`
+    and filled while the file is parsed. Parsing without a stats object
+    takes a separate code path, so there is no overhead when it is not used.
+    Time spent by the caller between the blocks yielded by
+    :func:`~vamas.iter_blocks` is not counted.
+
+    Args:
+        on_block (Optional[Callable[[BlockStats], None]]): Called with the
+            statistics of every block as soon as it is parsed, e.g. to feed
+            a monitoring system.
+        keep_blocks (bool): Keep the statistics of every block in
+            :attr:`blocks`. Disable to collect only the totals of very large
+            files.
+
+    Attributes:
+        bytes_read (int): Number of bytes consumed by the parser.
+        lines (int): Number of lines consumed by the parser.
+        blocks_parsed (int): Number of parsed blocks.
+        phases (Dict[str, PhaseStats]): Total time per phase, see
+            :data:`PHASES`.
+        blocks (List[BlockStats]): Statistics of every parsed block.
+    """
+
+    on_block: Optional[Callable[[BlockStats], None]] = None
+    keep_blocks: bool = True
+    bytes_read: int = 0
+    lines: int = 0
+    blocks_parsed: int = 0
+    phases: Dict[str, PhaseStats] = field(
+        default_factory=lambda: {phase: PhaseStats() for phase in PHASES}
+    )
+    blocks: List[BlockStats] = field(default_factory=list)
+
+    @property
+    def wall_time(self) -> float:
+        """Total wall-clock time spent in the parser in seconds"""
+        return sum(p.wall_time for p in self.phases.values())
+
+    @property
+    def cpu_time(self) -> float:
+        """Total CPU time spent in the parser in seconds"""
+        return sum(p.cpu_time for p in self.phases.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Totals as flat dictionary of numbers, e.g. for metrics exporters"""
+        d: Dict[str, Any] = {
+            "bytes_read": self.bytes_read,
+            "lines": self.lines,
+            "blocks_parsed": self.blocks_parsed,
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+        }
+        for name, phase in self.phases.items():
+            d[f"{name}_wall_time"] = phase.wall_time
+            d[f"{name}_cpu_time"] = phase.cpu_time
+        return d
+
+    def _add_block(self, block: BlockStats) -> None:
+        self.bytes_read += block.bytes_read
+        self.lines += block.lines
+        self.blocks_parsed += 1
+        for name, phase in block.phases.items():
+            self.phases[name].add(phase.wall_time, phase.cpu_time)
+        if self.keep_blocks:
+            self.blocks.append(block)
+        if self.on_block is not None:
+            self.on_block(block)
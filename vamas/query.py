@@ -0,0 +1,174 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .vamas_block import VamasBlock
+
+FIELDS = {
+    "species": "species_label",
+    "transition": "transition_or_charge_state_label",
+    "technique": "technique",
+    "sample": "sample_identifier",
+}
+"""Keyword arguments of :meth:`BlockQuery.select` and the block parameters
+they match"""
+
+_TIME_PARAMS = (
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "second",
+    "num_hours_advance_gmt",
+)
+
+
+class BlockQuery:
+    """Indexes over the block parameters of a vamas experiment
+
+    Looks up blocks by the parameters in :data:`FIELDS` and by their
+    acquisition time. The hash index of a parameter and the sorted index of
+    the acquisition times are built on first use, so a lookup takes constant
+    or logarithmic time instead of a scan over all blocks.
+
+    For :class:`~vamas.vamas.LazyBlocks` the indexes are built from the
+    parsed block parameters, without reading any y-values. The indexes are
+    rebuilt when blocks are added or removed, but not when the parameters
+    of a block are changed.
+
+    Args:
+        blocks (Sequence[VamasBlock]): blocks to be indexed
+    """
+
+    def __init__(self, blocks: Sequence[VamasBlock]) -> None:
+        self.blocks = blocks
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self._times: Optional[Tuple[List[float], List[int]]] = None
+        self._num_blocks = len(blocks)
+
+    def select(
+        self,
+        species: Optional[str] = None,
+        transition: Optional[str] = None,
+        technique: Optional[str] = None,
+        sample: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[int]:
+        """Returns the positions of the blocks matching all given criteria
+
+        Args:
+            species (Optional[str]): Species label, e.g. 'C'.
+            transition (Optional[str]): Transition or charge state label,
+                e.g. '1s'.
+            technique (Optional[str]): Measurement technique, e.g. 'XPS'.
+            sample (Optional[str]): Sample identifier.
+            start (Optional[datetime]): Earliest acquisition time, inclusive.
+                Naive datetimes are taken as UTC.
+            end (Optional[datetime]): Latest acquisition time, exclusive.
+                Naive datetimes are taken as UTC.
+
+        Returns:
+            Positions of the matching blocks in ascending order. Blocks
+            without a valid acquisition time never match `start` or `end`.
+        """
+        if len(self.blocks) != self._num_blocks:
+            self._indexes.clear()
+            self._times = None
+            self._num_blocks = len(self.blocks)
+
+        criteria = {
+            "species": species,
+            "transition": transition,
+            "technique": technique,
+            "sample": sample,
+        }
+        candidates = [
+            self._index(FIELDS[key]).get(value, [])
+            for key, value in criteria.items()
+            if value is not None
+        ]
+        if start is not None or end is not None:
+            candidates.append(self._time_range(start, end))
+
+        if not candidates:
+            return list(range(len(self.blocks)))
+
+        candidates.sort(key=len)
+        selected = candidates[0]
+        for other in candidates[1:]:
+            members = set(other)
+            selected = [i for i in selected if i in members]
+        return sorted(selected)
+
+    def _index(self, name: str) -> Dict[Any, List[int]]:
+        index = self._indexes.get(name)
+        if index is None:
+            index = {}
+            for i, value in enumerate(self._column(name)):
+                index.setdefault(value, []).append(i)
+            self._indexes[name] = index
+        return index
+
+    def _time_range(
+        self, start: Optional[datetime], end: Optional[datetime]
+    ) -> List[int]:
+        if self._times is None:
+            columns = zip(*(self._column(name) for name in _TIME_PARAMS))
+            pairs = sorted(
+                (t.timestamp(), i)
+                for i, t in enumerate(_acquisition_time(*c) for c in columns)
+                if t is not None
+            )
+            self._times = ([t for t, _ in pairs], [i for _, i in pairs])
+
+        times, positions = self._times
+        lo = 0 if start is None else bisect_left(times, _posix(start))
+        hi = len(times) if end is None else bisect_left(times, _posix(end))
+        return positions[lo:hi]
+
+    def _column(self, name: str) -> List[Any]:
+        """Values of the block parameter `name` of every block"""
+        from .vamas import LazyBlocks
+
+        if isinstance(self.blocks, LazyBlocks):
+            return [entry.params[name] for entry in self.blocks.entries]
+        return [getattr(block, name) for block in self.blocks]
+
+
+def acquisition_time(block: VamasBlock) -> Optional[datetime]:
+    """Returns the time a block was measured at as timezone-aware datetime
+
+    Args:
+        block (VamasBlock): measured block
+
+    Returns:
+        The time given by :attr:`~vamas.vamas_block.VamasBlock.year` to
+        :attr:`~vamas.vamas_block.VamasBlock.second` in the timezone given
+        by :attr:`~vamas.vamas_block.VamasBlock.num_hours_advance_gmt`, or
+        None if they do not form a valid time
+    """
+    return _acquisition_time(*(getattr(block, name) for name in _TIME_PARAMS))
+
+
+def _acquisition_time(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    num_hours_advance_gmt: float,
+) -> Optional[datetime]:
+    try:
+        tz = timezone(timedelta(hours=num_hours_advance_gmt))
+        return datetime(year, month, day, hour, minute, second, tzinfo=tz)
+    except (ValueError, OverflowError):
+        return None
+
+
+def _posix(t: datetime) -> float:
+    if t.tzinfo is None:
+        t = t.replace(tzinfo=timezone.utc)
+    return t.timestamp()
@@ -0,0 +1,100 @@
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Tuple
+
+from ._slots import add_slots
+from .vamas import VamasSource, _index_vamas, _make_opener
+from .vamas_header import VamasHeader
+
+
+@add_slots
+@dataclass(frozen=True)
+class BlockSummary:
+    """Identifying parameters of a block, without its y-values
+
+    The attributes have the same meaning as the ones of
+    :class:`~vamas.vamas_block.VamasBlock` with the same name.
+
+    Attributes:
+        index (int): Position of the block in the file, starting at zero.
+        offset (int): Byte offset of the start of the block in the file.
+        block_identifier (str): Identifier of the block.
+        sample_identifier (str): Identifier of the sample.
+        technique (str): Measurement Technique.
+        year (int): Year of the measurement.
+        month (int): Month of the measurement.
+        day (int): Day of the measurement.
+        hour (int): Hour as part of the measurement time.
+        minute (int): Minute as part of the measurement time.
+        second (int): Second as part of the measurement time.
+        num_hours_advance_gmt (float): Number of hours in advance of Greenwich
+            Mean Time.
+        analysis_source_label (str): Label of the Analysis source.
+        analysis_source_characteristic_energy (float): Characteristic energy
+            of the analysis source in electron volts.
+        species_label (str): Label of the species.
+        transition_or_charge_state_label (str): Label of the transition or
+            charge state.
+        num_y_values (int): Number of y-values.
+    """
+
+    index: int
+    offset: int
+    block_identifier: str
+    sample_identifier: str
+    technique: str
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int
+    second: int
+    num_hours_advance_gmt: float
+    analysis_source_label: str
+    analysis_source_characteristic_energy: float
+    species_label: str
+    transition_or_charge_state_label: str
+    num_y_values: int
+
+    @classmethod
+    def _from_params(
+        cls, index: int, offset: int, params: Dict[str, Any]
+    ) -> "BlockSummary":
+        return cls(
+            index,
+            offset,
+            *(params[name] for name in _SUMMARY_PARAMS),
+        )
+
+
+_SUMMARY_PARAMS = [
+    f.name for f in fields(BlockSummary) if f.name not in ("index", "offset")
+]
+
+
+def scan_metadata(
+    file: VamasSource, use_mmap: bool = False
+) -> Tuple[VamasHeader, List[BlockSummary]]:
+    """Reads the header and a summary of every block of a vamas file
+
+    The y-values are skipped by their line count without converting them to
+    floats, which makes this much faster than :class:`~vamas.Vamas` for
+    indexing large archives.
+
+    Args:
+        file (Union[str, Path, bytes, BinaryIO]): vamas file to be scanned,
+            see :class:`~vamas.Vamas`
+        use_mmap (bool): Memory-map the file, which makes skipping the
+            y-values considerably faster, see :class:`~vamas.Vamas`.
+
+    Returns:
+        The :class:`~vamas.vamas_header.VamasHeader` and a
+        :class:`BlockSummary` for every block
+    """
+    opener = _make_opener(file, use_mmap)
+    with opener() as f:
+        header, blocks = _index_vamas(f, opener)
+
+    return header, [
+        BlockSummary._from_params(i, entry.offset, entry.params)
+        for i, entry in enumerate(blocks.entries)
+    ]
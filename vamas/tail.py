@@ -0,0 +1,122 @@
+import io
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .errors import FileExtensionError, UnexpectedEndOfFileError
+from .vamas import (
+    Vamas,
+    _BlockReader,
+    _LineReader,
+    _assign_ordinates,
+    _read_header,
+)
+from .vamas_block import VamasBlock
+from .vamas_header import VamasHeader
+
+
+class TailReader:
+    """Incremental reader for a vamas file which is still being written
+
+    Every call of :meth:`refresh` reads only the bytes appended since the
+    end of the last complete block and parses the blocks that are complete
+    by now. A partially written trailing block, including a line which is not
+    terminated yet, is left for a later refresh. Thus polling a growing file
+    costs time proportional to the new data instead of the file size.
+
+    If the file becomes shorter than the already parsed part, e.g. because
+    the instrument started a new file under the same name, it is parsed
+    again from the beginning.
+
+    Args:
+        path (Union[str, Path]): vamas file to be followed
+
+    Attributes:
+        header (Optional[VamasHeader]): Header of the file, None as long as it
+            has not been completely written.
+        blocks (List[VamasBlock]): All complete blocks parsed so far.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        if not str(path).endswith(".vms"):
+            raise FileExtensionError
+        self.path = path
+        self.header: Optional[VamasHeader] = None
+        self.blocks: List[VamasBlock] = []
+        # End of the last complete block and the reader of the block params
+        self._offset = 0
+        self._reader: Optional[_BlockReader] = None
+
+    def _reset(self) -> None:
+        self.header = None
+        self.blocks = []
+        self._offset = 0
+        self._reader = None
+
+    @property
+    def complete(self) -> bool:
+        """True once all blocks announced by the header are parsed"""
+        return (
+            self.header is not None
+            and len(self.blocks) == self.header.num_blocks
+        )
+
+    def refresh(self) -> List[VamasBlock]:
+        """Parses the blocks completed since the last refresh
+
+        Returns:
+            The newly parsed blocks, which are also appended to
+            :attr:`blocks`
+        """
+        with open(self.path, "rb") as fp:
+            if os.fstat(fp.fileno()).st_size < self._offset:
+                self._reset()
+            fp.seek(self._offset)
+            data = fp.read()
+
+        # Only complete lines are parsed, the rest may still be written
+        f = _LineReader(io.BytesIO(data[: data.rfind(b"\n") + 1]))
+        parsed = 0
+        new_blocks: List[VamasBlock] = []
+        try:
+            if self.header is None:
+                header = _read_header(f)
+                self.header = header
+                parsed = f.tell()
+            else:
+                header = self.header
+
+            while len(self.blocks) + len(new_blocks) < header.num_blocks:
+                if self._reader is None:
+                    self._reader = _BlockReader(header)
+                b = self._reader.read(f)
+                num_y_values = b["num_y_values"]
+                ordinates = f.read_floats(num_y_values)
+                if len(ordinates) < num_y_values:
+                    break
+                b["corresponding_variables"] = _assign_ordinates(
+                    ordinates, num_y_values, b["corresponding_variables"]
+                )
+                new_blocks.append(VamasBlock(**b))
+                parsed = f.tell()
+        except UnexpectedEndOfFileError:
+            # The file ends within the header or the parameters of a block
+            pass
+
+        if not self.blocks and not new_blocks:
+            # The first block is read again by the next refresh
+            self._reader = None
+
+        self._offset += parsed
+        self.blocks.extend(new_blocks)
+        return new_blocks
+
+    def to_vamas(self) -> Vamas:
+        """Returns the header and the blocks parsed so far as :class:`Vamas`
+
+        Raises:
+            ValueError: if the header is not complete yet
+        """
+        if self.header is None:
+            raise ValueError("The header has not been written completely")
+        return Vamas._from_parts(self.header, list(self.blocks))
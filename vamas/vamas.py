@@ -1,8 +1,34 @@
+import bz2
+import gzip
 import io
-from typing import Union, List, Dict, Tuple, TextIO
+import lzma
+import mmap
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+    List,
+    Dict,
+    NamedTuple,
+    TYPE_CHECKING,
+    Tuple,
+    cast,
+    overload,
+)
 from pathlib import Path
 
 from .vamas_header import (
+    IncludeMask,
     VamasHeader,
     ExperimentVariable,
     FutureUpgradeExperimentEntry,
@@ -13,9 +39,24 @@ from .vamas_block import (
     LinescanCoordinates,
     CorrespondingVariable,
     AdditionalNumericalParam,
+    YValues,
+)
+
+from ._layout import BLOCK_PREFIX, BLOCK_SUFFIX, Param
+from .errors import (
+    FileExtensionError,
+    UnexpectedEndOfFileError,
+    VmsIdentifierError,
 )
+from .profiling import BlockStats, ParseStats, PhaseStats
+from .query import BlockQuery
+from .writer import write
+
+if TYPE_CHECKING:
+    import numpy as np
 
-from .errors import VmsIdentifierError, FileExtensionError
+# Any object supporting the buffer protocol is accepted in place of bytes
+VamasSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
 
 
 class Vamas:
@@ -24,45 +65,823 @@ class Vamas:
     Parses the vamas file into the attributes header and blocks.
 
     Args:
-        file (Union[str, Path]): vamas file to be parsed
+        file (Union[str, Path, bytes, BinaryIO]): vamas file to be parsed,
+            either as path, as bytes or any other object supporting the
+            buffer protocol, e.g. a :class:`bytearray` or :class:`memoryview`,
+            or as a stream opened in binary mode. Buffers and streams are
+            read in fixed-size chunks without copying them as a whole, and
+            a stream is not closed after parsing. A path may also point to
+            a compressed file ending in '.vms.gz', '.vms.bz2', '.vms.xz' or
+            '.vms.zst', which is decompressed while parsing. Reading '.zst'
+            requires the optional dependency zstandard before Python 3.14.
+        lazy (bool): If True, only the block parameters are parsed up front
+            and the y-values of a block are read when the block is first
+            accessed, see :class:`LazyBlocks`. Not supported for streams.
+        use_mmap (bool): If True, a file given by path is memory-mapped
+            instead of read through a buffered file object, so it is paged in
+            on demand and shared between processes reading the same file.
+            Has no effect if `file` is a compressed file or not a path.
+        workers (Optional[int]): If given, a file given by path is first
+            scanned for its block boundaries and the y-values of the blocks
+            are then decoded in parallel by this many worker processes,
+            at least 1. Has no effect if `file` is not a path or `lazy` is
+            True.
+        stats (Optional[ParseStats]): If given, it is filled with byte and
+            line counts and the time spent per phase and per block, see
+            :class:`~vamas.profiling.ParseStats`. Only supported when
+            parsing serially, without `lazy` or `workers`.
 
     Attributes:
         header (VamasHeader):
-        blocks (List[VamasBlock]):
+        blocks (Sequence[VamasBlock]): A list of blocks or, if `lazy` is
+            True, a :class:`LazyBlocks` sequence.
     """
 
-    def __init__(self, file: Union[str, Path, bytes]) -> None:
-        if isinstance(file, (str, Path)):
-            if not str(file).endswith(".vms"):
+    def __init__(
+        self,
+        file: "VamasSource",
+        lazy: bool = False,
+        use_mmap: bool = False,
+        workers: Optional[int] = None,
+        stats: Optional[ParseStats] = None,
+    ) -> None:
+        self.blocks: Sequence[VamasBlock]
+        if lazy and _is_stream(file):
+            raise ValueError("Lazy parsing is not supported for streams")
+        if stats is not None and (lazy or workers is not None):
+            raise ValueError("Stats are only collected by the serial parser")
+        if workers is not None and workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+        opener = _make_opener(file, use_mmap)
+
+        with opener() as f:
+            if lazy:
+                self.header, self.blocks = _index_vamas(f, opener)
+            elif workers is not None and isinstance(file, (str, Path)):
+                self.header, lazy_blocks = _index_vamas(f, opener)
+                self.blocks = _read_blocks_parallel(
+                    file, lazy_blocks.entries, workers, use_mmap
+                )
+            else:
+                self.header, self.blocks = _read_vamas(f, stats)
+
+    def write(self, path: Union[str, Path], newline: str = "\r\n") -> None:
+        """Writes the header and blocks to a vamas file
+
+        See :func:`vamas.writer.dump` for details.
+
+        Args:
+            path (Union[str, Path]): file to be written
+            newline (str): line terminator
+        """
+        write(self, path, newline)
+
+    def stack_xy(
+        self, corresponding_variable: int = 0, binding_energy: bool = False
+    ) -> "np.ndarray":
+        """Returns the (x, y) pairs of all blocks as one array
+
+        Requires the optional dependency NumPy and that all blocks share the
+        same abscissa values, e.g. repeated scans of the same region.
+
+        Args:
+            corresponding_variable (int): Index of the corresponding variable
+                providing the y-values.
+            binding_energy (bool): Use
+                :attr:`~vamas.vamas_block.VamasBlock.binding_energies` instead
+                of :attr:`~vamas.vamas_block.VamasBlock.x_values`.
+
+        Returns:
+            A float64 array of shape ``(num_blocks, 2, num_values)``, where
+            ``[i, 0]`` holds the x-values and ``[i, 1]`` the y-values of
+            block `i`
+
+        Raises:
+            ValueError: if the blocks do not share the same abscissa values
+        """
+        import numpy as np
+
+        blocks = list(self.blocks)
+        if not blocks:
+            return np.empty((0, 2, 0))
+
+        axes = [
+            b.binding_energies if binding_energy else b.x_values for b in blocks
+        ]
+        x = axes[0]
+        if any(axis != x for axis in axes[1:]):
+            raise ValueError("The blocks do not share the same x-axis")
+
+        stacked = np.empty((len(blocks), 2, len(x)))
+        stacked[:, 0] = np.asarray(x, dtype=np.float64)
+        for i, block in enumerate(blocks):
+            corres_var = block.corresponding_variables[corresponding_variable]
+            stacked[i, 1] = corres_var.to_numpy()
+        return stacked
+
+    def select(self, **criteria: Any) -> List[VamasBlock]:
+        """Returns the blocks matching all given criteria
+
+        For example ``vms.select(species="C", transition="1s")``. The
+        lookups are backed by indexes over the block parameters, which are
+        built on first use and rebuilt when :attr:`blocks` is replaced or
+        changes its length. With `lazy` only the y-values of the matching
+        blocks are read.
+
+        Args:
+            **criteria: keyword arguments of
+                :meth:`BlockQuery.select <vamas.query.BlockQuery.select>`
+
+        Returns:
+            The matching blocks in file order
+        """
+        query = getattr(self, "_query", None)
+        if query is None or query.blocks is not self.blocks:
+            query = self._query = BlockQuery(self.blocks)
+        return [self.blocks[i] for i in query.select(**criteria)]
+
+    @classmethod
+    def _from_parts(
+        cls, header: VamasHeader, blocks: Sequence[VamasBlock]
+    ) -> "Vamas":
+        """Creates a :class:`Vamas` from already parsed header and blocks"""
+        vamas = cls.__new__(cls)
+        vamas.header = header
+        vamas.blocks = blocks
+        return vamas
+
+
+def iter_blocks(
+    file: "VamasSource",
+    use_mmap: bool = False,
+    stats: Optional[ParseStats] = None,
+) -> Iterator[Union[VamasHeader, VamasBlock]]:
+    """Iterates over a vamas file block by block
+
+    Yields the :class:`~vamas.vamas_header.VamasHeader` first and then each
+    :class:`~vamas.vamas_block.VamasBlock` as soon as it is parsed. Blocks
+    that are dropped by the caller can be garbage collected right away, so
+    memory usage does not grow with the number of blocks.
+
+    Args:
+        file (Union[str, Path, bytes, BinaryIO]): vamas file to be parsed,
+            see :class:`Vamas`. A stream is not closed after iterating.
+        use_mmap (bool): If True, a file given by path is memory-mapped,
+            see :class:`Vamas`.
+        stats (Optional[ParseStats]): Collects parser statistics, see
+            :class:`Vamas`.
+
+    Yields:
+        The header followed by the blocks of the vamas file
+    """
+    with _make_opener(file, use_mmap)() as f:
+        if stats is None:
+            yield from _iter_vamas(f)
+        else:
+            yield from _iter_vamas_profiled(f, stats)
+
+
+@dataclass
+class BlockIndexEntry:
+    """Location and parameters of a block in a vamas file
+
+    Attributes:
+        offset (int): Byte offset of the start of the block.
+        ordinates_offset (int): Byte offset of the first y-value of the block.
+        params (Dict[str, Any]): Parsed block parameters, i.e. the keyword
+            arguments for :class:`~vamas.vamas_block.VamasBlock` with empty
+            y-values.
+    """
+
+    offset: int
+    ordinates_offset: int
+    params: Dict[str, Any]
+
+
+class LazyBlocks(Sequence[VamasBlock]):
+    """Sequence of blocks which are parsed on first access
+
+    Created by :class:`Vamas` with `lazy=True`. Indexing parses the y-values
+    of a block and caches the resulting
+    :class:`~vamas.vamas_block.VamasBlock`. The block parameters are
+    available without reading any y-values via
+    :attr:`~LazyBlocks.entries`.
+
+    Attributes:
+        entries (List[BlockIndexEntry]): Index entry for every block.
+    """
+
+    def __init__(
+        self,
+        entries: List[BlockIndexEntry],
+        opener: Callable[[], "_LineReader"],
+    ) -> None:
+        self.entries = entries
+        self._opener = opener
+        self._blocks: List[Optional[VamasBlock]] = [None] * len(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @overload
+    def __getitem__(self, index: int) -> VamasBlock: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[VamasBlock]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[VamasBlock, List[VamasBlock]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        block = self._blocks[index]
+        if block is None:
+            block = self._load(self.entries[index])
+            self._blocks[index] = block
+        return block
+
+    def _load(self, entry: BlockIndexEntry) -> VamasBlock:
+        with self._opener() as f:
+            f.seek(entry.ordinates_offset)
+            ordinates = f.read_floats(entry.params["num_y_values"])
+        return _block_from_entry(entry, ordinates)
+
+
+class _LineReader:
+    """Line-wise reader over a binary stream
+
+    Text fields are decoded line by line while y-values are converted to
+    floats directly from the raw bytes. Byte offsets of the underlying
+    stream are exposed via :meth:`tell` and :meth:`seek`. Lines are split at
+    newlines, :func:`_line_reader` translates lone carriage returns.
+    """
+
+    def __init__(
+        self,
+        stream: Union[BinaryIO, mmap.mmap],
+        encoding: str = "utf-8",
+        close_stream: bool = True,
+    ) -> None:
+        self._stream = stream
+        self._readline = stream.readline
+        self._encoding = encoding
+        self._close_stream = close_stream
+
+    def __enter__(self) -> "_LineReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._close_stream:
+            self._stream.close()
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        line = self._readline()
+        if not line:
+            raise StopIteration
+        return line.decode(self._encoding)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def seek(self, offset: int) -> None:
+        self._stream.seek(offset)
+
+    def read_lines(self, n: int) -> List[str]:
+        """Decodes the next `n` lines
+
+        Raises:
+            StopIteration: if the stream ends before `n` lines, like
+                :meth:`__next__`
+        """
+        readline = self._readline
+        lines = [readline() for _ in range(n)]
+        if lines and not lines[-1]:
+            raise StopIteration
+        encoding = self._encoding
+        return [line.decode(encoding) for line in lines]
+
+    def read_floats(self, n: int) -> YValues:
+        """Converts the next `n` lines to floats"""
+        return YValues(map(float, islice(iter(self._readline, b""), n)))
+
+    def skip(self, n: int) -> int:
+        """Skips the next `n` lines and returns the number of lines skipped"""
+        skipped = 0
+        for _ in islice(iter(self._readline, b""), n):
+            skipped += 1
+        return skipped
+
+
+class _MmapLineReader(_LineReader):
+    """Line reader over a memory-mapped file
+
+    Lines are skipped by counting newlines in slices of the mapped buffer,
+    so no Python-level work is done per skipped line.
+    """
+
+    _CHUNK_SIZE = 1 << 16
+
+    def __init__(self, mm: mmap.mmap, encoding: str = "utf-8") -> None:
+        super().__init__(mm, encoding)
+        self._mm = mm
+
+    def skip(self, n: int) -> int:
+        mm = self._mm
+        size = len(mm)
+        pos = mm.tell()
+        remaining = n
+        while remaining and pos < size:
+            chunk = mm[pos : pos + self._CHUNK_SIZE]
+            num_newlines = chunk.count(b"\n")
+            if num_newlines < remaining:
+                remaining -= num_newlines
+                pos += len(chunk)
+            else:
+                # Bisect for the end of the last skipped line within the chunk
+                lo, hi = 0, len(chunk)
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if chunk.count(b"\n", 0, mid) >= remaining:
+                        hi = mid
+                    else:
+                        lo = mid + 1
+                remaining = 0
+                pos += lo
+
+        if remaining and pos == size and mm[size - 1 : size] != b"\n":
+            # The last line is not terminated by a newline
+            remaining -= 1
+        mm.seek(pos)
+        return n - remaining
+
+
+class _CountingLineReader(_LineReader):
+    """Line reader counting the consumed lines and bytes of another one"""
+
+    def __init__(self, reader: _LineReader) -> None:
+        super().__init__(reader._stream, reader._encoding, close_stream=False)
+        self._readline_uncounted = reader._readline
+        self._readline = self._count_readline
+        self.bytes_read = 0
+        self.lines = 0
+
+    def _count_readline(self) -> bytes:
+        line = self._readline_uncounted()
+        if line:
+            self.bytes_read += len(line)
+            self.lines += 1
+        return line
+
+    def read_floats(self, n: int) -> YValues:
+        lines = list(islice(iter(self._readline_uncounted, b""), n))
+        self.bytes_read += sum(map(len, lines))
+        self.lines += len(lines)
+        return YValues(map(float, lines))
+
+
+def _make_opener(
+    file: "VamasSource", use_mmap: bool = False
+) -> Callable[[], _LineReader]:
+    """Creates a function which opens a line reader for a vamas file
+
+    Args:
+        file (VamasSource): vamas file as path, buffer or binary stream
+        use_mmap (bool): memory-map a file given by path
+
+    Returns:
+        Function returning a new :class:`_LineReader` on every call. For a
+        stream, it can only be called once.
+    """
+    if isinstance(file, (str, Path)):
+        path = file
+        name = str(path)
+        if not name.endswith(".vms"):
+            for suffix, open_compressed in _DECOMPRESSORS.items():
+                if name.endswith(".vms" + suffix):
+                    break
+            else:
                 raise FileExtensionError
 
-            with open(file) as f:
-                self.header, self.blocks = _read_vamas(f)
+            def open_decompressed() -> _LineReader:
+                # The decompressing file objects implement readline in
+                # Python, a BufferedReader on top splits lines in C
+                stream = cast(io.RawIOBase, open_compressed(path))
+                buffered = io.BufferedReader(stream, _CHUNK_SIZE)
+                return _line_reader(buffered, buffered.peek(_HEAD_SIZE))
 
-        elif isinstance(file, bytes):
-            byte_stream = io.BytesIO(file)
-            # Wrap the BytesIO stream in a TextIOWrapper to treat it as a text file
-            text_stream = io.TextIOWrapper(byte_stream, encoding="utf-8")
-            self.header, self.blocks = _read_vamas(text_stream)
+            return open_decompressed
 
-        else:
-            raise TypeError(
-                "Argument file must be of type `str`,`Path` or `bytes`"
+        def open_file() -> _LineReader:
+            f = open(path, "rb")
+            return _line_reader(f, f.peek(_HEAD_SIZE))
+
+        if use_mmap:
+
+            def open_mmap() -> _LineReader:
+                with open(path, "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if _has_lone_cr(mm[:_HEAD_SIZE]):
+                    # Lines are split at newlines in the mapped buffer
+                    mm.close()
+                    return open_file()
+                return _MmapLineReader(mm)
+
+            return open_mmap
+
+        return open_file
+
+    if isinstance(file, bytes):
+        data = file
+
+        def open_bytes() -> _LineReader:
+            # BytesIO shares the memory of a bytes object until it is written
+            return _line_reader(io.BytesIO(data), data[:_HEAD_SIZE])
+
+        return open_bytes
+
+    if isinstance(file, io.TextIOBase):
+        raise TypeError("Stream must be opened in binary mode")
+
+    if _is_stream(file):
+        stream = cast(BinaryIO, file)
+        opened = False
+
+        def open_stream() -> _LineReader:
+            nonlocal opened
+            if opened:
+                raise ValueError("A stream can only be read once")
+            opened = True
+            if isinstance(stream, io.BufferedIOBase) and hasattr(
+                stream, "peek"
+            ):
+                buffered = cast(io.BufferedReader, stream)
+            else:
+                # Unbuffered or non-standard streams are read in chunks
+                buffered = io.BufferedReader(_RawReader(stream), _CHUNK_SIZE)
+            return _line_reader(
+                buffered, buffered.peek(_HEAD_SIZE), close_stream=False
             )
 
+        return open_stream
+
+    try:
+        buffer = memoryview(cast(Any, file)).cast("B")
+    except TypeError:
+        raise TypeError(
+            "Argument file must be a path, a bytes-like object or a binary "
+            "stream"
+        ) from None
+
+    def open_buffer() -> _LineReader:
+        return _line_reader(
+            io.BufferedReader(_RawReader(_BufferStream(buffer)), _CHUNK_SIZE),
+            buffer[:_HEAD_SIZE].tobytes(),
+        )
+
+    return open_buffer
+
+
+# Size of the chunks in which buffers and unbuffered streams are read
+_CHUNK_SIZE = 1 << 16
+
+# Number of bytes at the start of a file inspected for its line endings
+_HEAD_SIZE = 256
+
+_LONE_CR = re.compile(rb"\r(?!\n)")
+
+
+def _has_lone_cr(head: bytes) -> bool:
+    """Whether the start of a file has carriage returns as line endings
+
+    A carriage return at the very end of `head` may be followed by a newline
+    and is not counted.
+    """
+    match = _LONE_CR.search(head)
+    return match is not None and match.start() < len(head) - 1
+
+
+def _line_reader(
+    stream: BinaryIO, head: bytes, close_stream: bool = True
+) -> _LineReader:
+    """Creates a line reader, translating lone carriage returns to newlines
+    if `head`, the start of the stream, has them as line endings"""
+    if _has_lone_cr(head):
+        stream = cast(
+            BinaryIO,
+            io.BufferedReader(
+                _CarriageReturnReader(stream, close_stream), _CHUNK_SIZE
+            ),
+        )
+    return _LineReader(stream, close_stream=close_stream)
+
+
+def _open_zstd(path: Union[str, Path]) -> BinaryIO:
+    try:
+        # Part of the standard library from Python 3.14 on
+        from compression import zstd  # type: ignore
+
+        return cast(BinaryIO, zstd.open(path, "rb"))
+    except ImportError:
+        pass
+
+    try:
+        import zstandard  # type: ignore
+    except ImportError:
+        raise ImportError(
+            "Reading '.zst' files requires the optional dependency zstandard"
+        ) from None
+
+    return cast(
+        BinaryIO,
+        zstandard.ZstdDecompressor().stream_reader(
+            open(path, "rb"), closefd=True
+        ),
+    )
+
+
+# Compressed vamas files are decompressed while they are parsed
+_DECOMPRESSORS: Dict[str, Callable[[Union[str, Path]], BinaryIO]] = {
+    ".gz": lambda path: cast(BinaryIO, gzip.open(path, "rb")),
+    ".bz2": lambda path: cast(BinaryIO, bz2.open(path, "rb")),
+    ".xz": lambda path: cast(BinaryIO, lzma.open(path, "rb")),
+    ".zst": _open_zstd,
+}
+
+
+def _is_stream(file: Any) -> bool:
+    return not isinstance(file, (str, Path, bytes)) and hasattr(file, "read")
+
+
+class _BufferStream:
+    """Minimal seekable binary stream over a byte buffer, without a copy"""
+
+    def __init__(self, buffer: memoryview) -> None:
+        self._buffer = buffer
+        self._pos = 0
+
+    def readinto(self, b: Any) -> int:
+        chunk = self._buffer[self._pos : self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seekable(self) -> bool:
+        return True
+
+
+class _CarriageReturnReader(io.RawIOBase):
+    """Raw stream translating lone carriage returns of a binary stream
+
+    Line endings of classic Mac OS files, a carriage return not followed by
+    a newline, are replaced by newlines, as a text stream in universal
+    newlines mode would split the lines. The translation is byte for byte,
+    so offsets into the translated stream are offsets into the source.
+    """
+
+    def __init__(self, source: BinaryIO, close_source: bool = True) -> None:
+        self._source = source
+        self._close_source = close_source
+        # Byte read ahead to tell whether a carriage return ends a line
+        self._next = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        data = self._next + self._source.read(len(b) - len(self._next))
+        self._next = b""
+        translated = _LONE_CR.sub(b"\n", data)
+        if data.endswith(b"\r"):
+            self._next = self._source.read(1)
+            if self._next == b"\n":
+                translated = translated[:-1] + b"\r"
+        n = len(translated)
+        b[:n] = translated
+        return n
+
+    def seekable(self) -> bool:
+        return self._source.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self.tell()
+            whence = io.SEEK_SET
+        self._next = b""
+        return self._source.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._source.tell() - len(self._next)
+
+    def close(self) -> None:
+        if not self.closed and self._close_source:
+            self._source.close()
+        super().close()
+
+
+class _RawReader(io.RawIOBase):
+    """Raw stream adapter, so any readable object can be buffered
+
+    Reads via ``readinto`` if available, otherwise via ``read``. The position
+    is counted, so :meth:`tell` also works for non-seekable sources. The
+    wrapped object is not closed.
+    """
+
+    def __init__(self, source: Any) -> None:
+        self._source = source
+        self._pos = 0
+        self._seekable = getattr(source, "seekable", lambda: False)()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        if hasattr(self._source, "readinto"):
+            n = self._source.readinto(b) or 0
+        else:
+            data = self._source.read(len(b))
+            n = len(data)
+            b[:n] = data
+        self._pos += n
+        return n
+
+    def seekable(self) -> bool:
+        return self._seekable
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if not self._seekable:
+            raise io.UnsupportedOperation("seek")
+        self._pos = self._source.seek(offset, whence)
+        return self._pos
 
-def _read_vamas(f: TextIO) -> Tuple[VamasHeader, List[VamasBlock]]:
+    def tell(self) -> int:
+        return self._pos
+
+
+def _read_vamas(
+    f: _LineReader, stats: Optional[ParseStats] = None
+) -> Tuple[VamasHeader, List[VamasBlock]]:
     """Parses a vamas file
 
     Args:
-        f (TextIO): file descripter for a vamas file
-
+        f (_LineReader): line reader for a vamas file
+        stats (Optional[ParseStats]): collects parser statistics if given
 
     Returns:
         Parsed vamas-file as tuple of :class:`~vamas.vamas_header.VamasHeader`
         a list of :class:`~vamas.vamas_block.VamasBlock`
     """
+    it = _iter_vamas(f) if stats is None else _iter_vamas_profiled(f, stats)
+    header = next(it)
+    assert isinstance(header, VamasHeader)
+    return header, cast(List[VamasBlock], list(it))
+
+
+def _iter_vamas(f: _LineReader) -> Iterator[Union[VamasHeader, VamasBlock]]:
+    """Parses a vamas file block by block
+
+    Args:
+        f (_LineReader): line reader for a vamas file
+
+    Yields:
+        The :class:`~vamas.vamas_header.VamasHeader` followed by each
+        :class:`~vamas.vamas_block.VamasBlock`
+    """
+    header = _read_header(f)
+    yield header
+
+    reader = _BlockReader(header, f._encoding)
+    for _ in range(header.num_blocks):
+        b = reader.read(f)
+        b["corresponding_variables"] = _read_ordinates(
+            f, b["num_y_values"], b["corresponding_variables"]
+        )
+        yield VamasBlock(**b)
+
+
+def _iter_vamas_profiled(
+    f: _LineReader, stats: ParseStats
+) -> Iterator[Union[VamasHeader, VamasBlock]]:
+    """Same as :func:`_iter_vamas`, but records statistics in `stats`
+
+    Kept separate, so parsing without statistics has no overhead.
+    """
+    f = _CountingLineReader(f)
+    clock, cpu_clock = time.perf_counter, time.process_time
+
+    wall, cpu = clock(), cpu_clock()
+    header = _read_header(f)
+    stats.phases["header"].add(clock() - wall, cpu_clock() - cpu)
+    stats.bytes_read += f.bytes_read
+    stats.lines += f.lines
+    yield header
+
+    reader = _BlockReader(header, f._encoding)
+    for i in range(header.num_blocks):
+        bytes_read, lines = f.bytes_read, f.lines
+        times = [(clock(), cpu_clock())]
+
+        b = reader.read(f)
+        times.append((clock(), cpu_clock()))
+
+        b["corresponding_variables"] = _read_ordinates(
+            f, b["num_y_values"], b["corresponding_variables"]
+        )
+        times.append((clock(), cpu_clock()))
+
+        block = VamasBlock(**b)
+        times.append((clock(), cpu_clock()))
+
+        stats._add_block(
+            BlockStats(
+                index=i,
+                bytes_read=f.bytes_read - bytes_read,
+                lines=f.lines - lines,
+                num_y_values=b["num_y_values"],
+                phases={
+                    phase: PhaseStats(end[0] - start[0], end[1] - start[1])
+                    for phase, start, end in zip(
+                        ["block_params", "ordinates", "construction"],
+                        times,
+                        times[1:],
+                    )
+                },
+            )
+        )
+        yield block
+
+
+def _index_vamas(
+    f: _LineReader, opener: Callable[[], _LineReader]
+) -> Tuple[VamasHeader, LazyBlocks]:
+    """Scans a vamas file for the location and parameters of its blocks
+
+    The y-values are skipped without converting them to floats.
+
+    Args:
+        f (_LineReader): line reader for a vamas file
+        opener (Callable[[], _LineReader]): function returning a new line
+            reader for the same file, used to read blocks on access
+
+    Returns:
+        Parsed :class:`~vamas.vamas_header.VamasHeader` and the
+        :class:`LazyBlocks` of the file
+    """
+    header = _read_header(f)
+
+    entries: List[BlockIndexEntry] = []
+    reader = _BlockReader(header, f._encoding)
+    for _ in range(header.num_blocks):
+        offset = f.tell()
+        b = reader.read(f)
+        entries.append(BlockIndexEntry(offset, f.tell(), b))
+
+        num_skipped = f.skip(b["num_y_values"])
+        if num_skipped != b["num_y_values"]:
+            raise ValueError(
+                f"Expected {b['num_y_values']} y-values, found {num_skipped}"
+            )
+
+    return header, LazyBlocks(entries, opener)
+
+
+def _read_header(f: _LineReader) -> VamasHeader:
+    """Parses the header of a vamas file
+
+    Args:
+        f (_LineReader): line reader positioned at the start of the file
+
+    Returns:
+        Parsed :class:`~vamas.vamas_header.VamasHeader`
+
+    Raises:
+        UnexpectedEndOfFileError: if the file ends within the header
+    """
+    try:
+        return _parse_header(f)
+    except StopIteration:
+        raise UnexpectedEndOfFileError("the header") from None
+
 
+def _parse_header(f: _LineReader) -> VamasHeader:
     h: Dict = {}
     h["format_identifier"] = next(f).strip()
 
@@ -104,13 +923,10 @@ def _read_vamas(f: TextIO) -> Tuple[VamasHeader, List[VamasBlock]]:
         )
 
     h["num_entries_inclusion_exclusion"] = int(next(f))
-    h["block_params_includes"] = [
-        h["num_entries_inclusion_exclusion"] <= 0 for _ in range(40)
-    ]
+    includes = [h["num_entries_inclusion_exclusion"] <= 0 for _ in range(40)]
     for _ in range(abs(h["num_entries_inclusion_exclusion"])):
-        h["block_params_includes"][int(next(f)) + 1] = (
-            h["num_entries_inclusion_exclusion"] > 0
-        )
+        includes[int(next(f)) - 1] = h["num_entries_inclusion_exclusion"] > 0
+    h["block_params_includes"] = IncludeMask.from_bools(includes)
 
     h["num_manually_entered_items_in_block"] = int(next(f))
 
@@ -131,305 +947,502 @@ def _read_vamas(f: TextIO) -> Tuple[VamasHeader, List[VamasBlock]]:
 
     h["num_blocks"] = int(next(f))
 
-    # End of header
-    blocks: List[Dict] = []
-    for _ in range(h["num_blocks"]):
-        include = (
-            [True for _ in range(40)]
-            if len(blocks) == 0
-            else h["block_params_includes"]
-        )
-        # b = VamasBlock()
-        # fb = VamasBlock()
-        b: Dict = {}
-        fb: Dict = {}
+    return VamasHeader(**h)
 
-        b["block_identifier"] = next(f).strip()
-        b["sample_identifier"] = next(f).strip()
 
-        b["year"] = int(next(f)) if include[0] else fb["year"]
-        b["month"] = int(next(f)) if include[1] else fb["month"]
-        b["day"] = int(next(f)) if include[2] else fb["day"]
-        b["hour"] = int(next(f)) if include[3] else fb["hour"]
-        b["minute"] = int(next(f)) if include[4] else fb["minute"]
-        b["second"] = int(next(f)) if include[5] else fb["second"]
+# Parses part of a block from a line reader into the parameters of the block
+_Step = Callable[[_LineReader, Dict], None]
 
-        b["num_hours_advance_gmt"] = (
-            float(next(f)) if include[6] else fb["num_hours_advance_gmt"]
-        )
 
-        if include[7]:
-            b["num_lines_block_comment"] = int(next(f))
-            block_comments = []
-            for _ in range(b["num_lines_block_comment"]):
-                block_comments.append(next(f).strip())
+class _Inherit(NamedTuple):
+    """Parameters of a plan which are taken from the first block"""
 
-            b["block_comment"] = "\n".join(block_comments)
-        else:
-            b["num_lines_block_comment"] = fb["num_lines_block_comment"]
-            b["block_comment"] = fb["block_comment"]
+    names: Tuple[str, ...]
 
-        b["technique"] = next(f).strip() if include[8] else fb["technique"]
 
-        if h["experiment_mode"] in ["MAP", "MAPD"]:
-            b["x_coord"] = int(float(next(f))) if include[9] else fb["x_coord"]
-            b["y_coord"] = int(float(next(f))) if include[9] else fb["y_coord"]
+_Plan = Tuple[Union[_Step, _Inherit], ...]
 
-        if include[10]:
-            b["values_exp_var"] = []
-            for _ in range(len(h["experiment_variables"])):
-                b["values_exp_var"].append(next(f))
-        else:
-            b["values_exp_var"] = fb["values_exp_var"]
 
-        b["analysis_source_label"] = (
-            next(f).strip() if include[11] else fb["analysis_source_label"]
-        )
+class _BlockReader:
+    """Reads the parameters of the blocks of a vamas file one by one
 
-        if h["experiment_mode"] in ["MAPDP", "MAPSVDP", "SDP", "SDPSV"] or b[
-            "technique"
-        ] in [
-            "SNMS energy spec",
-            "FABMS",
-            "FABMS energy spec",
-            "ISS",
-            "SIMS",
-            "SIMS energy spec",
-            "SNMS",
-        ]:
-            b["sputtering_z"] = (
-                int(next(f)) if include[12] else fb["sputtering_z"]
-            )
-            b["sputtering_num_particles"] = (
-                float(next(f))
-                if include[12]
-                else fb["sputtering_num_particles"]
-            )
-            b["sputtering_charge"] = (
-                float(next(f).strip())
-                if include[12]
-                else fb["sputtering_charge"]
-            )
+    The first block is read with all parameters included. The parameters
+    excluded by :attr:`VamasHeader.block_params_includes
+    <vamas.vamas_header.VamasHeader.block_params_includes>` are then taken
+    from it once into a template, which is merged into every following
+    block. Thus all blocks share the immutable inherited values of the
+    first block by reference instead of holding copies of them. Lists and
+    the corresponding variables, which hold the y-values, are created for
+    every block, so changing one block does not affect the others.
 
-        b["analysis_source_characteristic_energy"] = (
-            float(next(f))
-            if include[13]
-            else fb["analysis_source_characteristic_energy"]
-        )
-        b["analysis_source_strength"] = (
-            float(next(f)) if include[14] else fb["analysis_source_strength"]
-        )
-        b["analysis_source_beam_width_x"] = (
-            float(next(f))
-            if include[15]
-            else fb["analysis_source_beam_width_x"]
+    The blocks are parsed by plans compiled from
+    :data:`~vamas._layout.BLOCK_LAYOUT`, which are cached, so the layout is
+    resolved only once per file instead of for every block.
+
+    Args:
+        header (VamasHeader): header of the vamas file
+        encoding (str): encoding of the line readers passed to :meth:`read`
+
+    Attributes:
+        first_block (Optional[Dict]): Parameters of the first block, None
+            until it has been read.
+    """
+
+    def __init__(self, header: VamasHeader, encoding: str = "utf-8") -> None:
+        self.header = header
+        self.encoding = encoding
+        self.first_block: Optional[Dict] = None
+        self._prefix = self._bind(_prefix_plan(self._mask, encoding))
+        self._suffixes: Dict[str, Tuple[_Step, ...]] = {}
+        self._num_read = 0
+
+    def read(self, f: _LineReader) -> Dict:
+        """Parses the parameters of the next block up to the ordinate section
+
+        Args:
+            f (_LineReader): line reader positioned at the start of a block
+
+        Returns:
+            Block parameters as keyword arguments for
+            :class:`~vamas.vamas_block.VamasBlock`, with empty y-values
+
+        Raises:
+            UnexpectedEndOfFileError: if the file ends within the parameters
+        """
+        header = self.header
+        b: Dict = {}
+        try:
+            for step in self._prefix:
+                step(f, b)
+            suffix = self._suffixes.get(b["technique"])
+            if suffix is None:
+                suffix = self._bind_suffix(b["technique"])
+            for step in suffix:
+                step(f, b)
+
+            if header.scan_mode != "REGULAR":
+                print("Only REGULAR scans supported")
+
+            b["num_y_values"] = int(next(f))
+            for corres_var in b["corresponding_variables"]:
+                corres_var.y_min = float(next(f))
+                corres_var.y_max = float(next(f))
+        except StopIteration:
+            raise UnexpectedEndOfFileError(
+                f"the parameters of block {self._num_read + 1}"
+            ) from None
+
+        self._num_read += 1
+        if self.first_block is None:
+            self.first_block = b
+            self._prefix = self._bind(_prefix_plan(self._mask, self.encoding))
+            self._suffixes = {}
+        return b
+
+    @property
+    def _mask(self) -> IncludeMask:
+        if self.first_block is None:
+            return IncludeMask.all()
+        return self.header.block_params_includes
+
+    def _bind_suffix(self, technique: str) -> Tuple[_Step, ...]:
+        header = self.header
+        suffix = self._suffixes[technique] = self._bind(
+            _suffix_plan(
+                self._mask,
+                self.encoding,
+                header.experiment_mode,
+                technique,
+                header.num_experiment_variables,
+            )
         )
-        b["analysis_source_beam_width_y"] = (
-            float(next(f))
-            if include[15]
-            else fb["analysis_source_beam_width_y"]
+        return suffix
+
+    def _bind(self, plan: _Plan) -> Tuple[_Step, ...]:
+        """Replaces the inherited parameters of `plan` by template steps"""
+        return tuple(
+            _inherit(self.first_block or {}, step.names)
+            if isinstance(step, _Inherit)
+            else step
+            for step in plan
         )
 
-        if h["experiment_mode"] in [
-            "MAP",
-            "MAPDP",
-            "MAPSV",
-            "MAPSVDP",
-            "SEM",
-        ]:
-            b["field_view_x"] = (
-                float(next(f)) if include[16] else fb["field_view_x"]
-            )
-            b["field_view_y"] = (
-                float(next(f)) if include[16] else fb["field_view_y"]
-            )
 
-        if h["experiment_mode"] in ["MAPSV", "MAPSVDP", "SEM"]:
-            if include[17]:
-                b["linescan_coordinates"] = LinescanCoordinates(
-                    first_linescan_start_x=int(next(f)),
-                    first_linescan_start_y=int(next(f)),
-                    first_linescan_finish_x=int(next(f)),
-                    first_linescan_finish_y=int(next(f)),
-                    last_linescan_finish_x=int(next(f)),
-                    last_linescan_finish_y=int(next(f)),
-                )
+@lru_cache(maxsize=None)
+def _prefix_plan(mask: IncludeMask, encoding: str) -> _Plan:
+    """Plan for the parameters up to the technique"""
+    return _compile_block_plan(BLOCK_PREFIX, mask, encoding, "", "", 0)
+
+
+@lru_cache(maxsize=None)
+def _suffix_plan(
+    mask: IncludeMask,
+    encoding: str,
+    experiment_mode: str,
+    technique: str,
+    num_experiment_variables: int,
+) -> _Plan:
+    """Plan for the parameters after the technique"""
+    return _compile_block_plan(
+        BLOCK_SUFFIX,
+        mask,
+        encoding,
+        experiment_mode,
+        technique,
+        num_experiment_variables,
+    )
+
+
+def _compile_block_plan(
+    layout: Tuple[Param, ...],
+    mask: IncludeMask,
+    encoding: str,
+    experiment_mode: str,
+    technique: str,
+    num_experiment_variables: int,
+) -> _Plan:
+    """Compiles part of the block layout into a plan of parsing steps
+
+    Parameters whose condition does not hold are dropped, consecutive
+    included parameters of single-line fields are merged into one step which
+    converts the raw lines, decoding only text fields, and excluded
+    parameters are collected into a single :class:`_Inherit` entry.
+
+    Args:
+        layout (Tuple[Param, ...]): parameters to be parsed
+        mask (IncludeMask): included block parameters
+        encoding (str): encoding of the text fields
+        experiment_mode (str): experiment mode of the file
+        technique (str): technique of the block
+        num_experiment_variables (int): number of experiment variables of
+            the file
+
+    Returns:
+        Functions to be called in order to parse the parameters of `layout`
+        into a dictionary, and the excluded parameters
+    """
+    steps: List[Union[_Step, _Inherit]] = []
+    fields: List[Tuple[str, Optional[Callable]]] = []
+    inherited: List[str] = []
+
+    for param in layout:
+        if param.condition is not None and not param.condition(
+            experiment_mode, technique
+        ):
+            continue
+
+        if param.position is not None and not mask[param.position]:
+            inherited.extend(param.names)
+        elif param.special is not None:
+            if fields:
+                steps.append(_read_fields(fields, encoding))
+                fields = []
+            if param.special == "values_exp_var":
+                steps.append(_read_values_exp_var(num_experiment_variables))
             else:
-                b["linescan_coordinates"] = fb["linescan_coordinates"]
+                steps.append(_SPECIAL_READERS[param.special])
+        else:
+            for name, convert in param.fields:
+                fields.append((name, None if convert is str else convert))
 
-        b["analysis_source_polar_incidence_angle"] = (
-            float(next(f))
-            if include[18]
-            else fb["analysis_source_polar_incidence_angle"]
-        )
-        b["analysis_source_azimuth"] = (
-            float(next(f)) if include[19] else fb["analysis_source_azimuth"]
-        )
-        b["analyzer_mode"] = (
-            next(f).strip() if include[20] else fb["analyzer_mode"]
-        )
+    if fields:
+        steps.append(_read_fields(fields, encoding))
+    if inherited:
+        steps.append(_Inherit(tuple(inherited)))
+    return tuple(steps)
 
-        b["analyzer_pass_energy_or_retard_ratio_or_mass_res"] = (
-            float(next(f))
-            if include[21]
-            else fb["analyzer_pass_energy_or_retard_ratio_or_mass_res"]
-        )
 
-        if b["technique"] == "AES diff":
-            b["differential_width"] = (
-                float(next(f)) if include[22] else fb["differential_width"]
-            )
+def _read_fields(
+    fields: List[Tuple[str, Optional[Callable]]], encoding: str
+) -> _Step:
+    """Step reading consecutive single-line fields
 
-        b["magnification_analyzer_transfer_lens"] = (
-            float(next(f))
-            if include[23]
-            else fb["magnification_analyzer_transfer_lens"]
-        )
-        b["analyzer_work_function_or_acceptance_energy"] = (
-            float(next(f))
-            if include[24]
-            else fb["analyzer_work_function_or_acceptance_energy"]
-        )
+    Numbers are converted directly from the raw lines, only text fields,
+    whose converter is None, are decoded.
+    """
+    converters = tuple(fields)
+
+    def step(f: _LineReader, b: Dict) -> None:
+        readline = f._readline
+        for name, convert in converters:
+            line = readline()
+            if not line:
+                raise StopIteration
+            if convert is None:
+                b[name] = line.decode(encoding).strip()
+            else:
+                b[name] = convert(line)
 
-        b["target_bias"] = float(next(f)) if include[25] else fb["target_bias"]
+    return step
 
-        b["analysis_width_x"] = (
-            float(next(f)) if include[26] else fb["analysis_width_x"]
-        )
-        b["analysis_width_y"] = (
-            float(next(f)) if include[26] else fb["analysis_width_y"]
-        )
 
-        b["analyzer_axis_take_off_polar_angle"] = (
-            float(next(f))
-            if include[27]
-            else fb["analyzer_axis_take_off_polar_angle"]
-        )
-        b["analyzer_axis_take_off_azimuth"] = (
-            float(next(f))
-            if include[27]
-            else fb["analyzer_axis_take_off_azimuth"]
-        )
+def _inherit(first_block: Dict, names: Tuple[str, ...]) -> _Step:
+    """Step merging the parameters `names` of the first block into a block
 
-        b["species_label"] = (
-            next(f).strip() if include[28] else fb["species_label"]
+    Immutable values are shared by reference. Lists are copied for every
+    block from a tuple, so changing the list of one block changes neither
+    the first block nor the others. Of the corresponding variables only
+    label and unit are shared.
+    """
+    missing = [name for name in names if name not in first_block]
+    if missing:
+        raise ValueError(
+            f"Block parameters {missing} are excluded by the header but "
+            "missing in the first block"
         )
+    template = {name: first_block[name] for name in names}
+    corres_vars = template.pop("corresponding_variables", None)
+    lists = {
+        name: tuple(template.pop(name))
+        for name in names
+        if isinstance(template.get(name), list)
+    }
+
+    if corres_vars is None and not lists:
+
+        def step(f: _LineReader, b: Dict) -> None:
+            b.update(template)
+
+        return step
+
+    labels_units = [(c.label, c.unit) for c in corres_vars or ()]
+
+    def step_with_copies(f: _LineReader, b: Dict) -> None:
+        b.update(template)
+        for name, values in lists.items():
+            b[name] = list(values)
+        if corres_vars is not None:
+            b["corresponding_variables"] = [
+                CorrespondingVariable(label, unit, YValues())
+                for label, unit in labels_units
+            ]
 
-        b["transition_or_charge_state_label"] = (
-            next(f).strip()
-            if include[29]
-            else fb["transition_or_charge_state_label"]
-        )
-        b["charge_detected_particle"] = (
-            int(next(f)) if include[29] else fb["charge_detected_particle"]
-        )
+    return step_with_copies
 
-        if h["scan_mode"] != "REGULAR":
-            print("Only REGULAR scans supported")
 
-        b["x_label"] = next(f).strip() if include[30] else fb["x_label"]
-        b["x_units"] = next(f).strip() if include[30] else fb["x_units"]
+def _read_raw_lines(f: _LineReader, n: int) -> List[bytes]:
+    """Reads `n` undecoded lines, raising StopIteration at the end of file"""
+    readline = f._readline
+    lines = [readline() for _ in range(n)]
+    if lines and not lines[-1]:
+        raise StopIteration
+    return lines
 
-        b["x_start"] = float(next(f)) if include[30] else fb["x_start"]
-        b["x_step"] = float(next(f)) if include[30] else fb["x_step"]
 
-        if include[31]:
-            b["num_corresponding_variables"] = int(next(f))
-            b["corresponding_variables"] = []
-            for _ in range(b["num_corresponding_variables"]):
-                b["corresponding_variables"].append(
-                    CorrespondingVariable(
-                        label=next(f).strip(),
-                        unit=next(f).strip(),
-                        y_values=[],
-                    )
-                )
+def _read_count(f: _LineReader) -> int:
+    line = f._readline()
+    if not line:
+        raise StopIteration
+    return int(line)
 
-        else:
-            b["num_corresponding_variables"] = fb["num_corresponding_variables"]
-            assert fb["corresponding_variables"] is not None
-            b["corresponding_variables"] = fb["corresponding_variables"].copy()
 
-        b["signal_mode"] = next(f).strip() if include[32] else fb["signal_mode"]
+def _read_values_exp_var(num_experiment_variables: int) -> _Step:
+    def step(f: _LineReader, b: Dict) -> None:
+        # Kept as raw lines, with the line endings normalized to "\n" like
+        # a text stream in universal newlines mode
+        b["values_exp_var"] = [
+            line.rstrip("\r\n") + "\n"
+            for line in f.read_lines(num_experiment_variables)
+        ]
 
-        b["signal_collection_time"] = (
-            float(next(f)) if include[33] else fb["signal_collection_time"]
-        )
+    return step
 
-        b["num_scans_to_compile_block"] = (
-            int(next(f)) if include[34] else fb["num_scans_to_compile_block"]
-        )
 
-        b["signal_time_correction"] = (
-            float(next(f)) if include[35] else fb["signal_time_correction"]
-        )
+def _read_block_comment(f: _LineReader, b: Dict) -> None:
+    num_lines = _read_count(f)
+    encoding = f._encoding
+    b["num_lines_block_comment"] = num_lines
+    b["block_comment"] = "\n".join(
+        [
+            line.decode(encoding).strip()
+            for line in _read_raw_lines(f, num_lines)
+        ]
+    )
 
-        if h["experiment_mode"] in ["MAPDP", "MAPSVDP", "SDP", "SDPSV"] and b[
-            "technique"
-        ] in [
-            "AES diff",
-            "AES dir",
-            "EDX",
-            "ELS",
-            "UPS",
-            "XRF",
-        ]:
-            if include[36]:
-                b["sputtering_source"] = SputteringSource(
-                    energy=float(next(f)),
-                    beam_current=float(next(f)),
-                    width_x=float(next(f)),
-                    width_y=float(next(f)),
-                    polar_incidence_angle=float(next(f)),
-                    azimuth=float(next(f)),
-                    mode=next(f).strip(),
-                )
-            else:
-                b["sputtering_source"] = fb["sputtering_source"]
 
-        b["sample_normal_polar_angle_tilt"] = (
-            float(next(f))
-            if include[37]
-            else fb["sample_normal_polar_angle_tilt"]
+def _read_linescan_coordinates(f: _LineReader, b: Dict) -> None:
+    b["linescan_coordinates"] = LinescanCoordinates(
+        *map(int, _read_raw_lines(f, 6))
+    )
+
+
+def _read_corresponding_variables(f: _LineReader, b: Dict) -> None:
+    num_corres_vars = _read_count(f)
+    lines = f.read_lines(2 * num_corres_vars)
+    b["num_corresponding_variables"] = num_corres_vars
+    b["corresponding_variables"] = [
+        CorrespondingVariable(
+            label=label.strip(), unit=unit.strip(), y_values=YValues()
         )
+        for label, unit in zip(lines[::2], lines[1::2])
+    ]
 
-        b["sample_normal_tilt_azimuth"] = (
-            float(next(f)) if include[37] else fb["sample_normal_tilt_azimuth"]
+
+def _read_sputtering_source(f: _LineReader, b: Dict) -> None:
+    lines = _read_raw_lines(f, 7)
+    energy, beam_current, width_x, width_y, polar, azimuth = map(
+        float, lines[:6]
+    )
+    b["sputtering_source"] = SputteringSource(
+        energy=energy,
+        beam_current=beam_current,
+        width_x=width_x,
+        width_y=width_y,
+        polar_incidence_angle=polar,
+        azimuth=azimuth,
+        mode=lines[6].decode(f._encoding).strip(),
+    )
+
+
+def _read_additional_numerical_params(f: _LineReader, b: Dict) -> None:
+    num_params = _read_count(f)
+    lines = f.read_lines(3 * num_params)
+    b["num_additional_numerical_params"] = num_params
+    b["additional_numerical_params"] = [
+        AdditionalNumericalParam(
+            label=label.strip(), unit=unit.strip(), value=float(value)
         )
+        for label, unit, value in zip(lines[::3], lines[1::3], lines[2::3])
+    ]
+
+
+_SPECIAL_READERS: Dict[str, _Step] = {
+    "block_comment": _read_block_comment,
+    "linescan_coordinates": _read_linescan_coordinates,
+    "corresponding_variables": _read_corresponding_variables,
+    "sputtering_source": _read_sputtering_source,
+    "additional_numerical_params": _read_additional_numerical_params,
+}
+
+
+def _read_ordinates(
+    f: _LineReader,
+    num_y_values: int,
+    corres_vars: List[CorrespondingVariable],
+) -> List[CorrespondingVariable]:
+    """Reads the ordinate section of a block in one pass
+
+    All `num_y_values` lines are decoded together into a single
+    ``array('d')`` which is afterwards de-interleaved into one array per
+    corresponding variable.
+
+    Args:
+        f (_LineReader): line reader positioned at the first ordinate
+        num_y_values (int): number of ordinate lines in the block
+        corres_vars (List[CorrespondingVariable]): corresponding variables
+            of the block, in the order they appear in the file
+
+    Returns:
+        The corresponding variables with their y-values filled in
+    """
+    return _assign_ordinates(
+        f.read_floats(num_y_values), num_y_values, corres_vars
+    )
+
+
+def _assign_ordinates(
+    ordinates: YValues,
+    num_y_values: int,
+    corres_vars: List[CorrespondingVariable],
+) -> List[CorrespondingVariable]:
+    """De-interleaves the ordinates of a block into its corresponding variables
 
-        b["sample_rotation_angle"] = (
-            float(next(f)) if include[38] else fb["sample_rotation_angle"]
+    Args:
+        ordinates (YValues): all y-values of the block in file order
+        num_y_values (int): number of y-values the block declares
+        corres_vars (List[CorrespondingVariable]): corresponding variables
+            of the block, in the order they appear in the file
+
+    Returns:
+        The corresponding variables with their y-values filled in
+    """
+    if len(ordinates) != num_y_values:
+        raise ValueError(
+            f"Expected {num_y_values} y-values, found {len(ordinates)}"
         )
 
-        if include[39]:
-            b["num_additional_numerical_params"] = int(next(f))
-            b["additional_numerical_params"] = []
-            for _ in range(b["num_additional_numerical_params"]):
-                b["additional_numerical_params"].append(
-                    AdditionalNumericalParam(
-                        label=next(f).strip(),
-                        unit=next(f).strip(),
-                        value=float(next(f)),
-                    )
-                )
-        else:
-            b["num_additional_numerical_params"] = fb[
-                "num_additional_numerical_params"
+    num_corres_vars = len(corres_vars)
+    if num_corres_vars == 1:
+        corres_vars[0].y_values = ordinates
+    else:
+        num_sets = num_y_values // num_corres_vars
+        for i, corres_var in enumerate(corres_vars):
+            corres_var.y_values = ordinates[
+                i : num_sets * num_corres_vars : num_corres_vars
             ]
-            b["additional_numerical_params"] = fb["additional_numerical_params"]
 
-        b["num_y_values"] = int(next(f))
-        for corres_var in b["corresponding_variables"]:
-            corres_var.y_min = float(next(f))
-            corres_var.y_max = float(next(f))
+    return corres_vars
 
-        for _ in range(
-            int(b["num_y_values"] / len(b["corresponding_variables"]))
-        ):
-            for corres_var in b["corresponding_variables"]:
-                corres_var.y_values.append(float(next(f)))
 
-        blocks.append(b)
-        fb = blocks[0]
+def _block_from_entry(entry: BlockIndexEntry, ordinates: YValues) -> VamasBlock:
+    """Creates a block from its index entry and its ordinates
+
+    Args:
+        entry (BlockIndexEntry): index entry of the block
+        ordinates (YValues): all y-values of the block in file order
+
+    Returns:
+        The parsed :class:`~vamas.vamas_block.VamasBlock`
+    """
+    params = dict(entry.params)
+    corres_vars = [
+        replace(corres_var, y_values=YValues())
+        for corres_var in params["corresponding_variables"]
+    ]
+    params["corresponding_variables"] = _assign_ordinates(
+        ordinates, params["num_y_values"], corres_vars
+    )
+    return VamasBlock(**params)
+
+
+def _read_blocks_parallel(
+    path: Union[str, Path],
+    entries: List[BlockIndexEntry],
+    workers: int,
+    use_mmap: bool,
+) -> List[VamasBlock]:
+    """Decodes the ordinates of indexed blocks in worker processes
+
+    The blocks are split into contiguous chunks, a few per worker, so that
+    each worker reads a sequential region of the file.
+
+    Args:
+        path (Union[str, Path]): path of the vamas file
+        entries (List[BlockIndexEntry]): index entries of all blocks
+        workers (int): number of worker processes
+        use_mmap (bool): memory-map the file in the workers
+
+    Returns:
+        All blocks of the file, identical to the ones of the serial parser
+    """
+    spans = [(e.ordinates_offset, e.params["num_y_values"]) for e in entries]
+    chunk_size = max(1, -(-len(spans) // (workers * 4)))
+    chunks = [
+        spans[i : i + chunk_size] for i in range(0, len(spans), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _read_ordinate_spans,
+            [path] * len(chunks),
+            [use_mmap] * len(chunks),
+            chunks,
+        )
+        ordinates = [o for chunk_ordinates in results for o in chunk_ordinates]
+
+    return [
+        _block_from_entry(entry, ords)
+        for entry, ords in zip(entries, ordinates)
+    ]
+
 
-    return VamasHeader(**h), [VamasBlock(**item) for item in blocks]
+def _read_ordinate_spans(
+    path: Union[str, Path], use_mmap: bool, spans: List[Tuple[int, int]]
+) -> List[YValues]:
+    """Reads the ordinates at the given (offset, num_y_values) spans"""
+    ordinates = []
+    with _make_opener(path, use_mmap)() as f:
+        for offset, num_y_values in spans:
+            f.seek(offset)
+            ordinates.append(f.read_floats(num_y_values))
+    return ordinates
@@ -1,8 +1,122 @@
+from array import array
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Optional,
+    List,
+    SupportsIndex,
+    Tuple,
+    Union,
+    overload,
+)
+
+from ._slots import add_slots
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    _FloatArray = array[float]
+else:
+    _FloatArray = array
+
+
+class YValues(_FloatArray):
+    """Measured y-values, stored compactly as ``array('d')``
+
+    Behaves like the list the y-values used to be stored in: it compares
+    equal to a list of the same values, can be concatenated with lists and
+    has the list methods :meth:`copy`, :meth:`clear` and :meth:`sort`.
+    Slices and copies are :class:`YValues` again. Unlike a list it is not
+    serializable by :mod:`json`, use :meth:`~array.array.tolist` there.
+
+    Args:
+        values (Iterable[float]): Initial y-values, or their raw bytes in
+            native byte order.
+    """
 
+    __slots__ = ()
 
-@dataclass
+    def __new__(cls, values: Union[bytes, Iterable[float]] = ()) -> "YValues":
+        # The stubs type the arguments of array on __init__ instead of __new__
+        return array.__new__(cls, "d", values)  # type: ignore[call-arg]
+
+    def __repr__(self) -> str:
+        return f"YValues({self.tolist()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, list):
+            return self.tolist() == other
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "YValues": ...
+
+    def __getitem__(
+        self, index: Union[SupportsIndex, slice]
+    ) -> Union[float, "YValues"]:
+        if isinstance(index, slice):
+            return YValues(super().__getitem__(index))
+        return super().__getitem__(index)
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, list):
+            return self.tolist() + other
+        return YValues(super().__add__(other))
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, list):
+            return other + self.tolist()
+        return NotImplemented
+
+    def __iadd__(self, other: Any) -> "YValues":
+        self.extend(other)
+        return self
+
+    def __mul__(self, n: int) -> "YValues":
+        return YValues(super().__mul__(n))
+
+    __rmul__ = __mul__
+
+    def copy(self) -> "YValues":
+        """Returns a shallow copy, like :meth:`list.copy`"""
+        return YValues(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: Any) -> "YValues":
+        return self.copy()
+
+    def clear(self) -> None:
+        """Removes all y-values, like :meth:`list.clear`"""
+        del self[:]
+
+    def sort(
+        self,
+        *,
+        key: Optional[Callable[[float], Any]] = None,
+        reverse: bool = False,
+    ) -> None:
+        """Sorts the y-values in place, like :meth:`list.sort`"""
+        self[:] = YValues(sorted(self, key=key, reverse=reverse))
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Any:
+        if int(protocol) < 3:
+            # Protocols before 3 recreate an array from its typecode
+            return (type(self), (self.tolist(),))
+        return super().__reduce_ex__(protocol)
+
+
+@add_slots
+@dataclass(frozen=True)
 class LinescanCoordinates:
     """Information about linescan coordinates in mapping experiments
 
@@ -44,7 +158,8 @@ class LinescanCoordinates:
     last_linescan_finish_y: int
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class SputteringSource:
     """Information about the sputtering source
 
@@ -86,6 +201,7 @@ class SputteringSource:
     mode: str
 
 
+@add_slots
 @dataclass
 class CorrespondingVariable:
     """Information about the measured values
@@ -99,7 +215,10 @@ class CorrespondingVariable:
     Attributes:
         label (str): Label of the corresponding variable.
         unit (str): Unit of the corresponding variable.
-        y_values (List[float]): Measured y-values.
+        y_values (YValues): Measured y-values.
+            Stored compactly as :class:`YValues`, an ``array('d')`` which
+            is used like a list. Use :meth:`~array.array.tolist` where an
+            actual list is needed, e.g. for :func:`json.dumps`.
             The number of occurrences of ordinate values is specified by the
             value of :attr:`VamasBlock.num_y_values`. If this value is greater
             than unity then the data is sent in the form of successive
@@ -125,12 +244,24 @@ class CorrespondingVariable:
 
     label: str
     unit: str
-    y_values: List[float]
+    y_values: YValues
     y_min: Optional[float] = None
     y_max: Optional[float] = None
 
+    def to_numpy(self) -> "np.ndarray":
+        """Returns the y-values as NumPy array
 
-@dataclass
+        Requires the optional dependency NumPy. The returned array shares its
+        memory with :attr:`~CorrespondingVariable.y_values`, no values are
+        copied.
+        """
+        import numpy as np
+
+        return np.asarray(self.y_values, dtype=np.float64)
+
+
+@add_slots
+@dataclass(frozen=True)
 class AdditionalNumericalParam:
     """Information about additional numerical parameters
 
@@ -149,6 +280,7 @@ class AdditionalNumericalParam:
     value: float
 
 
+@add_slots
 @dataclass
 class VamasBlock:
     """Information about a measurement as part of an experiment
@@ -478,3 +610,82 @@ class VamasBlock:
     linescan_coordinates: Optional[LinescanCoordinates] = None
     differential_width: Optional[float] = None
     sputtering_source: Optional[SputteringSource] = None
+
+    # Cached abscissa values, see _cached_axis
+    _extra_slots = ("_x_values", "_binding_energies")
+
+    @property
+    def x_values(self) -> "array[float]":
+        """Abscissa values of the block
+
+        Computed from :attr:`~VamasBlock.x_start`, :attr:`~VamasBlock.x_step`
+        and the number of sets of y-values as ``x_start + i * x_step``. The
+        array is computed once and cached until one of these parameters
+        changes, so it must not be modified.
+        """
+        x_start, x_step, num_values = key = self._x_key()
+        return self._cached_axis(
+            "_x_values",
+            key,
+            lambda: array(
+                "d",
+                map(x_start.__add__, map(x_step.__mul__, range(num_values))),
+            ),
+        )
+
+    @property
+    def binding_energies(self) -> "array[float]":
+        """Abscissa values converted to binding energies
+
+        Kinetic energies are converted as
+        ``analysis_source_characteristic_energy - x -
+        analyzer_work_function_or_acceptance_energy``. If
+        :attr:`~VamasBlock.x_label` already denotes a binding energy,
+        :attr:`~VamasBlock.x_values` is returned unchanged. Cached like
+        :attr:`~VamasBlock.x_values`.
+        """
+        x_values = self.x_values
+        if "binding" in self.x_label.lower():
+            return x_values
+        offset = float(self.analysis_source_characteristic_energy) - float(
+            self.analyzer_work_function_or_acceptance_energy
+        )
+        return self._cached_axis(
+            "_binding_energies",
+            self._x_key() + (offset,),
+            lambda: array("d", map(offset.__sub__, x_values)),
+        )
+
+    def x_to_numpy(self, binding_energy: bool = False) -> "np.ndarray":
+        """Returns the abscissa values as NumPy array
+
+        Requires the optional dependency NumPy. The returned array shares its
+        memory with the cached :attr:`~VamasBlock.x_values` or
+        :attr:`~VamasBlock.binding_energies`, so it must not be modified.
+
+        Args:
+            binding_energy (bool): Return binding energies instead of the
+                abscissa values as stored in the file.
+        """
+        import numpy as np
+
+        x = self.binding_energies if binding_energy else self.x_values
+        return np.asarray(x, dtype=np.float64)
+
+    def _x_key(self) -> Tuple[float, float, int]:
+        num_sets = self.num_y_values // max(self.num_corresponding_variables, 1)
+        return float(self.x_start), float(self.x_step), num_sets
+
+    def _cached_axis(
+        self,
+        slot: str,
+        key: Tuple[Any, ...],
+        compute: Callable[[], "array[float]"],
+    ) -> "array[float]":
+        """Returns the cached axis in `slot` if it was computed for `key`"""
+        cached = getattr(self, slot, None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        values = compute()
+        setattr(self, slot, (key, values))
+        return values
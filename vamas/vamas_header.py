@@ -1,8 +1,57 @@
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Iterable, Iterator, List, Optional, Union, overload
 
+from ._slots import add_slots
 
-@dataclass
+NUM_BLOCK_PARAMS = 40
+
+
+class IncludeMask(int):
+    """Inclusion mask of the block parameters, stored as a bit field
+
+    Bit `n` is set if block parameter `n` (counted from zero) is included in
+    all blocks. The mask behaves like a sequence of
+    :data:`NUM_BLOCK_PARAMS` booleans, so it can be indexed and iterated
+    like a ``List[bool]``, while taking up a single integer.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_bools(cls, includes: Iterable[bool]) -> "IncludeMask":
+        """Creates a mask from a sequence of booleans"""
+        return cls(sum(1 << i for i, include in enumerate(includes) if include))
+
+    @classmethod
+    def all(cls) -> "IncludeMask":
+        """Creates a mask with all block parameters included"""
+        return cls((1 << NUM_BLOCK_PARAMS) - 1)
+
+    def __len__(self) -> int:
+        return NUM_BLOCK_PARAMS
+
+    @overload
+    def __getitem__(self, index: int) -> bool: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[bool]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[bool, List[bool]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(NUM_BLOCK_PARAMS))]
+        if not -NUM_BLOCK_PARAMS <= index < NUM_BLOCK_PARAMS:
+            raise IndexError("IncludeMask index out of range")
+        return bool(self >> (index % NUM_BLOCK_PARAMS) & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        return (bool(self >> i & 1) for i in range(NUM_BLOCK_PARAMS))
+
+    def __repr__(self) -> str:
+        return f"IncludeMask({self:#0{NUM_BLOCK_PARAMS + 2}b})"
+
+
+@add_slots
+@dataclass(frozen=True)
 class ExperimentVariable:
     """Information about a experimental variable
 
@@ -53,7 +102,8 @@ class ExperimentVariable:
     unit: str
 
 
-@dataclass
+@add_slots
+@dataclass(frozen=True)
 class FutureUpgradeExperimentEntry:
     """Information about future uprade experiment entries
 
@@ -75,6 +125,7 @@ class FutureUpgradeExperimentEntry:
     unit: str
 
 
+@add_slots
 @dataclass
 class VamasHeader:
     """Header information about a Vamas experiment
@@ -173,8 +224,9 @@ class VamasHeader:
 
         num_entries_inclusion_exclusion (int): Parameter inclusion or
             exclusion. (prefix number)
-        block_params_includes (List[bool]): Deteminated which parameters are
-            included in all blocks.
+        block_params_includes (IncludeMask): Deteminated which parameters are
+            included in all blocks. Indexing it with the number of a block
+            parameter gives a bool.
         num_manually_entered_items_in_block (int): Prefix number of manually
             entered item.
             The number of occurrences of *prefix number of manually entered
@@ -224,7 +276,7 @@ class VamasHeader:
     scan_mode: str
     num_experiment_variables: int
     num_entries_inclusion_exclusion: int
-    block_params_includes: List[bool]
+    block_params_includes: IncludeMask
     num_manually_entered_items_in_block: int
     num_future_upgrade_experiment_entries: int
     num_future_upgrade_block_entries: int
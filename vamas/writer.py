@@ -0,0 +1,263 @@
+from array import array
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TextIO,
+    Union,
+)
+
+from ._layout import BLOCK_LAYOUT
+from .vamas_block import VamasBlock
+from .vamas_header import IncludeMask, VamasHeader
+
+if TYPE_CHECKING:
+    from .vamas import Vamas
+
+FORMAT_IDENTIFIER = (
+    "VAMAS Surface Chemical Analysis Standard Data Transfer Format 1988 May 4"
+)
+
+
+def dump(vamas: "Vamas", fp: TextIO, newline: str = "\r\n") -> None:
+    """Writes a vamas file to a text stream
+
+    Block parameters that are excluded by
+    :attr:`VamasHeader.block_params_includes
+    <vamas.vamas_header.VamasHeader.block_params_includes>` are written only
+    for the first block, as the format requires. The y-values of each block
+    are formatted in bulk and written block by block, so memory usage stays
+    bounded by the largest block.
+
+    Args:
+        vamas (Vamas): vamas data to be written
+        fp (TextIO): text stream opened with ``newline=""``, so line endings
+            are not translated
+        newline (str): line terminator
+
+    Raises:
+        ValueError: if an excluded parameter of a block differs from the one
+            of the first block, since it could not be represented in the file
+    """
+    blocks = vamas.blocks
+    fp.write(newline.join(_header_lines(vamas.header, len(blocks))) + newline)
+
+    first_block = None
+    for block in blocks:
+        lines = _block_lines(vamas.header, block, first_block)
+        fp.write(newline.join(lines) + newline)
+        fp.write(_format_ordinates(block, newline))
+        if first_block is None:
+            first_block = block
+
+
+def write(
+    vamas: "Vamas", path: Union[str, Path], newline: str = "\r\n"
+) -> None:
+    """Writes a vamas file to `path`, see :func:`dump`"""
+    with open(path, "w", encoding="utf-8", newline="") as fp:
+        dump(vamas, fp, newline)
+
+
+def _header_lines(header: VamasHeader, num_blocks: int) -> List[str]:
+    lines = [
+        FORMAT_IDENTIFIER,
+        header.institution_identifier,
+        header.instrument_model_identifier,
+        header.operator_identifier,
+        header.experiment_identifier,
+    ]
+    lines.extend(_counted_text(header.comment or "", header.num_lines_comment))
+    lines.append(header.experiment_mode)
+    lines.append(header.scan_mode)
+
+    if header.experiment_mode in ["MAP", "MAPD", "NORM", "SDP"]:
+        lines.append(_format(header.num_spectral_regions))
+
+    if header.experiment_mode in ["MAP", "MAPD"]:
+        lines.append(_format(header.num_analysis_positions))
+        lines.append(_format(header.num_discrete_x_coords_in_full_map))
+        lines.append(_format(header.num_discrete_y_coords_in_full_map))
+
+    experiment_variables = header.experiment_variables or []
+    lines.append(_format(len(experiment_variables)))
+    for variable in experiment_variables:
+        lines.extend([variable.label, variable.unit])
+
+    lines.extend(_inclusion_list(header))
+    lines.append(_format(header.num_manually_entered_items_in_block))
+
+    future_entries = header.future_upgrade_experiment_entries or []
+    lines.append(_format(len(future_entries)))
+    for entry in future_entries:
+        lines.extend([entry.label, entry.unit])
+
+    lines.append(_format(header.num_future_upgrade_block_entries))
+    lines.append(_format(num_blocks))
+    return lines
+
+
+def _inclusion_list(header: VamasHeader) -> List[str]:
+    includes = IncludeMask.from_bools(header.block_params_includes)
+    if header.num_entries_inclusion_exclusion > 0:
+        entries = [i for i, include in enumerate(includes) if include]
+        num_entries = len(entries)
+    else:
+        entries = [i for i, include in enumerate(includes) if not include]
+        num_entries = -len(entries)
+    # Block parameters are numbered from one in the file
+    return [_format(num_entries)] + [_format(i + 1) for i in entries]
+
+
+def _block_lines(
+    header: VamasHeader, b: VamasBlock, fb: Optional[VamasBlock]
+) -> List[str]:
+    include = IncludeMask.all() if fb is None else header.block_params_includes
+    lines: List[str] = []
+
+    for param in BLOCK_LAYOUT:
+        if param.condition is not None and not param.condition(
+            header.experiment_mode, b.technique
+        ):
+            continue
+
+        if param.position is None or include[param.position]:
+            if param.special is None:
+                lines.extend(
+                    _format(getattr(b, name)) for name, _ in param.fields
+                )
+            else:
+                lines.extend(_SPECIAL_WRITERS[param.special](b))
+            continue
+
+        assert fb is not None
+        for name in param.names:
+            if name == "corresponding_variables":
+                differs = [
+                    (c.label, c.unit) for c in b.corresponding_variables
+                ] != [(c.label, c.unit) for c in fb.corresponding_variables]
+            else:
+                differs = getattr(b, name) != getattr(fb, name)
+            if differs:
+                raise ValueError(
+                    f"Block {b.block_identifier!r}: parameter {name!r} is "
+                    "excluded by the header but differs from the first block"
+                )
+
+    lines.append(_format(_num_y_values(b)))
+    for corres_var in b.corresponding_variables:
+        lines.append(_format(corres_var.y_min))
+        lines.append(_format(corres_var.y_max))
+
+    return lines
+
+
+def _block_comment_lines(b: VamasBlock) -> List[str]:
+    return _counted_text(b.block_comment, b.num_lines_block_comment)
+
+
+def _values_exp_var_lines(b: VamasBlock) -> List[str]:
+    return [str(v).rstrip("\r\n") for v in b.values_exp_var]
+
+
+def _linescan_coordinates_lines(b: VamasBlock) -> List[str]:
+    c = b.linescan_coordinates
+    assert c is not None
+    return [
+        _format(v)
+        for v in (
+            c.first_linescan_start_x,
+            c.first_linescan_start_y,
+            c.first_linescan_finish_x,
+            c.first_linescan_finish_y,
+            c.last_linescan_finish_x,
+            c.last_linescan_finish_y,
+        )
+    ]
+
+
+def _corresponding_variables_lines(b: VamasBlock) -> List[str]:
+    lines = [_format(len(b.corresponding_variables))]
+    for corres_var in b.corresponding_variables:
+        lines.extend([corres_var.label, corres_var.unit])
+    return lines
+
+
+def _sputtering_source_lines(b: VamasBlock) -> List[str]:
+    s = b.sputtering_source
+    assert s is not None
+    return [
+        _format(v)
+        for v in (
+            s.energy,
+            s.beam_current,
+            s.width_x,
+            s.width_y,
+            s.polar_incidence_angle,
+            s.azimuth,
+            s.mode,
+        )
+    ]
+
+
+def _additional_numerical_params_lines(b: VamasBlock) -> List[str]:
+    lines = [_format(len(b.additional_numerical_params))]
+    for p in b.additional_numerical_params:
+        lines.extend([p.label, p.unit, _format(p.value)])
+    return lines
+
+
+_SPECIAL_WRITERS: Dict[str, Callable[[VamasBlock], List[str]]] = {
+    "block_comment": _block_comment_lines,
+    "values_exp_var": _values_exp_var_lines,
+    "linescan_coordinates": _linescan_coordinates_lines,
+    "corresponding_variables": _corresponding_variables_lines,
+    "sputtering_source": _sputtering_source_lines,
+    "additional_numerical_params": _additional_numerical_params_lines,
+}
+
+
+def _num_y_values(b: VamasBlock) -> int:
+    return sum(len(c.y_values) for c in b.corresponding_variables)
+
+
+def _format_ordinates(b: VamasBlock, newline: str) -> str:
+    """Formats all y-values of a block, interleaved by corresponding variable"""
+    corres_vars = b.corresponding_variables
+    if len(corres_vars) == 1:
+        ordinates: Iterable[float] = corres_vars[0].y_values
+    else:
+        num_corres_vars = len(corres_vars)
+        interleaved = array("d", bytes(8 * _num_y_values(b)))
+        for i, corres_var in enumerate(corres_vars):
+            interleaved[i::num_corres_vars] = array("d", corres_var.y_values)
+        ordinates = interleaved
+
+    text = newline.join(map(repr, ordinates))
+    if not text:
+        return ""
+    # Integral values are written without a trailing '.0', like the counts
+    # written by instruments. repr only produces '.0' for integral values.
+    return (text + newline).replace(".0" + newline, newline)
+
+
+def _counted_text(text: str, num_lines: int) -> List[str]:
+    """Line count followed by the lines of a multi-line text"""
+    lines = text.split("\n")
+    if lines == [""] and num_lines == 0:
+        lines = []
+    return [_format(len(lines))] + lines
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        text = repr(value)
+        return text[:-2] if text.endswith(".0") else text
+    if value is None:
+        raise ValueError("Missing value for a required vamas parameter")
+    return str(value)